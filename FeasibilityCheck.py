@@ -1,15 +1,60 @@
 import argparse
+import bisect
+import codecs
+import collections
+import fnmatch
+import heapq
+import locale
 import os
 import csv
+import io
+import itertools
+import json
+import math
+import socketserver
+import stat
+import sys
+import tempfile
+import time
 from shapely.geometry import Point, box
-from shapely.ops import cascaded_union
-from datetime import datetime
+from shapely.ops import unary_union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext, redirect_stdout
+from rectangles import covers_rectangle
+from binary_solution import MAGIC, COLUMNS, is_binary_solution, load_binary_solution, read_binary_chunks
+from result_cache import ResultCache, hash_content, hash_file, make_key
+try:
+    import numpy as np
+except ImportError:  # numpy is only necessary for the columnar representation of solutions
+    np = None
 
 
 HEADER_SOLUTIONS = "Order,xPos,yPos,zPos,HTurned"
+MANIFEST_COLUMNS = ["Task", "Solution", "Diff"]
+REPORT_COLUMNS = ["entry", "task", "solution", "diff", "feasible", "error", "violation", "message", "minimal_length",
+                  "time"]
 
 
 class FeasibilityException(Exception):
+    """
+    Violation of a condition of a feasible solution. The message is the only argument; the kind of the violation (e.g.
+    'overlap' or 'lifo') and the involved pallets (tuples of order, x, y and z) are stored as attributes.
+    """
+    def __init__(self, message, violation=None, pallets=()):
+        super().__init__(message)
+        self.violation = violation
+        self.pallets = list(pallets)
+
+
+class EngineMismatchException(Exception):
+    pass
+
+
+class TimeBudgetException(Exception):
+    """
+    The validation of a solution was stopped, because its time budget is exhausted. The solution is neither feasible
+    nor infeasible.
+    """
     pass
 
 
@@ -17,7 +62,135 @@ class DataException(Exception):
     pass
 
 
+class Metrics:
+    """
+    Interface for the instrumentation of the validation: wall times of the stages and counters of the hot paths. This
+    class records nothing, so that disabled instrumentation costs (almost) nothing. If a time budget is given, it is
+    checked cooperatively in the hot loops (see check_deadline).
+    """
+    def __init__(self, time_budget=None):
+        """
+        :param time_budget: Maximal time of the validation in seconds (from the creation of the metrics) or None
+        """
+        self.time_budget = time_budget
+        self.deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+    def check_deadline(self, stage=None):
+        """
+        Raises a TimeBudgetException, if the time budget is exhausted
+        :param stage: Name of the current stage for the message or None
+        """
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise TimeBudgetException("Die Überprüfung wurde nach %s Sekunden abgebrochen%s." % (
+                self.time_budget, " (%s)" % stage if stage else ""))
+
+    def get_remaining_time(self):
+        """
+        Get the remaining time of the time budget
+        :return: Remaining time in seconds or None without time budget
+        """
+        return None if self.deadline is None else self.deadline - time.perf_counter()
+
+    def stage(self, name):
+        """
+        Measures the wall time of a stage
+        :param name: Name of the stage
+        :return: Context manager, which encloses the stage
+        """
+        return NULL_STAGE
+
+    def count(self, name, value=1):
+        """
+        Increases a counter
+        :param name: Name of the counter
+        :param value: Value to add
+        """
+        pass
+
+
+class MetricsRecorder(Metrics):
+    """
+    Records the wall times of the stages (in seconds) and the counters
+    """
+    def __init__(self, time_budget=None):
+        super().__init__(time_budget)
+        self.times = dict()
+        self.counters = dict()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # The time is also recorded, if the stage fails
+            self.times[name] = self.times.get(name, 0) + time.perf_counter() - start
+        self.finish_stage(name)
+
+    def finish_stage(self, name):
+        """
+        Is called after a stage has finished successfully
+        :param name: Name of the stage
+        """
+        pass
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self):
+        """
+        Get all recorded values
+        :return: Dictionary with the times and the counters
+        """
+        return {"times": self.times, "counters": self.counters}
+
+
+class PrintingMetrics(MetricsRecorder):
+    """
+    Records the wall times and counters and prints the time of every finished check
+    """
+    def finish_stage(self, name):
+        if name in STAGE_DESCRIPTIONS:
+            print("%s: %s Sekunden" % (STAGE_DESCRIPTIONS[name], self.times[name]))
+
+
+# Maximal number of pallet pairs, which the blocked pair kernels evaluate at once
+BLOCK_PAIRS = 1 << 20
+# The blocked pair kernels are used instead of the indexes for solutions with a number of pallets in this range
+BLOCKED_KERNEL_PALLETS = range(8, 6001)
+# Rough times for the estimation of the cost of check_stacking and check_lifo (see estimate_placement_seconds): per
+# pallet and unit of density with the indexes and per pair of pallets with the reference implementation
+INDEXED_PALLET_SECONDS = 1e-4
+REFERENCE_PAIR_SECONDS = 1e-5
+# A solution is stopped before check_stacking and check_lifo, if their estimated time exceeds the remaining time budget
+# by this factor
+ESTIMATE_MARGIN = 4
+# Minimal number of pallets, for which the stacking is checked in worker processes, if several jobs are given
+PARALLEL_STACKING_PALLETS = 20000
+# Maximal size of a prefetched solution file in bytes; larger files are streamed from disk during their validation
+PREFETCH_SIZE = 16 * 1024 * 1024
+# Number of pallets per window of the out-of-core mode and maximal number of rows per sorted run of its external sort
+OUT_OF_CORE_WINDOW = 4096
+OUT_OF_CORE_RUN = 1 << 20
+# Engines for the check of stacking and LIFO: the original Shapely loops, the indexes, the blocked pair kernels, the
+# automatic choice of the latter two and the automatic choice with a cross-check against the reference
+ENGINES = ["reference", "indexed", "vectorized", "auto", "crosscheck"]
+NULL_STAGE = nullcontext()
+NULL_METRICS = Metrics()
+# Stages with their own time column in csv reports
+REPORT_STAGES = ["import_solution", "check_count", "check_dimensions", "check_container_dimensions", "check_stacking",
+                 "check_lifo", "crosscheck"]
+STAGE_DESCRIPTIONS = {"check_count": "Anzahl der Palletten korrekt",
+                      "check_dimensions": "Palettenmaße und Drehung korrekt",
+                      "check_container_dimensions": "Container Maße eingehalten",
+                      "check_stacking": "Alle Palette korrekt gestapelt",
+                      "check_lifo": "Alle Paletten gemäß Lifo erreichbar",
+                      "crosscheck": "Gegenprüfung mit der Referenz übereinstimmend"}
+
+
 class AbstractPallet:
+    __slots__ = ("length", "width", "height")
+
     def __init__(self, length, width, height):
         self.length = length
         self.width = width
@@ -25,6 +198,8 @@ class AbstractPallet:
 
 
 class PalletType(AbstractPallet):
+    __slots__ = ("description", "quantity", "turning_allowed", "stacking_allowed", "group", "order")
+
     def __init__(self, order, description, quantity, length, width, height, turning_allowed, stacking_allowed,
                  group):
         self.description = description
@@ -37,14 +212,71 @@ class PalletType(AbstractPallet):
 
 
 class SolutionPallet(AbstractPallet):
+    # The coordinates are stored as plain integers; the Shapely geometry is only created on demand
+    __slots__ = ("type", "x", "y", "z", "_origin_point", "_base_area", "_front_face")
+
     def __init__(self, pallet_type, x_pos, y_pos, z_pos, h_turned):
-        length = pallet_type.length if not h_turned else pallet_type.width
-        width = pallet_type.length if h_turned else pallet_type.width
-        self.origin_point = Point(x_pos, y_pos, z_pos)
-        self.base_area = box(x_pos, y_pos, x_pos + length, y_pos + width)
-        self.front_face = box(y_pos, z_pos, y_pos + width, z_pos + pallet_type.height)
         self.type = pallet_type
-        super(SolutionPallet, self).__init__(length, width, pallet_type.height)
+        self.relocate(x_pos, y_pos, z_pos, h_turned)
+
+    def relocate(self, x_pos, y_pos, z_pos, h_turned):
+        """
+        Places the pallet at a new position
+        :param x_pos: x coordinate of the origin
+        :param y_pos: y coordinate of the origin
+        :param z_pos: z coordinate of the origin
+        :param h_turned: True (respectively 1), if the pallet is turned horizontally
+        """
+        length = self.type.length if not h_turned else self.type.width
+        width = self.type.length if h_turned else self.type.width
+        self.x = x_pos
+        self.y = y_pos
+        self.z = z_pos
+        self._origin_point = None
+        self._base_area = None
+        self._front_face = None
+        super(SolutionPallet, self).__init__(length, width, self.type.height)
+
+    @property
+    def origin_point(self):
+        """
+        Origin of the pallet as Shapely point
+        """
+        if self._origin_point is None:
+            self._origin_point = Point(self.x, self.y, self.z)
+        return self._origin_point
+
+    @property
+    def base_area(self):
+        """
+        Base area of the pallet as Shapely box
+        """
+        if self._base_area is None:
+            self._base_area = box(*self.get_base_area_bounds())
+        return self._base_area
+
+    @property
+    def front_face(self):
+        """
+        Front face (y and z direction) of the pallet as Shapely box
+        """
+        if self._front_face is None:
+            self._front_face = box(self.y, self.z, self.y + self.width, self.z + self.height)
+        return self._front_face
+
+    def get_base_area_bounds(self):
+        """
+        Get the bounds of the base area without creating the Shapely geometry
+        :return: Tuple (minx, miny, maxx, maxy)
+        """
+        return self.x, self.y, self.x + self.length, self.y + self.width
+
+    def as_tuple(self):
+        """
+        Get the order and the origin of the pallet, e.g. to report the pallets of a violation
+        :return: Tuple (order, x, y, z)
+        """
+        return self.type.order, self.x, self.y, self.z
 
     def validate_rotation(self):
         """
@@ -58,7 +290,7 @@ class SolutionPallet(AbstractPallet):
             else:
                 raise FeasibilityException(
                     "Die Palette im Startpunkt %s von Order %s wurde unzulässigerweise gedreht." % (
-                      self.origin_point.coords[:], self.type.order))
+                      self.origin_point.coords[:], self.type.order), "rotation", [self.as_tuple()])
         return False
 
     def is_stackable(self):
@@ -80,14 +312,14 @@ class SolutionPallet(AbstractPallet):
         Get the maximum x value from the pallet (here: base area)
         :return: Maximal coordinate in x direction
         """
-        return self.base_area.bounds[2]
+        return float(self.x + self.length)
 
     def get_maxz(self):
         """
         Get the maximum z value from the pallet
         :return: Maximal coordinate in z direction
         """
-        return self.origin_point.z + self.height
+        return float(self.z + self.height)
 
     def validate_width(self):
         """
@@ -102,7 +334,7 @@ class SolutionPallet(AbstractPallet):
         :param width_value: integer value for a specific width
         :return: True, if the pallet is wider than the specific value
         """
-        return self.origin_point.y + self.width > width_value
+        return self.y + self.width > width_value
 
     def validate_height(self, ):
         """
@@ -118,7 +350,7 @@ class SolutionPallet(AbstractPallet):
         :return: True, if the pallet is higher than the specific value
 
         """
-        return self.origin_point.z + self.height > height_value
+        return self.z + self.height > height_value
 
     def validate_dimension(self):
         """
@@ -156,8 +388,7 @@ class SolutionPallet(AbstractPallet):
         :param other_pallet: Another solution pallet
         :return: True, if the front face of the other pallet touches the self front face
         """
-        return self != other_pallet and self.origin_point.y <= other_pallet.origin_point.y < \
-            self.origin_point.y + self.width
+        return self != other_pallet and self.y <= other_pallet.y < self.y + self.width
 
     def overlaps_height(self, other_pallet):
         """
@@ -165,7 +396,7 @@ class SolutionPallet(AbstractPallet):
         :param other_pallet: Another solution pallet
         :return: True, if the other pallet overlaps
         """
-        diff = other_pallet.origin_point.z - self.origin_point.z
+        diff = other_pallet.z - self.z
         return 0 <= diff < self.height
 
     def is_other_pallet_stacked(self, other_pallet):
@@ -175,7 +406,7 @@ class SolutionPallet(AbstractPallet):
         :return: True, if the other pallet is stacked on top of the self pallet
         """
         return self != other_pallet and self.overlaps_base_area(other_pallet) and \
-            self.get_maxz() == other_pallet.origin_point.z
+            self.get_maxz() == other_pallet.z
 
     def is_other_pallet_in_front(self, other_pallet, allowed_diff):
         """
@@ -188,176 +419,2102 @@ class SolutionPallet(AbstractPallet):
             (self.touches_front_face(other_pallet) and self.get_maxx() + allowed_diff < other_pallet.get_maxx())
 
 
+class BaseAreaIndex:
+    """
+    Uniform grid over the base areas of solution pallets. It is used as broad phase, so that only pallets in the
+    same grid cells have to be tested with the exact (Shapely) predicates.
+    """
+    def __init__(self, solution_pallets):
+        self.pallets = solution_pallets
+        self.cells = dict()
+        if solution_pallets:
+            # The cell size is the average extent of a base area, so that a pallet covers only a few cells
+            self.cell_length = max(1, math.ceil(sum(i.length for i in solution_pallets) / len(solution_pallets)))
+            self.cell_width = max(1, math.ceil(sum(i.width for i in solution_pallets) / len(solution_pallets)))
+        else:
+            self.cell_length = self.cell_width = 1
+        for position, pallet in enumerate(solution_pallets):
+            for cell in self.get_cells(pallet.get_base_area_bounds()):
+                self.cells.setdefault(cell, []).append(position)
+
+    def get_cells(self, bounds):
+        """
+        Get all grid cells, which are covered by the (closed) bounds
+        :param bounds: Tuple (minx, miny, maxx, maxy)
+        :return: Generator of the covered cells
+        """
+        min_x, min_y, max_x, max_y = bounds
+        for cell_x in range(math.floor(min_x / self.cell_length), math.floor(max_x / self.cell_length) + 1):
+            for cell_y in range(math.floor(min_y / self.cell_width), math.floor(max_y / self.cell_width) + 1):
+                yield cell_x, cell_y
+
+    def get_positions(self, pallet):
+        """
+        Get the positions of all pallets, whose base area might overlap the base area of the given pallet
+        :param pallet: A solution pallet
+        :return: Set of positions of the candidate pallets in the solution
+        """
+        positions = set()
+        for cell in self.get_cells(pallet.get_base_area_bounds()):
+            positions.update(self.cells.get(cell, ()))
+        return positions
+
+    def get_candidates(self, pallet):
+        """
+        Get all pallets, whose base area might overlap the base area of the given pallet
+        :param pallet: A solution pallet
+        :return: List of candidate pallets in the order of the solution
+        """
+        return [self.pallets[i] for i in sorted(self.get_positions(pallet))]
+
+
+class FrontFaceIndex:
+    """
+    Index over the front faces of the remaining pallets for the LIFO check. The front faces are stored in buckets along
+    the y axis, each sorted by the maximal x coordinate (DESC), so that only pallets further in front are visited.
+    Unloaded pallets are removed from the index.
+    """
+    def __init__(self, solution_pallets):
+        self.pallets = solution_pallets
+        self.remaining = [True] * len(solution_pallets)
+        self.maxx = [i.get_maxx() for i in solution_pallets]
+        self.buckets = dict()
+        # Number of unloaded pallets per bucket; a bucket is compacted, if the majority of its pallets is unloaded
+        self.removed = dict()
+        if solution_pallets:
+            self.cell_width = max(1, math.ceil(sum(i.width for i in solution_pallets) / len(solution_pallets)))
+        else:
+            self.cell_width = 1
+        for position in sorted(range(len(solution_pallets)), key=lambda item: -self.maxx[item]):
+            for bucket in self.get_buckets(solution_pallets[position]):
+                self.buckets.setdefault(bucket, []).append(position)
+                self.removed[bucket] = 0
+
+    def get_buckets(self, pallet):
+        """
+        Get all buckets, which are covered by the (closed) y interval of the front face
+        :param pallet: A solution pallet
+        :return: Range of the covered buckets
+        """
+        return range(math.floor(pallet.y / self.cell_width),
+                     math.floor((pallet.y + pallet.width) / self.cell_width) + 1)
+
+    def remove(self, position):
+        """
+        Removes an unloaded pallet from the index
+        :param position: Position of the pallet in the solution
+        """
+        self.remaining[position] = False
+        for bucket in self.get_buckets(self.pallets[position]):
+            self.removed[bucket] += 1
+            if 2 * self.removed[bucket] > len(self.buckets[bucket]):
+                self.buckets[bucket] = [i for i in self.buckets[bucket] if self.remaining[i]]
+                self.removed[bucket] = 0
+
+    def get_candidates(self, pallet, allowed_diff):
+        """
+        Get all remaining pallets, which might be in front of the given pallet. These are the pallets with a common
+        y interval and a larger maximal x coordinate (respectively larger than maximal x + allowed_diff).
+        :param pallet: A solution pallet
+        :param allowed_diff: Allowed difference of x between two touching pallets
+        :return: Set of positions of the candidate pallets
+        """
+        min_maxx = pallet.get_maxx() + min(0, allowed_diff)
+        candidates = set()
+        for bucket in self.get_buckets(pallet):
+            positions = self.buckets.get(bucket, ())
+            # Unloaded pallets at the beginning of a bucket (further in front) are dropped at once
+            start = 0
+            while start < len(positions) and not self.remaining[positions[start]]:
+                start += 1
+            if start:
+                del positions[:start]
+                self.removed[bucket] -= start
+            for position in positions:
+                if self.maxx[position] <= min_maxx:
+                    break
+                if self.remaining[position]:
+                    candidates.add(position)
+        return candidates
+
+
+class BlockedPairKernel:
+    """
+    NumPy kernels of the pairwise predicates of solution pallets. The predicates are evaluated for a block of pallets
+    against all pallets at once, so that the memory is bounded by the number of pairs per block. As all pallets are
+    axis-aligned boxes with a positive size, the Shapely predicates of the base areas and front faces reduce to
+    comparisons of open intervals.
+    """
+    def __init__(self, solution_pallets, block_pairs=None):
+        self.pallets = solution_pallets
+        self.x = np.array([i.x for i in solution_pallets], dtype=np.int64)
+        self.y = np.array([i.y for i in solution_pallets], dtype=np.int64)
+        self.z = np.array([i.z for i in solution_pallets], dtype=np.int64)
+        self.maxx = self.x + np.array([i.length for i in solution_pallets], dtype=np.int64)
+        self.maxy = self.y + np.array([i.width for i in solution_pallets], dtype=np.int64)
+        self.height = np.array([i.height for i in solution_pallets], dtype=np.int64)
+        self.maxz = self.z + self.height
+        self.stackable = np.array([i.is_stackable() for i in solution_pallets], dtype=bool)
+        self.positions = np.arange(len(solution_pallets))
+        self.block_size = max(1, (block_pairs or BLOCK_PAIRS) // max(1, len(solution_pallets)))
+
+    def get_blocks(self, positions):
+        """
+        Splits the positions into blocks
+        :param positions: Array of positions of pallets in the solution
+        :return: Generator of arrays of positions
+        """
+        for start in range(0, len(positions), self.block_size):
+            yield positions[start:start + self.block_size]
+
+    def overlaps_base_area(self, rows):
+        """
+        Same as SolutionPallet.overlaps_base_area for a block of pallets and all pallets
+        :param rows: Array of positions of the block
+        :return: Boolean matrix (block x all pallets)
+        """
+        return (self.x[rows, None] < self.maxx) & (self.x < self.maxx[rows, None]) & \
+            (self.y[rows, None] < self.maxy) & (self.y < self.maxy[rows, None]) & (rows[:, None] != self.positions)
+
+    def overlaps_front_face(self, rows):
+        """
+        Same as SolutionPallet.overlaps_front_face for a block of pallets and all pallets
+        :param rows: Array of positions of the block
+        :return: Boolean matrix (block x all pallets)
+        """
+        return (self.y[rows, None] < self.maxy) & (self.y < self.maxy[rows, None]) & \
+            (self.z[rows, None] < self.maxz) & (self.z < self.maxz[rows, None]) & (rows[:, None] != self.positions)
+
+    def overlaps_height(self, rows):
+        """
+        Same as SolutionPallet.overlaps_height for a block of pallets and all pallets
+        :param rows: Array of positions of the block
+        :return: Boolean matrix (block x all pallets)
+        """
+        diff = self.z - self.z[rows, None]
+        return (0 <= diff) & (diff < self.height[rows, None])
+
+    def is_other_pallet_stacked(self, rows):
+        """
+        Same as SolutionPallet.is_other_pallet_stacked for a block of pallets and all pallets
+        :param rows: Array of positions of the block
+        :return: Boolean matrix (block x all pallets)
+        """
+        return self.overlaps_base_area(rows) & (self.maxz[rows, None] == self.z)
+
+    def is_other_pallet_in_front(self, rows, allowed_diff):
+        """
+        Same as SolutionPallet.is_other_pallet_in_front for a block of pallets and all pallets
+        :param rows: Array of positions of the block
+        :param allowed_diff: Allowed difference of x between two touching pallets
+        :return: Boolean matrix (block x all pallets)
+        """
+        touches = (self.y[rows, None] <= self.y) & (self.y < self.maxy[rows, None]) & (rows[:, None] != self.positions)
+        return (self.overlaps_front_face(rows) & (self.maxx[rows, None] < self.maxx)) | \
+            (touches & (self.maxx[rows, None] + allowed_diff < self.maxx))
+
+    def get_base_area_bounds(self, position):
+        """
+        Same as SolutionPallet.get_base_area_bounds
+        :param position: Position of the pallet in the solution
+        :return: Tuple (minx, miny, maxx, maxy)
+        """
+        return int(self.x[position]), int(self.y[position]), int(self.maxx[position]), int(self.maxy[position])
+
+
+class IncrementalValidator:
+    """
+    Stateful validator for the use inside of packing heuristics. Pallets can be added, removed and moved. The
+    violations (count, dimensions, overlaps, stacking and LIFO) are kept up to date by checking only the pallets, which
+    are affected by a change. The front face buckets are split by group and sorted by the maximal x coordinate (like
+    FrontFaceIndex), so that only pallets in front, which are unloaded later, and pallets behind, which are unloaded
+    earlier, are visited.
+    """
+    def __init__(self, tasks, width_value, height_value, par_stacking=0):
+        self.tasks = tasks
+        self.width_value = width_value
+        self.height_value = height_value
+        self.par_stacking = par_stacking
+        # The cell sizes of the indices are the average dimensions of the pallet types
+        self.cell_length = max(1, math.ceil(sum(i.length for i in tasks.values()) / max(1, len(tasks))))
+        self.cell_width = max(1, math.ceil(sum(i.width for i in tasks.values()) / max(1, len(tasks))))
+        self.cells = dict()
+        self.buckets = dict()
+        # Sequence numbers of all added pallets; they replace the position of a pallet in a solution
+        self.sequence = dict()
+        self.next_sequence = 0
+        self.counts = {key: 0 for key in tasks}
+        self.wrong_counts = {key for key in tasks if tasks[key].quantity != 0}
+        self.invalid = set()
+        self.unsupported = set()
+        # Symmetric overlaps and directed LIFO relations (pallet -> other pallets blocking it and vice versa)
+        self.overlapping = dict()
+        self.blocked_by = dict()
+        self.blocking = dict()
+        self.overlap_count = 0
+        self.blocking_count = 0
+
+    def __len__(self):
+        return len(self.sequence)
+
+    def __contains__(self, pallet):
+        return pallet in self.sequence
+
+    def add(self, pallet):
+        """
+        Adds a pallet to the solution
+        :param pallet: A solution pallet, which is not part of the solution yet
+        """
+        if pallet in self.sequence:
+            raise ValueError("Die Palette ist bereits Teil der Lösung.")
+        self.sequence[pallet] = self.next_sequence
+        self.next_sequence += 1
+        self.insert(pallet)
+
+    def remove(self, pallet):
+        """
+        Removes a pallet from the solution
+        :param pallet: A solution pallet of the solution
+        """
+        self.check_member(pallet)
+        self.delete(pallet)
+        del self.sequence[pallet]
+
+    def move(self, pallet, x_pos, y_pos, z_pos, h_turned):
+        """
+        Moves a pallet of the solution to a new position. The pallet keeps its position in the unloading order of
+        pallets with the same sorting key.
+        :param pallet: A solution pallet of the solution
+        :param x_pos: New x coordinate of the origin
+        :param y_pos: New y coordinate of the origin
+        :param z_pos: New z coordinate of the origin
+        :param h_turned: True (respectively 1), if the pallet is turned horizontally
+        """
+        self.check_member(pallet)
+        self.delete(pallet)
+        pallet.relocate(x_pos, y_pos, z_pos, h_turned)
+        self.insert(pallet)
+
+    def check_member(self, pallet):
+        """
+        Checks, if a pallet is part of the solution, before the state is changed
+        :param pallet: A solution pallet
+        """
+        if pallet not in self.sequence:
+            raise ValueError("Die Palette ist nicht Teil der Lösung.")
+
+    def is_feasible(self):
+        """
+        Checks, if the current solution is feasible
+        :return: True, if the current solution has no violation
+        """
+        return self.count_violations() == 0
+
+    def count_violations(self):
+        """
+        Counts the violations of the current solution
+        :return: Number of wrong pallet counts, invalid pallets, overlapping pairs, wrongly stacked pallets and blocking
+        pairs
+        """
+        return len(self.wrong_counts) + len(self.invalid) + self.overlap_count + len(self.unsupported) + \
+            self.blocking_count
+
+    def insert(self, pallet):
+        """
+        Inserts a pallet into the indices and updates all violations of the pallet and its neighbours
+        :param pallet: A solution pallet with sequence number
+        """
+        self.update_count(pallet.type.order, 1)
+        if not self.is_valid(pallet):
+            self.invalid.add(pallet)
+        for cell in self.get_cells(pallet):
+            self.cells.setdefault(cell, set()).add(pallet)
+        for bucket in self.get_buckets(pallet):
+            bisect.insort(self.buckets.setdefault(bucket, dict()).setdefault(pallet.type.group, []),
+                          (pallet.get_maxx(), self.sequence[pallet], pallet))
+        self.overlapping[pallet] = set()
+        self.blocked_by[pallet] = set()
+        self.blocking[pallet] = set()
+        neighbours = self.get_neighbours(pallet)
+        for other_pallet in neighbours:
+            if pallet.overlaps_height(other_pallet) or other_pallet.overlaps_height(pallet):
+                self.overlapping[pallet].add(other_pallet)
+                self.overlapping[other_pallet].add(pallet)
+                self.overlap_count += 1
+        self.update_support(pallet, neighbours)
+        for other_pallet in neighbours:
+            if other_pallet.z == pallet.get_maxz():
+                self.update_support(other_pallet)
+        for other_pallet in self.get_lifo_candidates(pallet).union(neighbours):
+            if self.is_blocked(pallet, other_pallet):
+                self.add_blocking(pallet, other_pallet)
+            if self.is_blocked(other_pallet, pallet):
+                self.add_blocking(other_pallet, pallet)
+
+    def delete(self, pallet):
+        """
+        Deletes a pallet from the indices and updates all violations of its neighbours
+        :param pallet: A solution pallet of the solution
+        """
+        self.update_count(pallet.type.order, -1)
+        self.invalid.discard(pallet)
+        self.unsupported.discard(pallet)
+        neighbours = self.get_neighbours(pallet)
+        for cell in self.get_cells(pallet):
+            self.cells[cell].discard(pallet)
+        for bucket in self.get_buckets(pallet):
+            entries = self.buckets[bucket][pallet.type.group]
+            del entries[bisect.bisect_left(entries, (pallet.get_maxx(), self.sequence[pallet]))]
+        for other_pallet in self.overlapping.pop(pallet):
+            self.overlapping[other_pallet].discard(pallet)
+            self.overlap_count -= 1
+        for other_pallet in self.blocked_by.pop(pallet):
+            self.blocking[other_pallet].discard(pallet)
+            self.blocking_count -= 1
+        for other_pallet in self.blocking.pop(pallet):
+            self.blocked_by[other_pallet].discard(pallet)
+            self.blocking_count -= 1
+        for other_pallet in neighbours:
+            if other_pallet.z == pallet.get_maxz():
+                self.update_support(other_pallet)
+
+    def update_count(self, order, value):
+        """
+        Updates the number of pallets of an order
+        :param order: Order of the pallet type
+        :param value: Change of the number of pallets
+        """
+        self.counts[order] = self.counts.get(order, 0) + value
+        if self.counts[order] == (self.tasks[order].quantity if order in self.tasks else 0):
+            self.wrong_counts.discard(order)
+        else:
+            self.wrong_counts.add(order)
+
+    def is_valid(self, pallet):
+        """
+        Checks the rotation and dimensions of a pallet and if it fits into the container
+        :param pallet: A solution pallet
+        :return: True, if the pallet is valid
+        """
+        try:
+            return pallet.validate_dimension() and not pallet.extends_width(self.width_value) and \
+                not pallet.extends_height(self.height_value)
+        except FeasibilityException:
+            return False
+
+    def update_support(self, pallet, neighbours=None):
+        """
+        Checks, if a pallet is correctly stacked (see check_stacking)
+        :param pallet: A solution pallet of the solution
+        :param neighbours: All pallets of the solution, whose base areas overlap the base area of the pallet
+        """
+        if pallet.z > 0:
+            if neighbours is None:
+                neighbours = self.get_neighbours(pallet)
+            area_for_stack = [i.get_base_area_bounds() for i in neighbours if
+                              pallet.z == i.get_maxz() and i.is_stackable()]
+            if not pallet.is_stackable() or not covers_rectangle(area_for_stack, pallet.get_base_area_bounds()):
+                self.unsupported.add(pallet)
+                return
+        self.unsupported.discard(pallet)
+
+    def add_blocking(self, pallet, other_pallet):
+        """
+        Adds a LIFO relation
+        :param pallet: A solution pallet of the solution
+        :param other_pallet: Another solution pallet of the solution, which blocks the pallet
+        """
+        self.blocked_by[pallet].add(other_pallet)
+        self.blocking[other_pallet].add(pallet)
+        self.blocking_count += 1
+
+    def is_blocked(self, pallet, other_pallet):
+        """
+        Checks, if the other pallet blocks the pallet according to LIFO (see check_lifo). This is the case, if the
+        other pallet is unloaded later and it is on top of or in front of the pallet.
+        :param pallet: A solution pallet of the solution
+        :param other_pallet: Another solution pallet of the solution
+        :return: True, if the other pallet blocks the pallet
+        """
+        key = (pallet.type.group, -pallet.get_maxx(), -pallet.get_maxz(), self.sequence[pallet])
+        other_key = (other_pallet.type.group, -other_pallet.get_maxx(), -other_pallet.get_maxz(),
+                     self.sequence[other_pallet])
+        return key < other_key and (pallet.is_other_pallet_stacked(other_pallet) or
+                                    pallet.is_other_pallet_in_front(other_pallet, self.par_stacking))
+
+    def get_cells(self, pallet):
+        """
+        Get all cells of the base area index, which are covered by the (closed) base area of the pallet
+        :param pallet: A solution pallet
+        :return: Generator of the covered cells
+        """
+        min_x, min_y, max_x, max_y = pallet.get_base_area_bounds()
+        for cell_x in range(math.floor(min_x / self.cell_length), math.floor(max_x / self.cell_length) + 1):
+            for cell_y in range(math.floor(min_y / self.cell_width), math.floor(max_y / self.cell_width) + 1):
+                yield cell_x, cell_y
+
+    def get_buckets(self, pallet):
+        """
+        Get all buckets of the front face index, which are covered by the (closed) y interval of the pallet
+        :param pallet: A solution pallet
+        :return: Range of the covered buckets
+        """
+        return range(math.floor(pallet.y / self.cell_width),
+                     math.floor((pallet.y + pallet.width) / self.cell_width) + 1)
+
+    def get_neighbours(self, pallet):
+        """
+        Get all other pallets of the solution, whose base areas overlap the base area of the pallet
+        :param pallet: A solution pallet
+        :return: Set of the overlapping pallets
+        """
+        candidates = set()
+        for cell in self.get_cells(pallet):
+            candidates.update(self.cells.get(cell, ()))
+        return {i for i in candidates if pallet.overlaps_base_area(i)}
+
+    def get_lifo_candidates(self, pallet):
+        """
+        Get all other pallets of the solution, which have a common y interval with the pallet and which might block the
+        pallet from the front or might be blocked by it (see is_blocked). A pallet in front must be unloaded later, so
+        that it belongs to a later group or to the same group with a maximal x coordinate in the range of the allowed
+        difference; a pallet behind must be unloaded earlier accordingly.
+        :param pallet: A solution pallet
+        :return: Set of the candidate pallets
+        """
+        # Pallets in front have a larger maximal x coordinate (respectively larger than maximal x + par_stacking)
+        min_maxx = pallet.get_maxx() + min(0, self.par_stacking)
+        max_maxx = pallet.get_maxx() - min(0, self.par_stacking)
+        candidates = set()
+        for bucket in self.get_buckets(pallet):
+            for group, entries in self.buckets.get(bucket, dict()).items():
+                start = bisect.bisect_right(entries, (min_maxx, math.inf)) if group >= pallet.type.group else 0
+                stop = bisect.bisect_left(entries, (max_maxx,)) if group <= pallet.type.group else len(entries)
+                candidates.update(i[2] for i in entries[start:stop])
+        candidates.discard(pallet)
+        return candidates
+
+
+class TaskTable:
+    """
+    Columnar representation of the tasks (pallet types). The attributes of all pallet types are stored in arrays, which
+    are indexed by the position of the order in the tasks.
+    """
+    def __init__(self, tasks):
+        if np is None:
+            raise ImportError("Für die spaltenweise Darstellung wird numpy benötigt.")
+        self.tasks = tasks
+        self.orders = np.array([task.order for task in tasks.values()], dtype=np.int64)
+        self.quantity = np.array([task.quantity for task in tasks.values()], dtype=np.int64)
+        self.length = np.array([task.length for task in tasks.values()], dtype=np.int64)
+        self.width = np.array([task.width for task in tasks.values()], dtype=np.int64)
+        self.height = np.array([task.height for task in tasks.values()], dtype=np.int64)
+        self.turning_allowed = np.array([task.turning_allowed for task in tasks.values()], dtype=bool)
+        self.stacking_allowed = np.array([task.stacking_allowed for task in tasks.values()], dtype=bool)
+        self.group = np.array([task.group for task in tasks.values()], dtype=np.int64)
+        self.sorter = np.argsort(self.orders, kind="stable")
+
+    def __len__(self):
+        return len(self.orders)
+
+    def get_type_index(self, orders):
+        """
+        Looks up the position of the pallet types for an array of orders
+        :param orders: Array of orders
+        :return: Array of positions of the pallet types in the tasks
+        """
+        if len(self.orders) == 0:
+            if len(orders):
+                raise KeyError(int(orders[0]))
+            return np.zeros(0, dtype=np.int64)
+        found = np.searchsorted(self.orders, orders, sorter=self.sorter)
+        type_index = self.sorter[np.minimum(found, len(self.orders) - 1)]
+        unknown = np.flatnonzero(self.orders[type_index] != orders)
+        if len(unknown):
+            raise KeyError(int(orders[unknown[0]]))
+        return type_index
+
+
+class SolutionTable:
+    """
+    Columnar representation of a solution. All pallets are stored as integer arrays (order, x, y, z, turned, length,
+    width and height), the pallet types are looked up in a task table.
+    """
+    def __init__(self, task_table, order, x_pos, y_pos, z_pos, h_turned):
+        self.task_table = task_table
+        self.order = np.asarray(order, dtype=np.int64)
+        self.x = np.asarray(x_pos, dtype=np.int64)
+        self.y = np.asarray(y_pos, dtype=np.int64)
+        self.z = np.asarray(z_pos, dtype=np.int64)
+        self.turned = np.asarray(h_turned, dtype=np.int64) != 0
+        self.type_index = task_table.get_type_index(self.order)
+        type_length = task_table.length[self.type_index]
+        type_width = task_table.width[self.type_index]
+        self.length = np.where(self.turned, type_width, type_length)
+        self.width = np.where(self.turned, type_length, type_width)
+        self.height = task_table.height[self.type_index]
+        self._pallets = None
+
+    def __len__(self):
+        return len(self.order)
+
+    def get_origin_coords(self, position):
+        """
+        Get the coordinates of the origin of a pallet in the same format as SolutionPallet.origin_point.coords[:]
+        :param position: Position of the pallet in the solution
+        :return: List with the coordinate tuple
+        """
+        return [(float(self.x[position]), float(self.y[position]), float(self.z[position]))]
+
+    def as_tuple(self, position):
+        """
+        Same as SolutionPallet.as_tuple for a pallet of the table
+        :param position: Position of the pallet in the solution
+        :return: Tuple (order, x, y, z)
+        """
+        return int(self.order[position]), int(self.x[position]), int(self.y[position]), int(self.z[position])
+
+    def get_pallets(self):
+        """
+        Creates the solution pallets (with geometry) of this solution. The list is only created once.
+        :return: List of solution pallets
+        """
+        if self._pallets is None:
+            tasks = self.task_table.tasks
+            self._pallets = [SolutionPallet(tasks[order], x_pos, y_pos, z_pos, h_turned) for
+                             order, x_pos, y_pos, z_pos, h_turned in
+                             zip(self.order.tolist(), self.x.tolist(), self.y.tolist(), self.z.tolist(),
+                                 self.turned.tolist())]
+        return self._pallets
+
+
 def main():
     parser = argparse.ArgumentParser(description='Überprüfung der Zulässigkeit einer Lösung.')
-    parser.add_argument('--task', '-t', type=str, required=True,
-                        help='Aufgabedaten als csv-Datei')
-    parser.add_argument('--solution', '-s', type=str, required=True,
+    parser.add_argument('--task', '-t', type=str, required=False,
+                        help='Aufgabedaten als csv-Datei; im Servermodus die Standardaufgabe der Anfragen')
+    parser.add_argument('--solution', '-s', type=str, required=False,
                         help='Lösungsdaten als csv-Datei')
     parser.add_argument('--diff', '-d', type=float, required=False, default=0,
                         help='Erlaubter Versatz bei gestapelten Paletten, sodass die obere Palette '
                              'noch erreichbar ist.')
+    parser.add_argument('--jobs', '-j', type=int, required=False, default=1,
+                        help='Anzahl der Prozesse, mit denen die Lösungen eines Verzeichnisses parallel überprüft '
+                             'werden.')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ergebnisse und Aufgabedaten nicht aus dem Cache lesen und nicht im Cache speichern.')
+    parser.add_argument('--cache-dir', type=str, required=False,
+                        default=os.path.join(os.path.expanduser('~'), '.cache', 'FeasibilityCheck'),
+                        help='Verzeichnis des Caches.')
+    parser.add_argument('--cache-size', type=int, required=False, default=100,
+                        help='Maximale Größe des Caches in MB.')
+    parser.add_argument('--metrics', type=str, choices=['text', 'json', 'none'], default='text',
+                        help='Ausgabe der Laufzeiten und Zähler: als Text nach jeder Prüfung, als JSON-Zeile je '
+                             'Lösung oder keine Ausgabe.')
+    parser.add_argument('--serve', action='store_true',
+                        help='Als Server laufen: Anfragen als JSON-Zeilen von der Standardeingabe lesen und die '
+                             'Ergebnisse als JSON-Zeilen ausgeben.')
+    parser.add_argument('--socket', type=str, required=False,
+                        help='Als Server laufen und die Anfragen über diesen Unix-Socket annehmen.')
+    parser.add_argument('--watch', action='store_true',
+                        help='Das Lösungsverzeichnis beobachten und neue oder geänderte Lösungen überprüfen.')
+    parser.add_argument('--interval', type=float, required=False, default=1.0,
+                        help='Zeit zwischen zwei Durchläufen im Beobachtungsmodus in Sekunden.')
+    parser.add_argument('--engine', type=str, choices=ENGINES, default='auto',
+                        help='Verfahren für die Prüfung von Stapelung und LIFO: reference (ursprüngliche Prüfung '
+                             'aller Paare mit Shapely), indexed (Indizes), vectorized (blockweise mit numpy), auto '
+                             '(Auswahl nach Anzahl der Paletten) oder crosscheck (auto und reference; Abweichungen '
+                             'werden als unzulässig gemeldet).')
+    parser.add_argument('--include', type=str, action='append', required=False,
+                        help='Nur Dateien des Lösungsverzeichnisses überprüfen, deren Name oder relativer Pfad dem '
+                             'Muster entspricht (z.B. "*.csv"); kann mehrfach angegeben werden.')
+    parser.add_argument('--exclude', type=str, action='append', required=False,
+                        help='Dateien des Lösungsverzeichnisses überspringen, deren Name oder relativer Pfad dem '
+                             'Muster entspricht; kann mehrfach angegeben werden.')
+    parser.add_argument('--prefetch', type=int, required=False, default=4,
+                        help='Anzahl der Dateien eines Verzeichnisses, die im Hintergrund vorab gelesen werden '
+                             '(0: kein Vorablesen); größere Dateien als 16 MB werden nicht vorab gelesen.')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Die Stapelung großer Lösungen mit allen Prozessorkernen prüfen; die Paletten werden '
+                             'entlang der Länge des Containers aufgeteilt.')
+    parser.add_argument('--collect', type=int, required=False, default=0,
+                        help='Alle Verletzungen einer Lösung in einem Durchlauf sammeln und höchstens so viele '
+                             'ausgeben (0: Abbruch bei der ersten Verletzung).')
+    parser.add_argument('--time-budget', type=float, required=False, default=None,
+                        help='Maximale Zeit für die Überprüfung einer Lösung in Sekunden; danach wird die '
+                             'Überprüfung abgebrochen und die Zulässigkeit als unbekannt gemeldet.')
+    parser.add_argument('--out-of-core', action='store_true',
+                        help='Lösungen, die nicht in den Arbeitsspeicher passen, abschnittsweise über temporäre '
+                             'Dateien überprüfen (benötigt numpy; ohne Vorablesen und ohne --collect).')
+    parser.add_argument('--manifest', type=str, required=False,
+                        help='csv-Datei mit den Spalten Task, Solution und optional Diff; alle Einträge werden '
+                             'überprüft und die Ergebnisse in den Bericht geschrieben.')
+    parser.add_argument('--report', type=str, required=False,
+                        help='Bericht des Manifests: JSON-Zeilen (Endung .jsonl) oder csv-Datei.')
+    parser.add_argument('--resume', action='store_true',
+                        help='Einträge, die bereits im Bericht stehen, überspringen und den Bericht fortsetzen.')
     args = parser.parse_args()
-    container_data = import_container_data_by_file(args.task)
-    width = container_data[0]
-    height = container_data[1]
-    tasks = container_data[2]
-    solutions = []
-    if os.path.isdir(args.solution):
-        for path, dirs, files in os.walk(args.solution):
-            for filename in files:
-                solutions.append(os.path.join(path, filename))
-    else:
-        solutions.append(args.solution)
-    for solution in solutions:
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    if args.manifest:
+        if args.report is None:
+            parser.error('the following arguments are required: --report')
+        try:
+            validated, skipped = run_manifest(args.manifest, args.report, args.diff, cache, args.engine, args.resume,
+                                              time_budget=args.time_budget)
+        except DataException as e:
+            parser.error(str(e))
+        print("%s Einträge überprüft, %s übersprungen." % (validated, skipped))
+        if cache is not None:
+            cache.evict()
+        return
+    if args.serve or args.socket:
+        server = ValidationServer(args.task, args.diff, cache, args.engine, args.time_budget)
+        if args.socket:
+            try:
+                server.serve_socket(args.socket)
+            except FileExistsError as e:
+                parser.error(str(e))
+        else:
+            server.serve(sys.stdin, sys.stdout)
+        return
+    if args.task is None or args.solution is None:
+        parser.error('the following arguments are required: --task/-t, --solution/-s')
+    if args.out_of_core and args.collect:
+        parser.error('argument --out-of-core: not allowed with argument --collect')
+    if args.watch:
         try:
-            print(solution)
-            solution_pallets = import_solution_by_file(solution, tasks)
-            validate_solution(solution_pallets, tasks, width, height, args.diff)
-            print("Die Lösung ist zulässig.")
-            print("Die minimale Länge beträgt: %s \n" % calculate_minimal_container_length(solution_pallets))
-        except (FeasibilityException, DataException) as e:
-            print("Die Lösung ist unzulässig.")
-            print(e, "\n")
+            watch_solution_files(args.solution, args.task, args.diff, cache, args.metrics, args.jobs, args.interval,
+                                 engine=args.engine, include=args.include, exclude=args.exclude,
+                                 prefetch=args.prefetch)
+        except KeyboardInterrupt:
+            pass
+        return
+    task_hash = hash_file(args.task)
+    container_data = import_container_data_by_file(args.task, cache, task_hash)
+    validate_solution_files(list(get_file_stamps(args.solution, args.include, args.exclude)), container_data, args.diff,
+                            cache, task_hash, args.metrics, args.jobs, args.engine,
+                            0 if args.out_of_core else args.prefetch, (os.cpu_count() or 1) if args.parallel else 1,
+                            args.collect, args.time_budget, args.out_of_core)
+    if cache is not None:
+        cache.evict()
 
 
-def import_container_data_by_file(file):
+def validate_solution_files(solutions, container_data, par_stacking=0, cache=None, task_hash=None,
+                            metrics_format='text', jobs=1, engine='auto', prefetch=4, stacking_jobs=1, collect=0,
+                            time_budget=None, out_of_core=False):
     """
-    Import all data of the container from a csv file
-    :param file: A csv file
-    :return: List of container width, container height and a Dictionary of all tasks (pallet types)
+    Validates several solution files and prints the results in the order of the files
+    :param solutions: List of paths of the solution files
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param cache: Result cache or None
+    :param task_hash: Hash of the task file; necessary for the cache
+    :param metrics_format: Output of the metrics: 'text' (after every check), 'json' (one line) or 'none'
+    :param jobs: Number of worker processes
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param prefetch: Number of files, which are read ahead in background threads (only without worker processes and
+    with several files)
+    :param stacking_jobs: Number of worker processes for the check of the stacking of a large solution (only without
+    worker processes for the files)
+    :param collect: Maximal number of collected violations per solution or 0 to stop at the first one
+    :param time_budget: Maximal time of the validation of a solution in seconds or None
+    :param out_of_core: True to validate the solutions without loading them into the memory (see
+    check_solution_out_of_core)
     """
-    with open(file, newline='') as csvfile:
-        next(csvfile)
-        container_dimensions = csvfile.readline().strip().split(",")
-        return [int(container_dimensions[0]), int(container_dimensions[1]), import_tasks(csvfile)]
+    if jobs > 1 and len(solutions) > 1:
+        # The task data is passed only once to every worker; the results are printed in the order of the solutions
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=(container_data, par_stacking, cache, task_hash, metrics_format, engine,
+                                           collect, time_budget, out_of_core)) as executor:
+            chunksize = max(1, len(solutions) // (jobs * 4))
+            for output in executor.map(validate_solution_file_in_worker, solutions, chunksize=chunksize):
+                print(output, end="", flush=True)
+    else:
+        # A single file is not prefetched, as there is no validation to overlap with; it is streamed from disk
+        for solution, content in prefetch_solution_files(solutions, prefetch if len(solutions) > 1 else 0):
+            validate_solution_file(solution, container_data, par_stacking, cache, task_hash, metrics_format, engine,
+                                   content, stacking_jobs, collect, time_budget, out_of_core)
+            sys.stdout.flush()
 
 
-def import_tasks(iterable):
+def get_file_stamps(solution, include=None, exclude=None):
     """
-    Import tasks from an iterable object
-    :param iterable: Iterable object; Field names must be correct
-    :return: Dictionary of all tasks (pallet types)
+    Get the modification time and the size of all files of a directory (including subdirectories) or of a single file
+    :param solution: Path of a directory or a file
+    :param include: List of glob patterns; only matching files of a directory are used, if it is given
+    :param exclude: List of glob patterns; matching files of a directory are skipped
+    :return: Dictionary of the paths and the tuples (modification time in ns, size); the files are in the order of
+    os.walk
     """
-    csvreader = csv.DictReader(iterable, delimiter=',', quotechar='|')
+    if not os.path.isdir(solution):
+        stat = os.stat(solution)
+        return {solution: (stat.st_mtime_ns, stat.st_size)}
     result = dict()
-    for row in csvreader:
-        result[int(row["Order"])] = PalletType(int(row["Order"]), row["Description"], int(row["Quantity"]),
-                                               int(row["Length"]), int(row["Width"]), int(row["Height"]),
-                                               bool(int(row["TurningAllowed"])), bool(int(row["StackingAllowed"])),
-                                               int(row["Group"]))
+    for path, dirs, files in os.walk(solution):
+        for filename in files:
+            file = os.path.join(path, filename)
+            if not matches_patterns(os.path.relpath(file, solution), include, exclude):
+                continue
+            try:
+                stat = os.stat(file)
+            except OSError:  # The file was removed in the meantime
+                continue
+            result[file] = (stat.st_mtime_ns, stat.st_size)
     return result
 
 
-def import_solution_by_file(file, task_data):
+def matches_patterns(file, include=None, exclude=None):
     """
-    Import solution from a csv file
-    :param file: A csv file
-    :param task_data: Already imported tasks
-    :return: List of solution pallets
+    Checks a file against include and exclude glob patterns. A pattern matches the relative path or the file name.
+    :param file: Path of the file relative to the solution directory
+    :param include: List of glob patterns or None
+    :param exclude: List of glob patterns or None
+    :return: True, if the file matches an include pattern (or there are none) and no exclude pattern
     """
-    try:
-        with open(file, newline='') as csvfile:
-            line = csvfile.readline().strip()  # strip is necessary, because the first line ends with '\p\n'
-            if line != HEADER_SOLUTIONS:
-                raise DataException("Fehlerhafter Header: %s" % line)
-        with open(file, newline='') as csvfile:
-            return import_solution(csvfile, task_data)
-    except UnicodeDecodeError:
-        raise DataException("Fehler beim Decoding; vermutlich Binärdatei.")
+    def matches(patterns):
+        return any(fnmatch.fnmatch(file, i) or fnmatch.fnmatch(os.path.basename(file), i) for i in patterns)
 
+    return (not include or matches(include)) and not (exclude and matches(exclude))
 
-# TODO: zweite Importfunktion mit TypId und zwei Punkten
-def import_solution(iterable, task_data):
+
+def prefetch_solution_files(solutions, depth=4):
     """
-    Import solution from an iterable object
-    :param iterable: An iterable object
-    :param task_data: Already imported tasks
-    :return: List of solution pallets
+    Reads solution files in background threads, while the previous files are validated
+    :param solutions: List of paths of the solution files
+    :param depth: Number of files, which are read ahead; 0 disables the prefetching
+    :return: Generator of tuples of the path and the prefetched content (see read_solution_content) in the order of
+    the solutions
     """
-    csvreader = csv.DictReader(iterable, delimiter=',', quotechar='|')
-    result = []
-    for row in csvreader:
-        new_solution_pallet_type = task_data[int(row["Order"])]
-        new_solution_pallet = SolutionPallet(new_solution_pallet_type, int(row["xPos"]), int(row["yPos"]),
-                                             int(row["zPos"]), int(row["HTurned"]))
-        result.append(new_solution_pallet)
-    return result
+    if depth <= 0:
+        for solution in solutions:
+            yield solution, None
+        return
+    solutions = iter(solutions)
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        pending = collections.deque((i, executor.submit(read_solution_content, i))
+                                    for i in itertools.islice(solutions, depth))
+        while pending:
+            solution, future = pending.popleft()
+            for next_solution in itertools.islice(solutions, 1):
+                pending.append((next_solution, executor.submit(read_solution_content, next_solution)))
+            yield solution, future.result()
 
 
-def validate_solution(solution_pallets, tasks, height_value, width_value, par_stacking=0):
+def read_solution_content(file, head_size=8192, max_size=None):
     """
-    Main function to validate all aspects for a feasible solution
-    :param par_stacking: Parameter for accessibility of stacked pallets
-    :param solution_pallets: List of solution pallets
-    :param tasks: Dictionary of tasks (pallet types)
-    :param height_value: Height of the container
-    :param width_value: Width of the container
+    Reads the content of a solution file for the prefetching. The first bytes are sniffed: if the file is certainly
+    rejected (see is_rejected_head), the rest of the file is not read.
+    :param file: Path of the solution file
+    :param head_size: Number of bytes, which are sniffed
+    :param max_size: Maximal size of a prefetched file in bytes or None for PREFETCH_SIZE
+    :return: Content as bytes or None, if the file is read later from disk (binary solution files, which are loaded
+    through a memory map, large files, which are streamed, and files, which could not be read)
     """
-    timestamps = [datetime.now()]
-    check_count(solution_pallets, tasks)
-    timestamps.append(datetime.now())
-    print("Anzahl der Palletten korrekt: %s Sekunden" % (timestamps[-1]-timestamps[-2]).total_seconds())
-    check_dimensions(solution_pallets)
-    timestamps.append(datetime.now())
-    print("Palettenmaße und Drehung korrekt: %s Sekunden" % (timestamps[-1]-timestamps[-2]).total_seconds())
-    check_container_dimensions(solution_pallets, height_value, width_value)
-    timestamps.append(datetime.now())
-    print("Container Maße eingehalten: %s Sekunden" % (timestamps[-1]-timestamps[-2]).total_seconds())
-    check_stacking(solution_pallets)
-    timestamps.append(datetime.now())
-    print("Alle Palette korrekt gestapelt: %s Sekunden" % (timestamps[-1]-timestamps[-2]).total_seconds())
-    check_lifo(solution_pallets, par_stacking)
-    timestamps.append(datetime.now())
-    print("Alle Paletten gemäß Lifo erreichbar: %s Sekunden" % (timestamps[-1]-timestamps[-2]).total_seconds())
+    try:
+        with open(file, 'rb') as binary_file:
+            head = binary_file.read(head_size)
+            large = os.fstat(binary_file.fileno()).st_size > (max_size or PREFETCH_SIZE)
+            if head.startswith(MAGIC):
+                # The file is read once, so that the memory map is loaded from the page cache later
+                while not large and binary_file.read(1 << 20):
+                    pass
+                return None
+            if is_rejected_head(head, len(head) < head_size):
+                return head
+            return None if large else head + binary_file.read()  # A large file is not kept in the memory
+    except OSError:  # The error is reported by the validation (see validate_solution_file)
+        return None
 
 
-def check_count(solution_pallets, tasks):
+def is_rejected_head(head, complete):
     """
-    This function checks, if the quantity of pallet types in the solution is equal to the required number in tasks
-    :param solution_pallets: List of solution pallets
-    :param tasks: Dictionary of tasks (Pallet types)
+    Checks the first bytes of a solution csv file in the same way as read_solution_chunks
+    :param head: First bytes of the file
+    :param complete: True, if the head is the complete file
+    :return: True, if the file can not be decoded or has a wrong header
+    """
+    try:
+        text = codecs.getincrementaldecoder(locale.getpreferredencoding(False))().decode(head, final=complete)
+    except UnicodeDecodeError:
+        return True
+    line = io.StringIO(text, newline='').readline()
+    if not complete and not line.endswith(("\r", "\n")):  # The first line is not complete
+        return False
+    return line.strip() != HEADER_SOLUTIONS
+
+
+def watch_solution_files(solution, task, par_stacking=0, cache=None, metrics_format='text', jobs=1, interval=1.0,
+                         rounds=None, engine='auto', include=None, exclude=None, prefetch=4):
+    """
+    Watches a solution directory and validates every new or changed file. The directory is polled; a refresh of
+    unchanged files only costs a stat of every file. If the task file is changed, it is imported again and all files
+    are validated again.
+    :param solution: Path of the solution directory (or of a single solution file)
+    :param task: Path of the task file
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param cache: Result cache or None
+    :param metrics_format: Output of the metrics: 'text' (after every check), 'json' (one line) or 'none'
+    :param jobs: Number of worker processes
+    :param interval: Time between two refreshes in seconds
+    :param rounds: Number of refreshes or None for an infinite loop
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param include: List of glob patterns; only matching files are validated, if it is given
+    :param exclude: List of glob patterns; matching files are skipped
+    :param prefetch: Number of files, which are read ahead in background threads
+    """
+    task_stamp = None
+    stamps = dict()
+    for refresh in itertools.count() if rounds is None else range(rounds):
+        if refresh:
+            time.sleep(interval)
+        stat = os.stat(task)
+        if task_stamp != (stat.st_mtime_ns, stat.st_size):
+            task_stamp = (stat.st_mtime_ns, stat.st_size)
+            task_hash = hash_file(task)
+            container_data = import_container_data_by_file(task, cache, task_hash)
+            stamps = dict()
+        new_stamps = get_file_stamps(solution, include, exclude) if os.path.exists(solution) else dict()
+        changed = [i for i in new_stamps if stamps.get(i) != new_stamps[i]]
+        stamps = new_stamps
+        if changed:
+            validate_solution_files(changed, container_data, par_stacking, cache, task_hash, metrics_format, jobs,
+                                    engine, prefetch)
+            if cache is not None:
+                cache.evict()
+
+
+def validate_solution_file(solution, container_data, par_stacking=0, cache=None, task_hash=None, metrics_format='text',
+                           engine='auto', content=None, stacking_jobs=1, collect=0, time_budget=None,
+                           out_of_core=False):
+    """
+    Validates a solution file and prints the result. If a cache is given, the result of an unchanged pair of task and
+    solution is taken from the cache.
+    :param solution: Path of the solution file
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param cache: Result cache or None
+    :param task_hash: Hash of the task file; necessary for the cache
+    :param metrics_format: Output of the metrics: 'text' (after every check), 'json' (one line) or 'none'
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param content: Prefetched content of a csv file (see read_solution_content) or None to read the file
+    :param stacking_jobs: Number of worker processes for the check of the stacking of a large solution
+    :param collect: Maximal number of collected violations (see collect_violations) or 0 to stop at the first one
+    :param time_budget: Maximal time of the validation in seconds or None
+    :param out_of_core: True to validate the solution without loading it into the memory (see
+    check_solution_out_of_core)
+    """
+    print(solution)
+    result = None
+    metrics = {'text': PrintingMetrics, 'json': MetricsRecorder}.get(metrics_format, Metrics)(time_budget)
+    try:
+        if cache is not None:
+            # The hash of a completely prefetched file is calculated from its content; a rejected file is read again
+            content_hash = hash_content(content) if content is not None and \
+                len(content) == os.path.getsize(solution) else hash_file(solution)
+            key = make_key("result", get_checker_version(), task_hash, content_hash, par_stacking, engine, collect)
+            result = cache.get(key)
+        cached = result is not None
+        if result is None:
+            result = check_solution_file(solution, container_data, par_stacking, metrics, engine, content,
+                                         stacking_jobs, collect, out_of_core)
+            if cache is not None and not result.get("timed_out"):  # The result of a stopped check is not cached
+                cache.put(key, result)
+    except OSError as e:  # The file was removed or renamed in the meantime (e.g. by a solver in the watch mode)
+        print("Die Lösung konnte nicht gelesen werden.")
+        print(e, "\n")
+        return
+    if result.get("timed_out"):
+        print("Die Zulässigkeit der Lösung ist unbekannt.")
+        print(result["message"], "\n")
+    elif result["feasible"]:
+        print("Die Lösung ist zulässig.")
+        print("Die minimale Länge beträgt: %s \n" % result["minimal_length"])
+    elif result.get("violations"):
+        print("Die Lösung ist unzulässig. Gefundene Verletzungen: %s" % len(result["violations"]))
+        print("\n".join(i["message"] for i in result["violations"]), "\n")
+    else:
+        print("Die Lösung ist unzulässig.")
+        print(result["message"], "\n")
+    if metrics_format == 'json':
+        print(json.dumps(dict(solution=solution, cached=cached, **metrics.as_dict())))
+
+
+def check_solution_file(solution, container_data, par_stacking=0, metrics=None, engine="auto", content=None,
+                        stacking_jobs=1, collect=0, out_of_core=False):
+    """
+    Validates a solution file
+    :param solution: Path of the solution file
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the times of the stages and the counters
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param content: Prefetched content of a csv file (see read_solution_content) or None to read the file
+    :param stacking_jobs: Number of worker processes for the check of the stacking of a large solution
+    :param collect: Maximal number of collected violations (see collect_violations) or 0 to stop at the first one
+    :param out_of_core: True to validate the solution without loading it into the memory (see
+    check_solution_out_of_core); the engine is not used and violations are not collected
+    :return: Dictionary with the verdict (feasible), the message and the minimal container length; if violations are
+    collected, also the list of violation records (violations); if the time budget of the metrics is exhausted, the
+    verdict is None and timed_out is True
+    """
+    if out_of_core:
+        return check_solution_out_of_core(solution, container_data, par_stacking, metrics)
+    if content is None and np is not None and is_binary_solution(solution):
+        # A binary solution is loaded directly into the columnar representation
+        metrics = metrics or NULL_METRICS
+        width, height, tasks = container_data
+        try:
+            with metrics.stage("import_solution"):
+                solution_table = import_solution_table_by_file(solution, tasks, *(() if collect else (width, height)))
+            if collect:
+                return get_collected_result(solution_table, tasks, width, height, par_stacking, collect, metrics)
+            validate_solution(solution_table, tasks, width, height, par_stacking, metrics, True, engine,
+                              stacking_jobs)
+            return {"feasible": True, "message": None,
+                    "minimal_length": calculate_minimal_container_length(solution_table)}
+        except (FeasibilityException, DataException, EngineMismatchException) as e:
+            return {"feasible": False, "message": str(e), "minimal_length": None}
+        except TimeBudgetException as e:
+            return {"feasible": None, "message": str(e), "minimal_length": None, "timed_out": True}
+    return check_solution_chunks(read_solution_chunks(solution, content=content), container_data, par_stacking,
+                                 metrics, engine, stacking_jobs, collect)
+
+
+def get_collected_result(solution_pallets, tasks, width_value, height_value, par_stacking, limit, metrics=None):
+    """
+    Collects the violations of a solution
+    :param solution_pallets: List of solution pallets or solution table (imported without pre-validation)
+    :param tasks: Dictionary of tasks (pallet types)
+    :param width_value: Width of the container
+    :param height_value: Height of the container
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param limit: Maximal number of collected violations
+    :param metrics: Metrics recorder for the times of the stages and the counters
+    :return: Dictionary with the verdict (feasible), the first message, the minimal container length and the list of
+    violation records (violations)
+    """
+    violations = collect_violations(solution_pallets, tasks, width_value, height_value, par_stacking, limit, metrics)
+    if violations:
+        return {"feasible": False, "message": violations[0]["message"], "minimal_length": None,
+                "violations": violations}
+    return {"feasible": True, "message": None, "minimal_length": calculate_minimal_container_length(solution_pallets),
+            "violations": []}
+
+
+def check_solution_chunks(chunks, container_data, par_stacking=0, metrics=None, engine="auto", stacking_jobs=1,
+                          collect=0):
+    """
+    Validates a solution given as chunks of columns (e.g. read from a file or sent to the validation server)
+    :param chunks: Iterable of chunks; every chunk is a tuple of the columns (order, x, y, z, turned)
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the times of the stages and the counters
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param stacking_jobs: Number of worker processes for the check of the stacking of a large solution
+    :param collect: Maximal number of collected violations (see collect_violations) or 0 to stop at the first one
+    :return: Dictionary with the verdict (feasible), the message and the minimal container length; if violations are
+    collected, also the list of violation records (violations); if the time budget of the metrics is exhausted, the
+    verdict is None and timed_out is True
+    """
+    metrics = metrics or NULL_METRICS
+    width, height, tasks = container_data
+    try:
+        with metrics.stage("import_solution"):
+            # Without pre-validation, so that all violations can be collected
+            if np is not None:  # Like a binary solution in the columnar representation
+                solution_pallets = build_solution_table(
+                    chunks if collect else prevalidate_chunks(chunks, tasks, width, height), tasks)
+            else:
+                solution_pallets = import_solution_chunks(chunks, tasks, *(() if collect else (width, height)))
+        if collect:
+            return get_collected_result(solution_pallets, tasks, width, height, par_stacking, collect, metrics)
+        validate_solution(solution_pallets, tasks, width, height, par_stacking, metrics, True, engine, stacking_jobs)
+        return {"feasible": True, "message": None,
+                "minimal_length": calculate_minimal_container_length(solution_pallets)}
+    except (FeasibilityException, DataException, EngineMismatchException) as e:
+        return {"feasible": False, "message": str(e), "minimal_length": None}
+    except TimeBudgetException as e:
+        return {"feasible": None, "message": str(e), "minimal_length": None, "timed_out": True}
+
+
+def validate_batch(container_data, solutions, par_stacking=0, engine="auto", time_budget=None):
+    """
+    Validates many solutions of one task in-process without any output. The task table (dimensions and groups of the
+    pallet types) is built only once and shared by all solutions.
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param solutions: Iterable of solutions; every solution is the path of a solution file or its rows (list or array
+    of rows with order, x, y, z and turned)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param time_budget: Maximal time of the validation of a solution in seconds or None
+    :return: Generator of result records (see get_result_record) in the order of the solutions
+    """
+    task_data = TaskTable(container_data[2]) if np is not None else container_data[2]
+    for solution in solutions:
+        yield validate_batch_solution(solution, container_data, task_data, par_stacking, engine, time_budget)
+
+
+def validate_batch_solution(solution, container_data, task_data, par_stacking=0, engine="auto", time_budget=None):
+    """
+    Validates a solution of a batch
+    :param solution: Path of a solution file or rows of the solution (order, x, y, z and turned)
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param task_data: Task table or (without numpy) Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param time_budget: Maximal time of the validation in seconds or None
+    :return: Result record (see get_result_record)
+    """
+    width, height, tasks = container_data
+    metrics = MetricsRecorder(time_budget)
+    try:
+        with metrics.stage("import_solution"):
+            solution_pallets = import_batch_solution(solution, task_data, width, height)
+        validate_solution(solution_pallets, tasks, width, height, par_stacking, metrics, True, engine)
+        return get_result_record(None, metrics, calculate_minimal_container_length(solution_pallets))
+    except (FeasibilityException, DataException, EngineMismatchException, TimeBudgetException, OSError) as e:
+        return get_result_record(e, metrics)  # Missing files are reported as results like in run_manifest
+
+
+def import_batch_solution(solution, task_data, width_value, height_value):
+    """
+    Imports a solution of a batch; the count, the dimensions and the container dimensions are already checked
+    :param solution: Path of a solution file or rows of the solution (order, x, y, z and turned)
+    :param task_data: Task table or (without numpy) Dictionary of all tasks (pallet types)
+    :param width_value: Width of the container
+    :param height_value: Height of the container
+    :return: Solution table or (without numpy) list of solution pallets
+    """
+    if isinstance(solution, (str, os.PathLike)):
+        if isinstance(task_data, TaskTable):
+            return import_solution_table_by_file(solution, task_data, width_value, height_value)
+        return import_solution_by_file(solution, task_data, width_value, height_value)
+    if not isinstance(task_data, TaskTable):
+        return import_solution_chunks(read_solution_rows([list(i) for i in solution]), task_data, width_value,
+                                      height_value)
+    try:
+        rows = np.asarray(solution)
+    except ValueError:  # Rows of different lengths are reported like in read_solution_rows
+        for row in solution:
+            if not hasattr(row, "__len__") or len(row) != len(HEADER_SOLUTIONS.split(",")):
+                raise DataException("Unvollständige Zeile: %s" % row)
+        raise DataException("Fehlerhafte Zeilen: Es werden ganzzahlige Zeilen mit %s erwartet." % HEADER_SOLUTIONS)
+    if rows.size == 0:
+        rows = np.zeros((0, len(HEADER_SOLUTIONS.split(","))), dtype=np.int64)
+    if rows.ndim != 2 or rows.shape[1] != len(HEADER_SOLUTIONS.split(",")) or rows.dtype.kind not in "iub":
+        raise DataException("Fehlerhafte Zeilen: Es werden ganzzahlige Zeilen mit %s erwartet." % HEADER_SOLUTIONS)
+    try:
+        solution_table = SolutionTable(task_data, *rows.T)
+    except KeyError as e:
+        raise DataException("Unbekannte Order: %s" % e.args[0])
+    check_count(solution_table, task_data.tasks)
+    check_dimensions(solution_table)
+    check_container_dimensions(solution_table, width_value, height_value)
+    return solution_table
+
+
+def get_result_record(exception=None, metrics=None, minimal_length=None):
+    """
+    Creates the result record of a validation
+    :param exception: Exception of the first violation or None, if the solution is feasible; the verdict of a
+    TimeBudgetException is None
+    :param metrics: Metrics recorder of the validation
+    :param minimal_length: Minimal container length of a feasible solution
+    :return: Dictionary with the verdict (feasible), the class of the error, the kind of the violation, the message,
+    the involved pallets (tuples of order, x, y and z), the minimal container length, the times of the stages and the
+    counters
+    """
+    feasible = None if isinstance(exception, TimeBudgetException) else exception is None
+    return dict(feasible=feasible, error=type(exception).__name__ if exception is not None else None,
+                violation=getattr(exception, "violation", None),
+                message=str(exception) if exception is not None else None,
+                pallets=getattr(exception, "pallets", []), minimal_length=minimal_length,
+                **(metrics or MetricsRecorder()).as_dict())
+
+
+class TaskDataCache:
+    """
+    Imported data of the recently used task files of a manifest. Only the size least recently used task files are
+    kept; a task file is imported again, if it was changed.
+    """
+    def __init__(self, size=16, cache=None):
+        self.size = size
+        self.cache = cache
+        self.entries = collections.OrderedDict()
+
+    def get(self, task):
+        """
+        Get the imported data of a task file
+        :param task: Path of the task file
+        :return: Tuple of the container data (container width, container height and a Dictionary of all tasks) and the
+        task table (or without numpy the Dictionary of all tasks)
+        """
+        stat = os.stat(task)
+        entry = self.entries.pop(task, None)
+        if entry is None or entry[0] != (stat.st_mtime_ns, stat.st_size):
+            try:
+                container_data = import_container_data_by_file(task, self.cache)
+            except (KeyError, ValueError, IndexError, TypeError):
+                raise DataException("Fehlerhafte Aufgabedaten: %s" % task)
+            task_data = TaskTable(container_data[2]) if np is not None else container_data[2]
+            entry = ((stat.st_mtime_ns, stat.st_size), container_data, task_data)
+        self.entries[task] = entry
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+        return entry[1], entry[2]
+
+
+def run_manifest(manifest, report, par_stacking=0, cache=None, engine="auto", resume=False, task_cache_size=16,
+                 time_budget=None):
+    """
+    Validates the entries of a manifest and appends the record of every entry to the report, as soon as it is
+    validated. The manifest is a csv file with the columns MANIFEST_COLUMNS (Diff is optional); relative paths are
+    relative to the directory of the manifest. The report is written as JSON Lines (extension .jsonl) or as csv file
+    (see REPORT_COLUMNS). Only the current entry, the recently used task files and the numbers of the finished entries
+    are kept in memory.
+    :param manifest: Path of the manifest
+    :param report: Path of the report
+    :param par_stacking: Parameter for accessibility of stacked pallets of entries without Diff
+    :param cache: Result cache for the imported task files or None
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param resume: True, if the entries of an existing report are skipped and the report is continued
+    :param task_cache_size: Maximal number of imported task files in memory
+    :param time_budget: Maximal time of the validation of an entry in seconds or None
+    :return: Tuple of the numbers of validated and skipped entries
+    """
+    csv_format = not report.endswith(".jsonl")
+    finished = read_report_entries(report, csv_format) if resume else set()
+    tasks = TaskDataCache(task_cache_size, cache)
+    directory = os.path.dirname(os.path.abspath(manifest))
+    validated = 0
+    with open(manifest, newline='') as manifest_file, \
+            open(report, 'a' if resume else 'w', newline='', encoding='utf-8') as report_file:
+        rows = csv.DictReader(manifest_file)
+        if not rows.fieldnames or not set(MANIFEST_COLUMNS[:2]) <= set(rows.fieldnames):
+            raise DataException("Fehlerhafter Header: %s" % ",".join(rows.fieldnames or []))
+        writer = None
+        if csv_format:
+            writer = csv.DictWriter(report_file, REPORT_COLUMNS + ["time_%s" % i for i in REPORT_STAGES],
+                                    extrasaction='ignore')
+            if report_file.tell() == 0:
+                writer.writeheader()
+        for entry, row in enumerate(rows, 1):
+            if entry in finished:
+                continue
+            record = dict(entry=entry, **validate_manifest_entry(row, directory, tasks, par_stacking, engine,
+                                                                 time_budget))
+            if csv_format:
+                writer.writerow(dict(record, time=sum(record["times"].values()),
+                                     **{"time_%s" % i: record["times"].get(i) for i in REPORT_STAGES}))
+            else:
+                report_file.write(json.dumps(record) + "\n")
+            report_file.flush()
+            validated += 1
+    return validated, len(finished)
+
+
+def validate_manifest_entry(row, directory, tasks, par_stacking=0, engine="auto", time_budget=None):
+    """
+    Validates an entry of a manifest
+    :param row: Row of the manifest as dictionary (see MANIFEST_COLUMNS)
+    :param directory: Directory of the manifest
+    :param tasks: Task data cache
+    :param par_stacking: Parameter for accessibility of stacked pallets, if the entry has no Diff
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param time_budget: Maximal time of the validation in seconds or None
+    :return: Result record (see get_result_record) with the task, the solution and the parameter of the entry
+    """
+    task, solution, diff = (row.get(i) for i in MANIFEST_COLUMNS)
+    entry = dict(task=task, solution=solution, diff=par_stacking)
+    try:
+        if not task or not solution:
+            raise DataException("Unvollständiger Eintrag: %s" % ",".join(i or "" for i in (task, solution)))
+        if diff:
+            try:
+                entry["diff"] = float(diff)
+            except ValueError:
+                raise DataException("Fehlerhafter Versatz: %s" % diff)
+        container_data, task_data = tasks.get(os.path.join(directory, task))
+        result = validate_batch_solution(os.path.join(directory, solution), container_data, task_data, entry["diff"],
+                                         engine, time_budget)
+    except (DataException, OSError) as e:  # Missing or defect files are reported as results of the entry
+        result = get_result_record(e)
+    return dict(entry, **result)
+
+
+def read_report_entries(report, csv_format):
+    """
+    Reads the numbers of the finished entries of a report. An incomplete last line (of an interrupted run) is removed.
+    :param report: Path of the report
+    :param csv_format: True for a csv report, False for JSON Lines
+    :return: Set of the numbers of the entries
+    """
+    if not os.path.exists(report):
+        return set()
+    with open(report, 'rb+') as binary_file:
+        end = 0
+        for line in binary_file:
+            if line.endswith(b"\n"):
+                end += len(line)
+        binary_file.truncate(end)
+    with open(report, newline='', encoding='utf-8') as report_file:
+        if csv_format:
+            return {int(i["entry"]) for i in csv.DictReader(report_file)}
+        return {json.loads(i)["entry"] for i in report_file if i.strip()}
+
+
+def get_checker_version():
+    """
+    Get the version of the checker for the result cache. It is the hash of the source files, so that all cached
+    results become invalid after a change of the checker.
+    :return: Version as hex string
+    """
+    global checker_version
+    if checker_version is None:
+        try:
+            modules = (__name__, "rectangles", "binary_solution")
+            checker_version = make_key(*(hash_file(sys.modules[i].__file__) for i in modules))
+        except (OSError, AttributeError, TypeError):  # e.g. in a frozen executable
+            checker_version = make_key(sys.executable, os.path.getmtime(sys.executable))
+    return checker_version
+
+
+# Version of the checker; it is calculated once by get_checker_version
+checker_version = None
+
+# Container data and parameter of a worker process; they are set once by init_worker
+worker_data = None
+
+
+def init_worker(container_data, par_stacking, cache=None, task_hash=None, metrics_format='text', engine='auto',
+                collect=0, time_budget=None, out_of_core=False):
+    """
+    Initializes a worker process for the parallel validation of solution files
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param cache: Result cache or None
+    :param task_hash: Hash of the task file; necessary for the cache
+    :param metrics_format: Output of the metrics: 'text' (after every check), 'json' (one line) or 'none'
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param collect: Maximal number of collected violations per solution or 0 to stop at the first one
+    :param time_budget: Maximal time of the validation of a solution in seconds or None
+    :param out_of_core: True to validate the solutions without loading them into the memory
+    """
+    global worker_data
+    worker_data = dict(container_data=container_data, par_stacking=par_stacking, cache=cache, task_hash=task_hash,
+                       metrics_format=metrics_format, engine=engine, collect=collect, time_budget=time_budget,
+                       out_of_core=out_of_core)
+
+
+def validate_solution_file_in_worker(solution):
+    """
+    Validates a solution file in a worker process
+    :param solution: Path of the solution file
+    :return: The printed output of the validation
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        validate_solution_file(solution, **worker_data)
+    return output.getvalue()
+
+
+class ValidationServer:
+    """
+    Long-running validation server. Every task file is imported only once, so that a request only pays for the import
+    and the validation of its solution. The requests and the responses are JSON objects, one per line. A request
+    contains either the path of a solution file ("solution") or the rows of the solution ("rows", lists of order, x,
+    y, z and turned) and optionally an identifier ("id"), a task file ("task"), the parameter for accessibility of
+    stacked pallets ("diff"), the engine ("engine") and the time budget in seconds ("time_budget"). The response
+    contains the identifier, the verdict, the message, the minimal container length and the metrics of the validation.
+    """
+    def __init__(self, task=None, par_stacking=0, cache=None, engine="auto", time_budget=None):
+        self.task = task
+        self.par_stacking = par_stacking
+        self.cache = cache
+        self.engine = engine
+        self.time_budget = time_budget
+        self.container_data = dict()
+        if task is not None:
+            self.get_container_data(task)
+
+    def get_container_data(self, task):
+        """
+        Get the imported data of a task file; the file is imported again, if it was changed
+        :param task: Path of the task file
+        :return: List of container width, container height and a Dictionary of all tasks (pallet types)
+        """
+        stat = os.stat(task)
+        stamp, container_data = self.container_data.get(task, (None, None))
+        if stamp != (stat.st_mtime_ns, stat.st_size):
+            try:
+                container_data = import_container_data_by_file(task, self.cache)
+            except (KeyError, ValueError, IndexError, TypeError):
+                raise DataException("Fehlerhafte Aufgabedaten: %s" % task)
+            self.container_data[task] = ((stat.st_mtime_ns, stat.st_size), container_data)
+        return container_data
+
+    def handle(self, request):
+        """
+        Answers a request
+        :param request: Request as dictionary
+        :return: Response as dictionary
+        """
+        task = request.get("task", self.task)
+        if not isinstance(task, str):
+            raise DataException("Keine Aufgabedaten angegeben.")
+        container_data = self.get_container_data(task)
+        par_stacking = request.get("diff", self.par_stacking)
+        if isinstance(par_stacking, bool) or not isinstance(par_stacking, (int, float)):
+            raise DataException("Fehlerhafter Versatz: %s" % par_stacking)
+        engine = request.get("engine", self.engine)
+        if engine not in ENGINES:
+            raise DataException("Unbekannte Engine: %s" % engine)
+        time_budget = request.get("time_budget", self.time_budget)
+        if time_budget is not None and (isinstance(time_budget, bool) or not isinstance(time_budget, (int, float))):
+            raise DataException("Fehlerhaftes Zeitlimit: %s" % time_budget)
+        metrics = MetricsRecorder(time_budget)
+        if isinstance(request.get("solution"), str):
+            result = check_solution_file(request["solution"], container_data, par_stacking, metrics, engine)
+        elif isinstance(request.get("rows"), list):
+            result = check_solution_chunks(read_solution_rows(request["rows"]), container_data, par_stacking, metrics,
+                                           engine)
+        else:
+            raise DataException("Keine Lösung angegeben.")
+        return dict(id=request.get("id"), **result, **metrics.as_dict())
+
+    def handle_line(self, line):
+        """
+        Answers a request given as JSON line
+        :param line: Request as JSON string
+        :return: Response as JSON string (without line break)
+        """
+        request = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise DataException("Die Anfrage ist kein JSON-Objekt.")
+            response = self.handle(request)
+        except (ValueError, DataException, OSError) as e:  # json.JSONDecodeError is a ValueError
+            response = {"id": request.get("id") if isinstance(request, dict) else None, "error": str(e)}
+        return json.dumps(response)
+
+    def serve(self, input_stream, output_stream):
+        """
+        Answers the requests of a stream until it ends
+        :param input_stream: Text stream of the requests
+        :param output_stream: Text stream of the responses
+        """
+        for line in input_stream:
+            if line.strip():
+                output_stream.write(self.handle_line(line) + "\n")
+                output_stream.flush()
+
+    def serve_socket(self, path):
+        """
+        Answers the requests of all connections to a Unix socket; every connection is handled in its own thread. A
+        stale socket at the path is replaced, any other file is kept.
+        :param path: Path of the Unix socket
+        :raises FileExistsError: If the path exists and is not a socket
+        """
+        validation_server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                validation_server.serve(io.TextIOWrapper(self.rfile, encoding='utf-8'),
+                                        io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True))
+
+        try:
+            if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                raise FileExistsError("Der Pfad %s existiert bereits und ist kein Socket." % path)
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        with socketserver.ThreadingUnixStreamServer(path, RequestHandler) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.remove(path)
+
+
+def read_solution_rows(rows):
+    """
+    Reads the rows of a solution (e.g. sent to the validation server) like read_solution_chunks reads a file
+    :param rows: List of rows; every row is a list of order, x, y, z and turned
+    :return: Generator of chunks; every chunk is a tuple of the columns (order, x, y, z, turned) as lists of integers
+    """
+    columns = len(HEADER_SOLUTIONS.split(","))
+    for row in rows:
+        if not isinstance(row, list) or len(row) != columns:
+            raise DataException("Unvollständige Zeile: %s" % row)
+        if not all(isinstance(i, int) for i in row):
+            raise DataException("Fehlerhafte Zeile: %s" % row)
+    if rows:
+        yield tuple(list(column) for column in zip(*rows))
+
+
+def import_container_data_by_file(file, cache=None, task_hash=None):
+    """
+    Import all data of the container from a csv file. If a cache is given, the parsed data of an unchanged task file
+    is taken from the cache.
+    :param file: A csv file
+    :param cache: Result cache or None
+    :param task_hash: Hash of the task file; it is calculated, if it is not given
+    :return: List of container width, container height and a Dictionary of all tasks (pallet types)
+    """
+    if cache is not None:
+        key = make_key("task", get_checker_version(), task_hash or hash_file(file))
+        container_data = cache.get_object(key)
+        if container_data is None:
+            container_data = import_container_data_by_file(file)
+            cache.put_object(key, container_data)
+        return container_data
+    with open(file, newline='') as csvfile:
+        next(csvfile)
+        container_dimensions = csvfile.readline().strip().split(",")
+        return [int(container_dimensions[0]), int(container_dimensions[1]), import_tasks(csvfile)]
+
+
+def import_tasks(iterable):
+    """
+    Import tasks from an iterable object
+    :param iterable: Iterable object; Field names must be correct
+    :return: Dictionary of all tasks (pallet types)
+    """
+    csvreader = csv.DictReader(iterable, delimiter=',', quotechar='|')
+    result = dict()
+    for row in csvreader:
+        result[int(row["Order"])] = PalletType(int(row["Order"]), row["Description"], int(row["Quantity"]),
+                                               int(row["Length"]), int(row["Width"]), int(row["Height"]),
+                                               bool(int(row["TurningAllowed"])), bool(int(row["StackingAllowed"])),
+                                               int(row["Group"]))
+    return result
+
+
+def import_solution_by_file(file, task_data, width_value=None, height_value=None):
+    """
+    Import solution from a csv file. If the container dimensions are given, the count, the dimensions and the container
+    dimensions are already checked during the import (see prevalidate_chunks).
+    :param file: A csv file
+    :param task_data: Already imported tasks
+    :param width_value: Width of the container or None
+    :param height_value: Height of the container or None
+    :return: List of solution pallets
+    """
+    return import_solution_chunks(read_solution_chunks(file), task_data, width_value, height_value)
+
+
+def import_solution_chunks(chunks, task_data, width_value=None, height_value=None):
+    """
+    Import solution from chunks of columns. If the container dimensions are given, the count, the dimensions and the
+    container dimensions are already checked during the import (see prevalidate_chunks).
+    :param chunks: Iterable of chunks; every chunk is a tuple of the columns (order, x, y, z, turned)
+    :param task_data: Already imported tasks
+    :param width_value: Width of the container or None
+    :param height_value: Height of the container or None
+    :return: List of solution pallets
+    """
+    if width_value is not None and height_value is not None:
+        chunks = prevalidate_chunks(chunks, task_data, width_value, height_value)
+    result = []
+    for orders, x_positions, y_positions, z_positions, h_turned in chunks:
+        result.extend(SolutionPallet(task_data[order], x_pos, y_pos, z_pos, turned) for
+                      order, x_pos, y_pos, z_pos, turned in zip(orders, x_positions, y_positions, z_positions,
+                                                                h_turned))
+    return result
+
+
+def import_solution_table_by_file(file, task_data, width_value=None, height_value=None):
+    """
+    Import solution from a csv file into the columnar representation. If the container dimensions are given, the
+    count, the dimensions and the container dimensions are already checked during the import (see prevalidate_chunks).
+    :param file: A csv file
+    :param task_data: Already imported tasks or a task table
+    :param width_value: Width of the container or None
+    :param height_value: Height of the container or None
+    :return: Solution table
+    """
+    tasks = task_data.tasks if isinstance(task_data, TaskTable) else task_data
+    if is_binary_solution(file):
+        solution_table = load_solution_table(file, task_data)
+        if width_value is not None and height_value is not None:
+            check_count(solution_table, tasks)
+            check_dimensions(solution_table)
+            check_container_dimensions(solution_table, width_value, height_value)
+        return solution_table
+    chunks = read_solution_chunks(file)
+    if width_value is not None and height_value is not None:
+        chunks = prevalidate_chunks(chunks, tasks, width_value, height_value)
+    return build_solution_table(chunks, task_data)
+
+
+def load_solution_table(file, task_data):
+    """
+    Loads a binary solution file (see binary_solution) through a memory map into the columnar representation; the
+    rows are not parsed
+    :param file: A binary solution file
+    :param task_data: Already imported tasks or a task table
+    :return: Solution table
+    """
+    task_table = task_data if isinstance(task_data, TaskTable) else TaskTable(task_data)
+    try:
+        rows = load_binary_solution(file)
+        return SolutionTable(task_table, rows["order"], rows["x"], rows["y"], rows["z"], rows["turned"])
+    except ValueError as e:
+        raise DataException(str(e))
+    except KeyError as e:
+        raise DataException("Unbekannte Order: %s" % e.args[0])
+
+
+def prevalidate_chunks(chunks, tasks, width_value, height_value):
+    """
+    Checks the rows of a solution, while they are imported. The same conditions as in check_count, check_dimensions
+    and check_container_dimensions are checked in a single pass and a solution is rejected at the first offending
+    row. Therefore, the reported violation can differ from validate_solution, if a solution has several violations.
+    :param chunks: Iterable of chunks; every chunk is a tuple of the columns (order, x, y, z, turned)
+    :param tasks: Dictionary of tasks (pallet types)
+    :param width_value: Width of the container
+    :param height_value: Height of the container
+    :return: Generator of the checked chunks
     """
+    counts = {key: 0 for key in tasks}
+    for chunk in chunks:
+        for order, x_pos, y_pos, z_pos, h_turned in zip(*chunk):
+            pallet_type = tasks.get(order)
+            if pallet_type is None:
+                raise DataException("Unbekannte Order: %s" % order)
+            counts[order] += 1
+            if counts[order] > pallet_type.quantity:
+                raise FeasibilityException("Die Anzahl der Paletten von Order %s überschreitet die geforderte "
+                                           "Anzahl %s." % (order, pallet_type.quantity), "count",
+                                           [(order, x_pos, y_pos, z_pos)])
+            length = pallet_type.width if h_turned else pallet_type.length
+            width = pallet_type.length if h_turned else pallet_type.width
+            # Same conditions as SolutionPallet.validate_rotation and SolutionPallet.extends_width/extends_height:
+            if length == pallet_type.width and width == pallet_type.length and not pallet_type.turning_allowed:
+                raise FeasibilityException(
+                    "Die Palette im Startpunkt %s von Order %s wurde unzulässigerweise gedreht." % (
+                        [(float(x_pos), float(y_pos), float(z_pos))], order), "rotation",
+                    [(order, x_pos, y_pos, z_pos)])
+            if y_pos + width > width_value or z_pos + pallet_type.height > height_value:
+                raise FeasibilityException("Die Palette im Startpunkt %s von Order %s überschreitet die Container "
+                                           "Dimensionen." % ([(float(x_pos), float(y_pos), float(z_pos))], order),
+                                           "container", [(order, x_pos, y_pos, z_pos)])
+        yield chunk
     for key in tasks:
-        used_pallets = len([i for i in filter(lambda item: item.type.order == key,
-                                              solution_pallets)])
-        if tasks[key].quantity != used_pallets:
+        if tasks[key].quantity != counts[key]:
             raise FeasibilityException(
                 "Die Anzahl der Paletten von Order %s beträgt %s. Es ist jedoch die Anzahl %s gefordert." %
-                (key, used_pallets, tasks[key].quantity))
+                (key, counts[key], tasks[key].quantity), "count")
+
+
+def read_solution_chunks(file, chunk_size=10000, content=None):
+    """
+    Reads a solution csv file as a stream. The file is opened only once and the header is validated from the same
+    handle. The rows are read positionally and converted column by column. Binary solution files (see binary_solution)
+    are recognized by their magic header and read without parsing.
+    :param file: A csv file or a binary solution file
+    :param chunk_size: Maximal number of rows per chunk
+    :param content: Prefetched content of a csv file (see read_solution_content) or None to read the file
+    :return: Generator of chunks; every chunk is a tuple of the columns (order, x, y, z, turned) as lists of integers
+    """
+    if content is None and is_binary_solution(file):
+        try:
+            yield from read_binary_chunks(file, chunk_size)
+        except ValueError as e:
+            raise DataException(str(e))
+        return
+    columns = len(HEADER_SOLUTIONS.split(","))
+    try:
+        with open(file, newline='') if content is None else io.TextIOWrapper(io.BytesIO(content),
+                                                                              newline='') as csvfile:
+            line = csvfile.readline().strip()  # strip is necessary, because the first line ends with '\p\n'
+            if line != HEADER_SOLUTIONS:
+                raise DataException("Fehlerhafter Header: %s" % line)
+            csvreader = csv.reader(csvfile, delimiter=',', quotechar='|')
+            while True:
+                chunk = list(itertools.islice(csvreader, chunk_size))
+                if not chunk:
+                    return
+                rows = [row for row in chunk if row]
+                for row in rows:
+                    if len(row) < columns:
+                        raise DataException("Unvollständige Zeile: %s" % ",".join(row))
+                if rows:
+                    try:
+                        yield tuple(list(map(int, column)) for column in itertools.islice(zip(*rows), columns))
+                    except ValueError:
+                        # The offending row is searched with the same conversion
+                        for row in rows:
+                            try:
+                                list(map(int, row[:columns]))
+                            except ValueError:
+                                raise DataException("Fehlerhafte Zeile: %s" % ",".join(row))
+    except UnicodeDecodeError:
+        raise DataException("Fehler beim Decoding; vermutlich Binärdatei.")
+
+
+# TODO: zweite Importfunktion mit TypId und zwei Punkten
+def import_solution(iterable, task_data):
+    """
+    Import solution from an iterable object
+    :param iterable: An iterable object
+    :param task_data: Already imported tasks
+    :return: List of solution pallets
+    """
+    csvreader = csv.DictReader(iterable, delimiter=',', quotechar='|')
+    result = []
+    for row in csvreader:
+        new_solution_pallet_type = task_data[int(row["Order"])]
+        new_solution_pallet = SolutionPallet(new_solution_pallet_type, int(row["xPos"]), int(row["yPos"]),
+                                             int(row["zPos"]), int(row["HTurned"]))
+        result.append(new_solution_pallet)
+    return result
+
+
+def import_solution_table(iterable, task_data):
+    """
+    Import solution from an iterable object into the columnar representation
+    :param iterable: An iterable object
+    :param task_data: Already imported tasks or a task table
+    :return: Solution table
+    """
+    csvreader = csv.reader(iterable, delimiter=',', quotechar='|')
+    fieldnames = next(csvreader)
+    columns = [fieldnames.index(i) for i in HEADER_SOLUTIONS.split(",")]
+    rows = [[row[i] for i in columns] for row in csvreader if row]
+    return build_solution_table([tuple(zip(*rows))] if rows else [], task_data)
+
+
+def build_solution_table(chunks, task_data):
+    """
+    Builds the columnar representation of a solution from chunks of columns
+    :param chunks: Iterable of chunks; every chunk is a tuple of the columns (order, x, y, z, turned)
+    :param task_data: Already imported tasks or a task table
+    :return: Solution table
+    """
+    task_table = task_data if isinstance(task_data, TaskTable) else TaskTable(task_data)
+    columns = [[] for _ in HEADER_SOLUTIONS.split(",")]
+    for chunk in chunks:
+        for column, values in zip(columns, chunk):
+            column.append(np.array(values, dtype=np.int64))
+    try:
+        return SolutionTable(task_table, *(np.concatenate(i) if i else np.zeros(0, dtype=np.int64) for i in columns))
+    except KeyError as e:
+        raise DataException("Unbekannte Order: %s" % e.args[0])
+
+
+def validate_solution(solution_pallets, tasks, height_value, width_value, par_stacking=0, metrics=None,
+                      prevalidated=False, engine="auto", stacking_jobs=1):
+    """
+    Main function to validate all aspects for a feasible solution
+    :param stacking_jobs: Number of worker processes for the check of the stacking of a large solution
+    :param engine: Engine for the check of stacking and LIFO (see ENGINES)
+    :param prevalidated: True, if the count, dimensions and container dimensions were already checked during the
+    import (see prevalidate_chunks)
+    :param metrics: Metrics recorder for the times of the stages and the counters; nothing is recorded, if it is None
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param solution_pallets: List of solution pallets or solution table
+    :param tasks: Dictionary of tasks (pallet types)
+    :param height_value: Height of the container
+    :param width_value: Width of the container
+    """
+    metrics = metrics or NULL_METRICS
+    # The checks in linear time run first; the time budget is checked between the stages and in the hot loops
+    if not prevalidated:
+        with metrics.stage("check_count"):
+            check_count(solution_pallets, tasks)
+        with metrics.stage("check_dimensions"):
+            check_dimensions(solution_pallets)
+        with metrics.stage("check_container_dimensions"):
+            check_container_dimensions(solution_pallets, height_value, width_value)
+    if isinstance(solution_pallets, SolutionTable):
+        solution_pallets = solution_pallets.get_pallets()
+    placement_engine = "auto" if engine == "crosscheck" else engine
+    remaining_time = metrics.get_remaining_time()
+    if remaining_time is not None:
+        metrics.check_deadline("check_stacking")
+        estimate = estimate_placement_seconds(solution_pallets, placement_engine) + \
+            (estimate_placement_seconds(solution_pallets, "reference") if engine == "crosscheck" else 0)
+        if estimate > remaining_time * ESTIMATE_MARGIN:
+            raise TimeBudgetException("Die Überprüfung wurde abgebrochen, da sie voraussichtlich %.1f Sekunden "
+                                      "dauert (Zeitlimit %s Sekunden)." % (estimate, metrics.time_budget))
+    try:
+        with metrics.stage("check_stacking"):
+            check_stacking(solution_pallets, metrics, placement_engine, jobs=stacking_jobs)
+        with metrics.stage("check_lifo"):
+            check_lifo(solution_pallets, par_stacking, metrics, placement_engine)
+    except FeasibilityException as e:
+        if engine == "crosscheck":
+            crosscheck_engines(solution_pallets, par_stacking, str(e), metrics)
+        raise
+    if engine == "crosscheck":
+        crosscheck_engines(solution_pallets, par_stacking, None, metrics)
+
+
+def estimate_placement_seconds(solution_pallets, engine="auto"):
+    """
+    Estimates the time of check_stacking and check_lifo. With the indexes it grows with the number of pallets and their
+    density (the number of candidate pairs per pallet), with the reference implementation with the number of pairs.
+    The density is the summed base area of the pallets divided by the area of their bounding box, i.e. the average
+    number of pallets above a point of the loaded floor.
+    :param solution_pallets: List of solution pallets
+    :param engine: One of ENGINES except crosscheck
+    :return: Estimated time in seconds
+    """
+    count = len(solution_pallets)
+    if count == 0:
+        return 0.0
+    if engine == "reference":
+        return count * count * REFERENCE_PAIR_SECONDS
+    min_x, min_y = min(i.x for i in solution_pallets), min(i.y for i in solution_pallets)
+    max_x = max(i.x + i.length for i in solution_pallets)
+    max_y = max(i.y + i.width for i in solution_pallets)
+    density = sum(i.length * i.width for i in solution_pallets) / max((max_x - min_x) * (max_y - min_y), 1)
+    return count * (1 + density) * INDEXED_PALLET_SECONDS
+
+
+def collect_violations(solution_pallets, tasks, height_value, width_value, par_stacking=0, limit=100, metrics=None):
+    """
+    Finds all violations of a solution in one pass instead of stopping at the first one. The checks are the same as in
+    validate_solution; the stacking and the LIFO condition are checked with the indexes, so that the cost is about the
+    same as for a feasible solution. The first record is the first violation of validate_solution with the indexed
+    engine.
+    :param solution_pallets: List of solution pallets or solution table (imported without pre-validation)
+    :param tasks: Dictionary of tasks (pallet types)
+    :param height_value: Height of the container
+    :param width_value: Width of the container
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param limit: Maximal number of reported violations
+    :param metrics: Metrics recorder for the times of the stages and the counters
+    :return: List of violation records (see get_violation_record)
+    """
+    metrics = metrics or NULL_METRICS
+    if isinstance(solution_pallets, SolutionTable):
+        solution_pallets = solution_pallets.get_pallets()
+    stages = [("check_count", lambda: find_count_violations(solution_pallets, tasks)),
+              ("check_dimensions", lambda: find_dimension_violations(solution_pallets)),
+              ("check_container_dimensions",
+               lambda: find_container_violations(solution_pallets, height_value, width_value)),
+              ("check_stacking", lambda: find_stacking_violations(solution_pallets, metrics)),
+              ("check_lifo", lambda: find_lifo_violations(solution_pallets, par_stacking, metrics))]
+    violations = []
+    for name, find in stages:
+        if len(violations) >= limit:
+            break
+        with metrics.stage(name):
+            violations.extend(itertools.islice(find(), limit - len(violations)))
+    metrics.count("violations", len(violations))
+    return [get_violation_record(i) for i in violations]
+
+
+def get_violation_record(exception):
+    """
+    Creates the record of a violation
+    :param exception: FeasibilityException of the violation
+    :return: Dictionary with the kind of the violation, the message and the involved pallets (tuples of order, x, y and
+    z)
+    """
+    return dict(violation=exception.violation, message=str(exception), pallets=exception.pallets)
+
+
+def crosscheck_engines(solution_pallets, par_stacking, message, metrics=None):
+    """
+    Checks stacking and LIFO with the reference engine and compares the result with the one of the optimized engine
+    :param solution_pallets: List of solution pallets
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param message: Message of the first violation of the optimized engine or None, if it found no violation
+    :param metrics: Metrics recorder for the times of the stages
+    """
+    metrics = metrics or NULL_METRICS
+    with metrics.stage("crosscheck"):
+        try:
+            check_stacking(solution_pallets, metrics, "reference")
+            check_lifo(solution_pallets, par_stacking, metrics, "reference")
+            expected = None
+        except FeasibilityException as e:
+            expected = str(e)
+        if expected != message:
+            raise EngineMismatchException("Abweichung zwischen der Referenz und der optimierten Engine. Referenz: %s "
+                                          "Optimiert: %s" % (expected or "zulässig", message or "zulässig"))
+
+
+def check_count(solution_pallets, tasks):
+    """
+    This function checks, if the quantity of pallet types in the solution is equal to the required number in tasks
+    :param solution_pallets: List of solution pallets or solution table
+    :param tasks: Dictionary of tasks (Pallet types)
+    """
+    if isinstance(solution_pallets, SolutionTable):
+        counts = np.bincount(solution_pallets.type_index, minlength=len(solution_pallets.task_table)).tolist()
+        positions = {order: position for position, order in enumerate(solution_pallets.task_table.tasks)}
+        for key in tasks:
+            used_pallets = counts[positions[key]] if key in positions else 0
+            if tasks[key].quantity != used_pallets:
+                raise FeasibilityException(
+                    "Die Anzahl der Paletten von Order %s beträgt %s. Es ist jedoch die Anzahl %s gefordert." %
+                    (key, used_pallets, tasks[key].quantity), "count")
+        return
+    for violation in find_count_violations(solution_pallets, tasks):
+        raise violation
+
+
+def find_count_violations(solution_pallets, tasks):
+    """
+    Finds all pallet types, whose quantity in the solution differs from the required number
+    :param solution_pallets: List of solution pallets
+    :param tasks: Dictionary of tasks (Pallet types)
+    :return: Generator of the violations (FeasibilityException) in the order of the tasks
+    """
+    counts = collections.Counter(i.type.order for i in solution_pallets)
+    for key in tasks:
+        if tasks[key].quantity != counts[key]:
+            yield FeasibilityException(
+                "Die Anzahl der Paletten von Order %s beträgt %s. Es ist jedoch die Anzahl %s gefordert." %
+                (key, counts[key], tasks[key].quantity), "count")
 
 
 def check_dimensions(solution_pallets):
     """
     All pallets have to be validated regarding their dimensions
-    :param solution_pallets: List of solution pallets.
+    :param solution_pallets: List of solution pallets or solution table.
+    """
+    if isinstance(solution_pallets, SolutionTable):
+        check_dimensions_table(solution_pallets)
+        return
+    for violation in find_dimension_violations(solution_pallets):
+        raise violation
+
+
+def find_dimension_violations(solution_pallets):
+    """
+    Finds all pallets with a forbidden rotation or wrong dimensions
+    :param solution_pallets: List of solution pallets
+    :return: Generator of the violations (FeasibilityException) in the order of the solution
     """
     for pallet in solution_pallets:
-        if not pallet.validate_dimension():
-            raise FeasibilityException("Die Palette im Startpunkt %s von Order %s besitzt falsche Dimensionen." %
-                                       (pallet.origin_point.coords[:], pallet.type.order))
+        try:
+            valid = pallet.validate_dimension()
+        except FeasibilityException as e:  # Forbidden rotation
+            yield e
+            continue
+        if not valid:
+            yield FeasibilityException("Die Palette im Startpunkt %s von Order %s besitzt falsche Dimensionen." %
+                                       (pallet.origin_point.coords[:], pallet.type.order), "dimensions",
+                                       [pallet.as_tuple()])
+
+
+def check_dimensions_table(solution_table):
+    """
+    Vectorized version of check_dimensions for the columnar representation. The first pallet with a forbidden rotation
+    or wrong dimensions is reported.
+    :param solution_table: Solution table
+    """
+    task_table = solution_table.task_table
+    type_length = task_table.length[solution_table.type_index]
+    type_width = task_table.width[solution_table.type_index]
+    type_height = task_table.height[solution_table.type_index]
+    # Same conditions as SolutionPallet.validate_rotation and SolutionPallet.validate_dimension:
+    rotated = (solution_table.length == type_width) & (solution_table.width == type_length)
+    wrong_rotation = rotated & ~task_table.turning_allowed[solution_table.type_index]
+    wrong_dimension = (solution_table.height != type_height) | \
+        (~rotated & ((solution_table.length != type_length) | (solution_table.width != type_width)))
+    invalid = wrong_rotation | wrong_dimension
+    if invalid.any():
+        position = int(np.argmax(invalid))
+        if wrong_rotation[position]:
+            raise FeasibilityException(
+                "Die Palette im Startpunkt %s von Order %s wurde unzulässigerweise gedreht." % (
+                    solution_table.get_origin_coords(position), int(solution_table.order[position])), "rotation",
+                [solution_table.as_tuple(position)])
+        raise FeasibilityException("Die Palette im Startpunkt %s von Order %s besitzt falsche Dimensionen." %
+                                   (solution_table.get_origin_coords(position), int(solution_table.order[position])),
+                                   "dimensions", [solution_table.as_tuple(position)])
 
 
 def check_container_dimensions(solution_pallets, width_value, height_value):
     """
     All pallets have to fit into the container
+    :param solution_pallets: List of solution pallets or solution table
+    :param width_value: Width of the container
+    :param height_value: Height of the container
+    """
+    if isinstance(solution_pallets, SolutionTable):
+        extends = (solution_pallets.y + solution_pallets.width > width_value) | \
+                  (solution_pallets.z + solution_pallets.height > height_value)
+        if extends.any():
+            position = int(np.argmax(extends))
+            raise FeasibilityException("Die Palette im Startpunkt %s von Order %s überschreitet die Container "
+                                       "Dimensionen."
+                                       % (solution_pallets.get_origin_coords(position),
+                                          int(solution_pallets.order[position])), "container",
+                                       [solution_pallets.as_tuple(position)])
+        return
+    for violation in find_container_violations(solution_pallets, width_value, height_value):
+        raise violation
+
+
+def find_container_violations(solution_pallets, width_value, height_value):
+    """
+    Finds all pallets, which do not fit into the container
     :param solution_pallets: List of solution pallets
     :param width_value: Width of the container
     :param height_value: Height of the container
+    :return: Generator of the violations (FeasibilityException) in the order of the solution
     """
     for pallet in solution_pallets:
         if pallet.extends_width(width_value) or pallet.extends_height(height_value):
-            raise FeasibilityException("Die Palette im Startpunkt %s von Order %s überschreitet die Container "
+            yield FeasibilityException("Die Palette im Startpunkt %s von Order %s überschreitet die Container "
                                        "Dimensionen."
-                                       % (pallet.origin_point.coords[:], pallet.type.order))
+                                       % (pallet.origin_point.coords[:], pallet.type.order), "container",
+                                       [pallet.as_tuple()])
 
 
-def check_stacking(solution_pallets):
+def check_stacking(solution_pallets, metrics=None, engine="auto", positions=None, jobs=1):
     """
     Checks the stacking of all pallets
     :param solution_pallets: List of solution pallets
+    :param metrics: Metrics recorder for the counters
+    :param engine: One of ENGINES except crosscheck
+    :param positions: Ascending positions of the pallets to check or None for all pallets; the other pallets are only
+    used as neighbours
+    :param jobs: Number of worker processes for large solutions (see check_stacking_parallel)
+    """
+    metrics = metrics or NULL_METRICS
+    if engine == "reference":
+        return check_stacking_reference(solution_pallets, metrics)
+    if jobs > 1 and positions is None and np is not None and len(solution_pallets) >= PARALLEL_STACKING_PALLETS:
+        return check_stacking_parallel(solution_pallets, jobs, metrics, engine)
+    if use_blocked_kernel(solution_pallets, engine):
+        return check_stacking_blocked(solution_pallets, metrics, positions)
+    for violation in find_stacking_violations(solution_pallets, metrics, positions):
+        raise violation
+
+
+def find_stacking_violations(solution_pallets, metrics=None, positions=None):
+    """
+    Finds all overlapping pallets and all wrongly stacked pallets with the base area index. Every pallet is tested
+    against all its candidates like in check_stacking_reference (overlaps_height only looks upwards, so that an overlap
+    may only be found from one of both pallets); a pair, which was already reported, is not reported again. Therefore,
+    the first violation is the same as in check_stacking.
+    :param solution_pallets: List of solution pallets
+    :param metrics: Metrics recorder for the counters
+    :param positions: Ascending positions of the pallets to check or None for all pallets
+    :return: Generator of the violations (FeasibilityException)
+    """
+    metrics = metrics or NULL_METRICS
+    index = BaseAreaIndex(solution_pallets)
+    reported = set()
+    for pallet in solution_pallets if positions is None else [solution_pallets[i] for i in positions]:
+        metrics.check_deadline("check_stacking")
+        # All pallets, which have a overlap in the base area should not overlaps in the height:
+        candidates = index.get_candidates(pallet)
+        pallets_same_base_area = [i for i in filter(lambda item: pallet.overlaps_base_area(item), candidates)]
+        metrics.count("stacking_pair_tests", len(candidates))
+        for other_pallet in pallets_same_base_area:
+            pair = frozenset((id(pallet), id(other_pallet)))
+            if pair not in reported and pallet.overlaps_height(other_pallet):
+                reported.add(pair)
+                yield FeasibilityException(
+                    "Die Paletten in Startpunkt %s Order: %s und %s  Order: %s überschneiden sich." %
+                    (pallet.origin_point.coords[:], pallet.type.order,
+                     other_pallet.origin_point.coords[:], other_pallet.type.order), "overlap",
+                    [pallet.as_tuple(), other_pallet.as_tuple()])
+        # If the current pallet is not on the ground of the container, it needs a stackable base area:
+        if pallet.z > 0:
+            if not pallet.is_stackable():
+                yield FeasibilityException(
+                    "Die Palette in Startpunkt %s von Order %s wurde unzulässigerweise gestapelt."
+                    % (pallet.origin_point.coords[:], pallet.type.order), "stacking", [pallet.as_tuple()])
+                continue
+            area_for_stack = [i.get_base_area_bounds() for i in
+                              filter(lambda item: pallet.z == item.get_maxz() and item.is_stackable(),
+                                     pallets_same_base_area)]
+            # Base area of current pallet must be completely overlapped
+            metrics.count("stacking_coverage_tests")
+            if not covers_rectangle(area_for_stack, pallet.get_base_area_bounds()):
+                yield FeasibilityException("Die Palette in Startpunkt %s von Order %s wurde falsch gestapelt." %
+                                           (pallet.origin_point.coords[:], pallet.type.order), "stacking",
+                                           [pallet.as_tuple()])
+
+
+def check_lifo(solution_pallets, par_stacking, metrics=None, engine="auto"):
+    """
+    Checks the accessibility for unloading all pallets according to the LIFO condition (Lowest order number at first)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param solution_pallets: List of solution pallets
+    :param metrics: Metrics recorder for the counters
+    :param engine: One of ENGINES except crosscheck
+    """
+    metrics = metrics or NULL_METRICS
+    if engine == "reference":
+        return check_lifo_reference(solution_pallets, par_stacking, metrics)
+    if use_blocked_kernel(solution_pallets, engine):
+        return check_lifo_blocked(solution_pallets, par_stacking, metrics)
+    for violation in find_lifo_violations(solution_pallets, par_stacking, metrics):
+        raise violation
+
+
+def find_lifo_violations(solution_pallets, par_stacking, metrics=None):
+    """
+    Finds all pallets, which are blocked according to the LIFO condition, with the indexes. Every blocked pallet is
+    reported once with the first pallet blocking it.
+    :param solution_pallets: List of solution pallets
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the counters
+    :return: Generator of the violations (FeasibilityException) in the order of unloading
+    """
+    metrics = metrics or NULL_METRICS
+    # Only the remaining pallets in front of or on top of a pallet can block it:
+    base_area_index = BaseAreaIndex(solution_pallets)
+    front_face_index = FrontFaceIndex(solution_pallets)
+    for pallets_to_unload in get_unload_batches(solution_pallets):
+        # Check for accessibility: All pallets to unload must be checked, if there is no pallet on top,
+        # directly in front or in a lower layer in front
+        metrics.count("lifo_unload_batches")
+        for position in pallets_to_unload:
+            metrics.check_deadline("check_lifo")
+            pallet = solution_pallets[position]
+            candidates = front_face_index.get_candidates(pallet, par_stacking)
+            candidates.update(i for i in base_area_index.get_positions(pallet) if front_face_index.remaining[i])
+            metrics.count("lifo_blocking_tests", len(candidates))
+            for other_pallet in [solution_pallets[i] for i in sorted(candidates)]:
+                if pallet.is_other_pallet_stacked(other_pallet) or pallet.is_other_pallet_in_front(other_pallet,
+                                                                                                   par_stacking):
+                    yield FeasibilityException(
+                        "Palette im Punkt %s von Order %s wird von der Palette %s von Order %s gemäß LIFO verdeckt." %
+                        (pallet.origin_point.coords[:], pallet.type.order, other_pallet.origin_point.coords[:],
+                         other_pallet.type.order), "lifo", [pallet.as_tuple(), other_pallet.as_tuple()])
+                    break
+            front_face_index.remove(position)
+
+
+def use_blocked_kernel(solution_pallets, engine="auto"):
+    """
+    Decides, if the blocked pair kernels are used instead of the indexes. For mid-size solutions the vectorized
+    evaluation of all pairs is faster than the index with its overhead per pallet. The kernels need pallets with a
+    positive size; otherwise the indexes are used in any case.
+    :param solution_pallets: List of solution pallets
+    :param engine: indexed, vectorized or auto (the choice depends on the number of pallets)
+    :return: True, if the blocked pair kernels are used
     """
+    if engine not in ("indexed", "vectorized", "auto"):
+        raise ValueError("Unbekannte Engine: %s" % engine)
+    if engine == "vectorized" and np is None:
+        raise ImportError("Für die Engine vectorized wird numpy benötigt.")
+    if engine == "indexed" or np is None or (engine == "auto" and len(solution_pallets) not in BLOCKED_KERNEL_PALLETS):
+        return False
+    return all(i.length > 0 and i.width > 0 and i.height > 0 for i in solution_pallets)
+
+
+def check_stacking_reference(solution_pallets, metrics=None):
+    """
+    Reference implementation of check_stacking: every pair of pallets is tested with the Shapely predicates and the
+    coverage of a stacked pallet is checked with the union of the supporting base areas
+    :param solution_pallets: List of solution pallets
+    :param metrics: Metrics with the time budget; nothing is recorded
+    """
+    metrics = metrics or NULL_METRICS
     for pallet in solution_pallets:
+        metrics.check_deadline("check_stacking")
         # All pallets, which have a overlap in the base area should not overlaps in the height:
         pallets_same_base_area = [i for i in filter(lambda item: pallet.overlaps_base_area(item), solution_pallets)]
         for other_pallet in pallets_same_base_area:
@@ -365,30 +2522,36 @@ def check_stacking(solution_pallets):
                 raise FeasibilityException(
                     "Die Paletten in Startpunkt %s Order: %s und %s  Order: %s überschneiden sich." %
                     (pallet.origin_point.coords[:], pallet.type.order,
-                     other_pallet.origin_point.coords[:], other_pallet.type.order))
+                     other_pallet.origin_point.coords[:], other_pallet.type.order), "overlap",
+                    [pallet.as_tuple(), other_pallet.as_tuple()])
         # If the current pallet is not on the ground of the container, it needs a stackable base area:
         if pallet.origin_point.z > 0:
             if not pallet.is_stackable():
                 raise FeasibilityException(
                     "Die Palette in Startpunkt %s von Order %s wurde unzulässigerweise gestapelt."
-                    % (pallet.origin_point.coords[:], pallet.type.order))
+                    % (pallet.origin_point.coords[:], pallet.type.order), "stacking", [pallet.as_tuple()])
             area_for_stack = [i.base_area for i in
                               filter(lambda item: pallet.origin_point.z == item.get_maxz() and item.is_stackable(),
                                      pallets_same_base_area)]
             # Base area of current pallet must be completely overlapped
-            if not cascaded_union(area_for_stack).contains(pallet.base_area):
+            if not unary_union(area_for_stack).contains(pallet.base_area):
                 raise FeasibilityException("Die Palette in Startpunkt %s von Order %s wurde falsch gestapelt." %
-                                           (pallet.origin_point.coords[:], pallet.type.order))
+                                           (pallet.origin_point.coords[:], pallet.type.order), "stacking",
+                                           [pallet.as_tuple()])
 
 
-def check_lifo(solution_pallets, par_stacking):
+def check_lifo_reference(solution_pallets, par_stacking, metrics=None):
     """
-    Checks the accessibility for unloading all pallets according to the LIFO condition (Lowest order number at first)
-    :param par_stacking: Parameter for accessibility of stacked pallets
+    Reference implementation of check_lifo: the pallets to unload are determined again after every unloading and are
+    tested against all remaining pallets
     :param solution_pallets: List of solution pallets
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics with the time budget; nothing is recorded
     """
+    metrics = metrics or NULL_METRICS
     remaining_pallets = solution_pallets.copy()
     while len(remaining_pallets) > 0:
+        metrics.check_deadline("check_lifo")
         # Pallets must be sorted by order (ASC), maximal x coordinate (DESC) and maximal z coordinate (DESC)
         # current Pallets to unload are the first entry of the sorting
         min_group = min([i.type.group for i in remaining_pallets])
@@ -406,17 +2569,568 @@ def check_lifo(solution_pallets, par_stacking):
                     raise FeasibilityException(
                         "Palette im Punkt %s von Order %s wird von der Palette %s von Order %s gemäß LIFO verdeckt." %
                         (pallet.origin_point.coords[:], pallet.type.order, other_pallet.origin_point.coords[:],
-                         other_pallet.type.order))
+                         other_pallet.type.order), "lifo", [pallet.as_tuple(), other_pallet.as_tuple()])
             remaining_pallets.remove(pallet)
 
 
+def check_stacking_blocked(solution_pallets, metrics=None, positions=None):
+    """
+    Same as check_stacking, but the pairs are evaluated with the blocked pair kernels; the first violation is the same
+    :param solution_pallets: List of solution pallets
+    :param metrics: Metrics recorder for the counters
+    :param positions: Ascending positions of the pallets to check or None for all pallets
+    """
+    metrics = metrics or NULL_METRICS
+    kernel = BlockedPairKernel(solution_pallets)
+    for rows in kernel.get_blocks(kernel.positions if positions is None else np.asarray(positions, dtype=np.int64)):
+        metrics.check_deadline("check_stacking")
+        same_base_area = kernel.overlaps_base_area(rows)
+        overlapping = same_base_area & kernel.overlaps_height(rows)
+        metrics.count("stacking_pair_tests", same_base_area.size)
+        hits = np.flatnonzero(overlapping.any(axis=1))
+        first_hit = hits[0] if len(hits) else len(rows)
+        # The stacking of the pallets before the first overlapping pallet is checked in the order of the solution:
+        for row in np.flatnonzero(kernel.z[rows[:first_hit]] > 0):
+            pallet = solution_pallets[rows[row]]
+            if not pallet.is_stackable():
+                raise FeasibilityException(
+                    "Die Palette in Startpunkt %s von Order %s wurde unzulässigerweise gestapelt."
+                    % (pallet.origin_point.coords[:], pallet.type.order), "stacking", [pallet.as_tuple()])
+            supporting = same_base_area[row] & (kernel.maxz == pallet.z) & kernel.stackable
+            metrics.count("stacking_coverage_tests")
+            if not covers_rectangle([kernel.get_base_area_bounds(i) for i in np.flatnonzero(supporting)],
+                                    pallet.get_base_area_bounds()):
+                raise FeasibilityException("Die Palette in Startpunkt %s von Order %s wurde falsch gestapelt." %
+                                           (pallet.origin_point.coords[:], pallet.type.order), "stacking",
+                                           [pallet.as_tuple()])
+        if first_hit < len(rows):
+            pallet = solution_pallets[rows[first_hit]]
+            other_pallet = solution_pallets[int(np.argmax(overlapping[first_hit]))]
+            raise FeasibilityException(
+                "Die Paletten in Startpunkt %s Order: %s und %s  Order: %s überschneiden sich." %
+                (pallet.origin_point.coords[:], pallet.type.order,
+                 other_pallet.origin_point.coords[:], other_pallet.type.order), "overlap",
+                [pallet.as_tuple(), other_pallet.as_tuple()])
+
+
+def check_stacking_parallel(solution_pallets, jobs, metrics=None, engine="auto"):
+    """
+    Checks the stacking of a large solution in worker processes. The pallets are split along the x axis into slabs
+    (see get_stacking_slabs); every slab also contains the pallets of its halo, so that the stacking of its own pallets
+    can be checked independently. As the check of a pallet only depends on its neighbours, the first violation in the
+    order of the solution is the violation of the pallet with the lowest position; it is checked again serially, so
+    that the exception is exactly the same as the one of check_stacking.
+    :param solution_pallets: List of solution pallets
+    :param jobs: Number of worker processes
+    :param metrics: Metrics recorder for the counters
+    :param engine: indexed, vectorized or auto; it is used for every slab
+    """
+    metrics = metrics or NULL_METRICS
+    slabs = list(get_stacking_slabs(solution_pallets, jobs * 4))
+    metrics.count("stacking_slabs", len(slabs))
+    # Every worker checks the remaining time budget cooperatively, so that all workers stop at the deadline
+    time_budget = metrics.get_remaining_time()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(find_stacking_violation, [solution_pallets[i] for i in members], owned, engine,
+                                   time_budget=time_budget) for members, owned in slabs]
+        try:
+            violations = [int(members[future.result()]) for (members, _), future in zip(slabs, futures)
+                          if future.result() is not None]
+        except TimeBudgetException as e:
+            for future in futures:  # Slabs, which were not started yet, are skipped
+                future.cancel()
+            metrics.check_deadline("check_stacking")  # Same message as in the serial check
+            raise e
+    metrics.check_deadline("check_stacking")
+    if violations:
+        check_stacking(solution_pallets, metrics, engine, [min(violations)])
+        # Only reached, if the slabs and the serial check disagree:
+        check_stacking(solution_pallets, metrics, engine)
+
+
+def get_stacking_slabs(solution_pallets, count):
+    """
+    Splits the pallets into slabs along the x axis. Every slab owns about the same number of pallets (ordered by their
+    minimal x coordinate) and contains all pallets, whose base area reaches into the x range of the owned pallets.
+    :param solution_pallets: List of solution pallets
+    :param count: Maximal number of slabs
+    :return: Generator of tuples of the positions of all pallets of a slab (ascending) and the positions of the owned
+    pallets in the slab (ascending)
+    """
+    min_x = np.array([i.x for i in solution_pallets], dtype=np.int64)
+    max_x = min_x + np.array([i.length for i in solution_pallets], dtype=np.int64)
+    for owned in np.array_split(np.argsort(min_x, kind="stable"), count):
+        if len(owned) == 0:
+            continue
+        members = np.union1d(np.flatnonzero((max_x > min_x[owned].min()) & (min_x < max_x[owned].max())), owned)
+        yield members, np.searchsorted(members, np.sort(owned))
+
+
+def find_stacking_violation(slab_pallets, owned, engine="auto", metrics=None, time_budget=None):
+    """
+    Checks the stacking of the owned pallets of a slab (e.g. in a worker process)
+    :param slab_pallets: List of the solution pallets of the slab in the order of the solution
+    :param owned: Ascending positions of the owned pallets in the slab
+    :param engine: indexed, vectorized or auto
+    :param metrics: Metrics recorder for the counters and the time budget
+    :param time_budget: Remaining time budget in seconds, if no metrics are given (in a worker process), or None
+    :return: Position (in the slab) of the first owned pallet, which violates the stacking, or None
+    """
+    try:
+        check_stacking(slab_pallets, metrics or Metrics(time_budget), engine, owned)
+    except FeasibilityException as e:
+        # The first pallet of the violation is the checked one; if several pallets are equal, the first one is checked
+        # first, because it overlaps the others
+        return next((int(i) for i in owned if slab_pallets[i].as_tuple() == e.pallets[0]), int(owned[0]))
+    return None
+
+
+def check_lifo_blocked(solution_pallets, par_stacking, metrics=None):
+    """
+    Same as check_lifo, but the pairs are evaluated with the blocked pair kernels; the first violation is the same
+    :param solution_pallets: List of solution pallets
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the counters
+    """
+    metrics = metrics or NULL_METRICS
+    kernel = BlockedPairKernel(solution_pallets)
+    batches = list(get_unload_batches(solution_pallets))
+    metrics.count("lifo_unload_batches", len(batches))
+    # A pallet can only be blocked by the pallets, which are unloaded after it:
+    sequence = np.array([i for batch in batches for i in batch], dtype=np.int64)
+    rank = np.empty(len(sequence), dtype=np.int64)
+    rank[sequence] = np.arange(len(sequence))
+    for rows in kernel.get_blocks(sequence):
+        metrics.check_deadline("check_lifo")
+        blocking = (rank > rank[rows, None]) & (kernel.is_other_pallet_stacked(rows) |
+                                                kernel.is_other_pallet_in_front(rows, par_stacking))
+        metrics.count("lifo_blocking_tests", blocking.size)
+        hits = np.flatnonzero(blocking.any(axis=1))
+        if len(hits):
+            pallet = solution_pallets[rows[hits[0]]]
+            other_pallet = solution_pallets[int(np.argmax(blocking[hits[0]]))]
+            raise FeasibilityException(
+                "Palette im Punkt %s von Order %s wird von der Palette %s von Order %s gemäß LIFO verdeckt." %
+                (pallet.origin_point.coords[:], pallet.type.order, other_pallet.origin_point.coords[:],
+                 other_pallet.type.order), "lifo", [pallet.as_tuple(), other_pallet.as_tuple()])
+
+
+def get_unload_batches(solution_pallets):
+    """
+    Orders the pallets once by group (ASC), maximal x coordinate (DESC) and maximal z coordinate (DESC). Pallets with
+    the same sorting key are unloaded together.
+    :param solution_pallets: List of solution pallets
+    :return: Generator of lists with the positions (in the solution) of the pallets to unload
+    """
+    def unload_key(position):
+        pallet = solution_pallets[position]
+        return pallet.type.group, -pallet.get_maxx(), -pallet.get_maxz()
+
+    # The sorting is stable, so the pallets of one batch keep the order of the solution
+    ordered = sorted(range(len(solution_pallets)), key=unload_key)
+    for _, batch in itertools.groupby(ordered, key=unload_key):
+        yield list(batch)
+
+
+def check_solution_out_of_core(solution, container_data, par_stacking=0, metrics=None, window=None, run_size=None,
+                               directory=None):
+    """
+    Validates a solution, which does not fit into the memory. A csv file is parsed and pre-validated chunk by chunk and
+    spilled to a temporary file (see spill_solution_chunks); a binary file is used directly. Only windows of
+    pallets are loaded from the memory map, so that the peak memory depends on the window size and not on the number
+    of pallets (see validate_out_of_core). The result is the same as the one of check_solution_file.
+    :param solution: Path of the solution file (csv or binary)
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the times of the stages and the counters
+    :param window: Number of pallets per window or None for OUT_OF_CORE_WINDOW
+    :param run_size: Maximal number of rows per sorted run of the external sort or None for OUT_OF_CORE_RUN
+    :param directory: Directory for the temporary files or None for the default temporary directory
+    :return: Dictionary with the verdict (feasible), the message and the minimal container length
+    """
+    if np is None:
+        raise ImportError("Für die Überprüfung außerhalb des Arbeitsspeichers wird numpy benötigt.")
+    try:
+        with tempfile.TemporaryDirectory(dir=directory) as temporary_directory:
+            minimal_length = validate_out_of_core(solution, container_data, par_stacking, metrics or NULL_METRICS,
+                                                  window or OUT_OF_CORE_WINDOW, run_size or OUT_OF_CORE_RUN,
+                                                  temporary_directory)
+        return {"feasible": True, "message": None, "minimal_length": minimal_length}
+    except (FeasibilityException, DataException) as e:
+        return {"feasible": False, "message": str(e), "minimal_length": None}
+    except TimeBudgetException as e:
+        return {"feasible": None, "message": str(e), "minimal_length": None, "timed_out": True}
+
+
+def validate_out_of_core(solution, container_data, par_stacking, metrics, window, run_size, directory):
+    """
+    Validates a solution out of core in four passes over the memory map:
+
+    1. The count, the dimensions and the container dimensions are checked chunk by chunk (scan_out_of_core).
+    2. The pallets are sorted externally by x; overlaps, stacking and pallets on top of a pallet to unload are checked
+       in windows along the x axis (sweep_out_of_core).
+    3. The pallets are sorted externally by group, maximal x (DESC) and maximal z (DESC), i.e. in the unloading order
+       of get_unload_batches; pallets in front of a pallet to unload are found in reverse unloading order with grids
+       over the front faces (sweep_front_faces).
+    4. For the first blocked pallet the first blocking pallet is searched in a linear pass (raise_out_of_core_blocker).
+
+    The grids of pass 3 grow with the number of different y and z coordinates, which is bounded by the container,
+    but not with the number of pallets. A window contains the pallets reaching into its x range, so that its size
+    grows with the density of the pallets.
+    :param solution: Path of the solution file (csv or binary)
+    :param container_data: List of container width, container height and a Dictionary of all tasks (pallet types)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the times of the stages and the counters
+    :param window: Number of pallets per window
+    :param run_size: Maximal number of rows per sorted run of the external sort
+    :param directory: Directory for the temporary files
+    :return: Minimal container length
+    """
+    width, height, tasks = container_data
+    task_table = TaskTable(tasks)
+    with metrics.stage("import_solution"):
+        if is_binary_solution(solution):
+            try:
+                rows = load_binary_solution(solution)
+            except ValueError as e:
+                raise DataException(str(e))
+        else:
+            # The rows are pre-validated like in check_solution_file, while they are spilled to temporary files
+            rows = spill_solution_chunks(directory, prevalidate_chunks(read_solution_chunks(solution), tasks, width,
+                                                                       height), metrics)
+        max_length, max_x, y_coords, z_coords = scan_out_of_core(rows, task_table, width, height, window, metrics)
+    if len(rows) == 0:  # An empty solution with correct counts is feasible (see calculate_minimal_container_length)
+        return 0.0
+    with metrics.stage("check_stacking"):
+        sorted_x = sort_external(len(rows), lambda start, stop: [get_out_of_core_table(rows[start:stop], task_table).x],
+                                 run_size, directory, "x", metrics, "check_stacking")
+        first_stacking, first_blocked = sweep_out_of_core(rows, task_table, sorted_x, max_length, metrics, window)
+        if first_stacking is not None:
+            raise first_stacking
+    with metrics.stage("check_lifo"):
+        sequence = sort_external(len(rows), lambda start, stop: get_sequence_keys(get_out_of_core_table(
+            rows[start:stop], task_table)), run_size, directory, "sequence", metrics, "check_lifo")
+        blocked = sweep_front_faces(rows, task_table, sequence, y_coords, z_coords, par_stacking, metrics, window)
+        if blocked is not None:
+            key = tuple(int(i[blocked]) for i in sequence)
+            first_blocked = key if first_blocked is None else min(first_blocked, key)
+        if first_blocked is not None:
+            raise_out_of_core_blocker(rows, task_table, first_blocked, par_stacking, window, metrics)
+    return float(max_x)
+
+
+class SpilledColumns:
+    """
+    Columns of a solution, which was spilled to temporary files in the out-of-core mode. Every column is stored in its
+    own file of 64 bit integers, as csv files may contain coordinates, which do not fit into the 32 bit integers of
+    binary solution files. Indexing returns the selected rows as Dictionary of the columns like the fields of a
+    structured array.
+    """
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns[COLUMNS[0]])
+
+    def __getitem__(self, index):
+        return {name: column[index] for name, column in self.columns.items()}
+
+
+def spill_solution_chunks(directory, chunks, metrics=None):
+    """
+    Writes the chunks of a csv solution column by column to temporary files (see SpilledColumns)
+    :param directory: Directory for the temporary files
+    :param chunks: Iterable of chunks; every chunk is a tuple of the columns (order, x, y, z, turned)
+    :param metrics: Metrics recorder for the time budget
+    :return: Spilled columns as memory maps
+    """
+    metrics = metrics or NULL_METRICS
+    files = [os.path.join(directory, "column_%s.bin" % i) for i in COLUMNS]
+    count = 0
+    with ExitStack() as stack:
+        outputs = [stack.enter_context(open(i, 'wb')) for i in files]
+        for chunk in chunks:
+            metrics.check_deadline("import_solution")
+            try:
+                columns = [np.asarray(i, dtype="<i8") for i in chunk]
+            except OverflowError:
+                raise DataException("Die Werte der Lösung überschreiten den Wertebereich von 64-Bit-Ganzzahlen; sie "
+                                    "kann nicht außerhalb des Arbeitsspeichers überprüft werden.")
+            for output, column in zip(outputs, columns):
+                output.write(column.tobytes())
+            count += len(chunk[0])
+    if count == 0:  # A memory map must not be empty
+        return SpilledColumns({name: np.zeros(0, dtype="<i8") for name in COLUMNS})
+    return SpilledColumns({name: np.memmap(file, dtype="<i8", mode='r', shape=(count,))
+                           for name, file in zip(COLUMNS, files)})
+
+
+def get_out_of_core_table(rows, task_table):
+    """
+    Creates the solution table of rows of a binary solution file
+    :param rows: Structured array of rows (see binary_solution.DTYPE)
+    :param task_table: Task table
+    :return: Solution table
+    """
+    try:
+        return SolutionTable(task_table, rows["order"], rows["x"], rows["y"], rows["z"], rows["turned"])
+    except KeyError as e:
+        raise DataException("Unbekannte Order: %s" % e.args[0])
+
+
+def get_sequence_keys(solution_table, positions=None):
+    """
+    Get the keys of the unloading order of get_unload_batches: group, maximal x (DESC), maximal z (DESC) and position
+    :param solution_table: Solution table
+    :param positions: Positions of the pallets of the table in the solution or None, if the table is not sorted
+    :return: List of the keys as arrays; without positions the position is not included
+    """
+    keys = [solution_table.task_table.group[solution_table.type_index],
+            -(solution_table.x + solution_table.length), -(solution_table.z + solution_table.height)]
+    return keys if positions is None else keys + [np.asarray(positions, dtype=np.int64)]
+
+
+def is_later_in_sequence(keys, reference_keys):
+    """
+    Compares keys of the unloading order lexicographically (see get_sequence_keys)
+    :param keys: Keys of the other pallets as arrays
+    :param reference_keys: Keys of the reference pallets as scalars or as arrays, which are broadcast against the keys
+    :return: Boolean array: True, if the other pallet is unloaded after the reference pallet
+    """
+    later, equal = False, True
+    for key, reference in zip(keys, reference_keys):
+        later = later | (equal & (key > reference))
+        equal = equal & (key == reference)
+    return later
+
+
+def scan_out_of_core(rows, task_table, width_value, height_value, chunk_size, metrics=None):
+    """
+    Checks the count, the dimensions and the container dimensions chunk by chunk; the reported violation is the same as
+    in validate_solution
+    :param rows: Memory map of the rows of the solution
+    :param task_table: Task table
+    :param width_value: Width of the container
+    :param height_value: Height of the container
+    :param chunk_size: Number of rows per chunk
+    :param metrics: Metrics recorder for the time budget
+    :return: Tuple of the maximal pallet length, the maximal x coordinate and the sorted y and z coordinates of the
+    corners of the front faces
+    """
+    metrics = metrics or NULL_METRICS
+    counts = np.zeros(len(task_table), dtype=np.int64)
+    first_violations = [None, None]  # Dimensions and container dimensions
+    max_length = max_x = 0
+    y_coords = z_coords = np.zeros(0, dtype=np.int64)
+    for start in range(0, len(rows), chunk_size):
+        metrics.check_deadline("import_solution")
+        table = get_out_of_core_table(rows[start:start + chunk_size], task_table)
+        counts += np.bincount(table.type_index, minlength=len(task_table))
+        for index, check in enumerate([lambda: check_dimensions(table),
+                                       lambda: check_container_dimensions(table, width_value, height_value)]):
+            if first_violations[index] is None:
+                try:
+                    check()
+                except FeasibilityException as e:
+                    first_violations[index] = e
+        if (table.length <= 0).any() or (table.width <= 0).any() or (table.height <= 0).any():
+            raise DataException("Für die Überprüfung außerhalb des Arbeitsspeichers werden Paletten mit positiven "
+                                "Maßen benötigt.")
+        max_length = max(max_length, int(table.length.max()))
+        max_x = max(max_x, int((table.x + table.length).max()))
+        y_coords = np.union1d(y_coords, np.concatenate([table.y, table.y + table.width]))
+        z_coords = np.union1d(z_coords, np.concatenate([table.z, table.z + table.height]))
+    for position, key in enumerate(task_table.tasks):
+        if task_table.tasks[key].quantity != counts[position]:
+            raise FeasibilityException(
+                "Die Anzahl der Paletten von Order %s beträgt %s. Es ist jedoch die Anzahl %s gefordert." %
+                (key, int(counts[position]), task_table.tasks[key].quantity), "count")
+    for violation in first_violations:
+        if violation is not None:
+            raise violation
+    return max_length, max_x, y_coords, z_coords
+
+
+def sort_external(count, get_keys, run_size, directory, name, metrics=None, stage=None):
+    """
+    Sorts the rows of a solution by keys with bounded memory (external merge sort): runs of rows are sorted in memory
+    and written to temporary files, then the runs are merged into one file per key
+    :param count: Number of rows
+    :param get_keys: Function, which returns the keys of the rows from start to stop as list of integer arrays (in the
+    order of priority)
+    :param run_size: Maximal number of rows per run
+    :param directory: Directory for the temporary files
+    :param name: Prefix of the temporary files
+    :param metrics: Metrics recorder for the counters and the time budget
+    :param stage: Name of the current stage for the message of the time budget
+    :return: List of memory mapped arrays of the sorted keys; the positions of the rows are appended as last key, so
+    that equal keys keep the order of the solution
+    """
+    metrics = metrics or NULL_METRICS
+    if count == 0:  # There are no runs; the keys of no rows give the number of keys
+        return [np.zeros(0, dtype=np.int64) for _ in range(len(get_keys(0, 0)) + 1)]
+    runs = []
+    for start in range(0, count, run_size):
+        metrics.check_deadline(stage)
+        stop = min(start + run_size, count)
+        keys = np.stack(list(get_keys(start, stop)) + [np.arange(start, stop, dtype=np.int64)], axis=1)
+        runs.append(os.path.join(directory, "%s_run_%s.npy" % (name, len(runs))))
+        np.save(runs[-1], keys[np.lexsort(keys.T[::-1])])
+    metrics.count("external_sort_runs", len(runs))
+    result = [np.lib.format.open_memmap(os.path.join(directory, "%s_%s.npy" % (name, i)), mode='w+', dtype=np.int64,
+                                        shape=(count,)) for i in range(np.load(runs[0], mmap_mode='r').shape[1])]
+    if len(runs) == 1:
+        run = np.load(runs[0], mmap_mode='r')
+        for column, array in zip(run.T, result):
+            array[:] = column
+        return result
+
+    def read_run(path, buffer_size=4096):
+        run = np.load(path, mmap_mode='r')
+        for offset in range(0, len(run), buffer_size):
+            yield from run[offset:offset + buffer_size].tolist()
+
+    merged = heapq.merge(*(read_run(i) for i in runs))
+    position = 0
+    for block in iter(lambda: list(itertools.islice(merged, run_size)), []):
+        metrics.check_deadline(stage)
+        for column, array in zip(np.array(block, dtype=np.int64).T, result):
+            array[position:position + len(block)] = column
+        position += len(block)
+    return result
+
+
+def sweep_out_of_core(rows, task_table, sorted_x, max_length, metrics, window):
+    """
+    Checks the stacking (like check_stacking) and the pallets stacked on top of a pallet to unload (like check_lifo)
+    in windows along the x axis. A window owns the next pallets in the order of x and contains all pallets, whose base
+    area reaches into the x range of the owned pallets; these are found by a binary search in the sorted x
+    coordinates, as no pallet is longer than the maximal pallet length.
+    :param rows: Memory map of the rows of the solution
+    :param task_table: Task table
+    :param sorted_x: Sorted x coordinates and positions (see sort_external)
+    :param max_length: Maximal length of a pallet
+    :param metrics: Metrics recorder for the counters
+    :param window: Number of owned pallets per window
+    :return: Tuple of the first stacking violation in the order of the solution (or None) and the unloading key of the
+    first pallet, on which a pallet to unload later is stacked (or None)
+    """
+    min_x, positions = sorted_x
+    first_stacking = first_blocked = None
+    stacking_position = len(rows)
+    for start in range(0, len(positions), window):
+        metrics.check_deadline("check_stacking")
+        metrics.count("out_of_core_windows")
+        owned = np.sort(positions[start:start + window])
+        owned_table = get_out_of_core_table(rows[owned], task_table)
+        low, high = int(owned_table.x.min()), int((owned_table.x + owned_table.length).max())
+        candidates = np.sort(positions[np.searchsorted(min_x, low - max_length, 'right'):
+                                       np.searchsorted(min_x, high, 'left')])
+        candidate_table = get_out_of_core_table(rows[candidates], task_table)
+        members = np.union1d(candidates[candidate_table.x + candidate_table.length > low], owned)
+        members_table = get_out_of_core_table(rows[members], task_table)
+        slab_pallets = members_table.get_pallets()
+        owned_local = np.searchsorted(members, owned)
+        violation = find_stacking_violation(slab_pallets, owned_local, metrics=metrics)
+        if violation is not None and members[violation] < stacking_position:
+            stacking_position = int(members[violation])
+            try:
+                check_stacking(slab_pallets, metrics, positions=[violation])
+            except FeasibilityException as e:
+                first_stacking = e
+        if first_stacking is not None:  # The LIFO condition is not checked any more
+            continue
+        kernel = BlockedPairKernel(slab_pallets)
+        keys = get_sequence_keys(members_table, members)
+        for block in kernel.get_blocks(owned_local):
+            blocked = kernel.is_other_pallet_stacked(block) & is_later_in_sequence(keys, [i[block, None] for i in keys])
+            for row in block[blocked.any(axis=1)]:
+                key = tuple(int(i[row]) for i in keys)
+                first_blocked = key if first_blocked is None else min(first_blocked, key)
+    return first_stacking, first_blocked
+
+
+def sweep_front_faces(rows, task_table, sequence, y_coords, z_coords, par_stacking, metrics, chunk_size):
+    """
+    Checks in reverse unloading order, if a pallet is blocked by a pallet in front of it, which is unloaded later (like
+    SolutionPallet.is_other_pallet_in_front). The maximal x coordinates of the pallets to unload later are kept in a
+    grid over the front faces (overlapping front faces) and in an array over the y coordinates of the origins (touching
+    front faces).
+    :param rows: Memory map of the rows of the solution
+    :param task_table: Task table
+    :param sequence: Sorted unloading keys and positions (see sort_external)
+    :param y_coords: Sorted y coordinates of the corners of all front faces
+    :param z_coords: Sorted z coordinates of the corners of all front faces
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param metrics: Metrics recorder for the counters
+    :param chunk_size: Number of pallets, which are loaded at once
+    :return: Index (in the unloading order) of the first blocked pallet or None
+    """
+    lowest = np.iinfo(np.int64).min
+    front = np.full((max(len(y_coords) - 1, 1), max(len(z_coords) - 1, 1)), lowest, dtype=np.int64)
+    touch = np.full(max(len(y_coords), 1), lowest, dtype=np.int64)
+    positions = sequence[-1]
+    first_blocked = None
+    for stop in range(len(positions), 0, -chunk_size):
+        metrics.check_deadline("check_lifo")
+        start = max(0, stop - chunk_size)
+        table = get_out_of_core_table(rows[positions[start:stop]], task_table)
+        min_y, max_y = np.searchsorted(y_coords, table.y), np.searchsorted(y_coords, table.y + table.width)
+        min_z, max_z = np.searchsorted(z_coords, table.z), np.searchsorted(z_coords, table.z + table.height)
+        max_x = (table.x + table.length).tolist()
+        for index in range(len(table) - 1, -1, -1):
+            cells = front[min_y[index]:max_y[index], min_z[index]:max_z[index]]
+            if cells.max() > max_x[index] or touch[min_y[index]:max_y[index]].max() > max_x[index] + par_stacking:
+                first_blocked = start + index
+            np.maximum(cells, max_x[index], out=cells)
+            touch[min_y[index]] = max(touch[min_y[index]], max_x[index])
+    return first_blocked
+
+
+def raise_out_of_core_blocker(rows, task_table, key, par_stacking, chunk_size, metrics=None):
+    """
+    Searches the first pallet (in the order of the solution), which blocks the given pallet according to the LIFO
+    condition, in a linear pass and raises the same exception as check_lifo
+    :param rows: Memory map of the rows of the solution
+    :param task_table: Task table
+    :param key: Unloading key of the blocked pallet (see get_sequence_keys)
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :param chunk_size: Number of rows per chunk
+    :param metrics: Metrics recorder for the time budget
+    """
+    metrics = metrics or NULL_METRICS
+    pallet_table = get_out_of_core_table(rows[[key[-1]]], task_table)
+    x, y, z = int(pallet_table.x[0]), int(pallet_table.y[0]), int(pallet_table.z[0])
+    max_x, max_y = x + int(pallet_table.length[0]), y + int(pallet_table.width[0])
+    max_z = z + int(pallet_table.height[0])
+    for start in range(0, len(rows), chunk_size):
+        metrics.check_deadline("check_lifo")
+        table = get_out_of_core_table(rows[start:start + chunk_size], task_table)
+        other_max_x = table.x + table.length
+        overlaps_y = (table.y < max_y) & (table.y + table.width > y)
+        # Same conditions as SolutionPallet.is_other_pallet_stacked and SolutionPallet.is_other_pallet_in_front:
+        stacked = (table.x < max_x) & (other_max_x > x) & overlaps_y & (table.z == max_z)
+        in_front = (overlaps_y & (table.z < max_z) & (table.z + table.height > z) & (other_max_x > max_x)) | \
+                   ((y <= table.y) & (table.y < max_y) & (other_max_x > max_x + par_stacking))
+        later = is_later_in_sequence(get_sequence_keys(table, np.arange(start, start + len(table))), key)
+        hits = np.flatnonzero(later & (stacked | in_front))
+        if len(hits):
+            pallet, other_pallet = get_out_of_core_table(rows[[key[-1], start + hits[0]]], task_table).get_pallets()
+            raise FeasibilityException(
+                "Palette im Punkt %s von Order %s wird von der Palette %s von Order %s gemäß LIFO verdeckt." %
+                (pallet.origin_point.coords[:], pallet.type.order, other_pallet.origin_point.coords[:],
+                 other_pallet.type.order), "lifo", [pallet.as_tuple(), other_pallet.as_tuple()])
+
+
 def calculate_minimal_container_length(solution_pallets):
     """
     Calculates the minimal container lengths so that all pallets fit into the container
     :param solution_pallets: List of solution pallets
     :return: The maximal x coordinate of all pallets as lower bound for the container length
     """
-    return max([i.get_maxx() for i in solution_pallets])
+    if isinstance(solution_pallets, SolutionTable):
+        return float(np.max(solution_pallets.x + solution_pallets.length, initial=0))
+    return max([i.get_maxx() for i in solution_pallets], default=0.0)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,99 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+from FeasibilityCheck import import_container_data_by_file, import_solution_by_file, check_count, check_dimensions, \
+    check_container_dimensions, check_stacking, check_lifo, FeasibilityException, MetricsRecorder
+from generate_instances import generate_instance, write_task_file, write_solution_file, DEFECTS
+
+
+STAGES = ["import_solution", "check_count", "check_dimensions", "check_container_dimensions", "check_stacking",
+          "check_lifo"]
+
+
+def benchmark_files(task_file, solution_file, par_stacking=0):
+    """
+    Measures the time of every stage of the validation of a solution file
+    :param task_file: Path of the task file
+    :param solution_file: Path of the solution file
+    :param par_stacking: Parameter for accessibility of stacked pallets
+    :return: Metrics recorder with the times (in seconds) of the executed stages and the counters and the message of
+    the first violation (or None, if the solution is feasible)
+    """
+    width, height, tasks = import_container_data_by_file(task_file)
+    metrics = MetricsRecorder()
+    solution_pallets = None
+    stages = [("import_solution", lambda: import_solution_by_file(solution_file, tasks)),
+              ("check_count", lambda: check_count(solution_pallets, tasks)),
+              ("check_dimensions", lambda: check_dimensions(solution_pallets)),
+              ("check_container_dimensions", lambda: check_container_dimensions(solution_pallets, width, height)),
+              ("check_stacking", lambda: check_stacking(solution_pallets, metrics)),
+              ("check_lifo", lambda: check_lifo(solution_pallets, par_stacking, metrics))]
+    for name, stage in stages:
+        try:
+            with metrics.stage(name):
+                result = stage()
+        except FeasibilityException as e:
+            return metrics, str(e)
+        if name == "import_solution":
+            solution_pallets = result
+    return metrics, None
+
+
+def run_benchmark(sizes, groups=3, stacking_depth=2, defect=None, seed=0, repeat=1, directory=None):
+    """
+    Generates an instance for every size and measures the time of every stage of its validation
+    :param sizes: Iterable of numbers of pallets
+    :param groups: Number of groups
+    :param stacking_depth: Maximal number of pallets per stack
+    :param defect: None for feasible instances or one of DEFECTS for infeasible ones
+    :param seed: Seed of the generator
+    :param repeat: Number of measurements per size; the minimal time of every stage is recorded
+    :param directory: Directory for the generated files; a temporary directory is used, if it is None
+    :return: Generator of result records (dictionaries)
+    """
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = directory or temporary_directory
+        for size in sizes:
+            container_width, container_height, task_rows, solution_rows = generate_instance(
+                size, groups, stacking_depth=stacking_depth, defect=defect, seed=seed)
+            task_file = os.path.join(directory, "task_%s.csv" % size)
+            solution_file = os.path.join(directory, "solution_%s.csv" % size)
+            write_task_file(task_file, container_width, container_height, task_rows)
+            write_solution_file(solution_file, solution_rows)
+            stages = dict()
+            for _ in range(repeat):
+                metrics, message = benchmark_files(task_file, solution_file)
+                for name, seconds in metrics.times.items():
+                    stages[name] = min(seconds, stages.get(name, seconds))
+            yield {"pallets": len(solution_rows), "groups": groups, "depth": stacking_depth, "defect": defect,
+                   "seed": seed, "stages": stages, "total": sum(stages.values()), "counters": metrics.counters,
+                   "message": message}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Laufzeitmessung der Überprüfung mit synthetischen Lösungen.')
+    parser.add_argument('--sizes', '-n', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='Anzahl der Paletten der Lösungen')
+    parser.add_argument('--groups', '-g', type=int, default=3, help='Anzahl der Gruppen')
+    parser.add_argument('--depth', type=int, default=2, help='Maximale Anzahl gestapelter Paletten')
+    parser.add_argument('--defect', type=str, choices=DEFECTS, default=None,
+                        help='Art des Fehlers für unzulässige Lösungen')
+    parser.add_argument('--seed', type=int, default=0, help='Startwert des Zufallszahlengenerators')
+    parser.add_argument('--repeat', type=int, default=1, help='Anzahl der Messungen je Lösung')
+    parser.add_argument('--output', '-o', type=str, default=None,
+                        help='Ausgabedatei für die Ergebnisse (JSON Lines); Standard ist die Konsole')
+    args = parser.parse_args()
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for record in run_benchmark(args.sizes, args.groups, args.depth, args.defect, args.seed, args.repeat):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
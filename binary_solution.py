@@ -0,0 +1,135 @@
+"""
+Binary format of solutions. A binary solution file consists of a header of 16 bytes and the rows of the solution:
+
+- Bytes 0 to 7: Magic header MAGIC (``FCSOL001``)
+- Bytes 8 to 15: Number of rows as unsigned 64 bit integer (little-endian)
+- Every row has 20 bytes: Order, xPos, yPos, zPos and HTurned as signed 32 bit integers (little-endian)
+
+The columns are the same as in the csv format (Order,xPos,yPos,zPos,HTurned).
+"""
+import struct
+try:
+    import numpy as np
+except ImportError:  # Without numpy the rows are unpacked with struct
+    np = None
+
+
+MAGIC = b"FCSOL001"
+HEADER = struct.Struct("<8sQ")
+ROW = struct.Struct("<5i")
+COLUMNS = ["order", "x", "y", "z", "turned"]
+# Range of the signed 32 bit integers of a row
+INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+DTYPE = np.dtype([(i, "<i4") for i in COLUMNS]) if np is not None else None
+
+
+def is_binary_solution(file):
+    """
+    Checks, if a file is a binary solution file by its magic header
+    :param file: Path of the file
+    :return: True, if the file starts with the magic header
+    """
+    with open(file, 'rb') as binary_file:
+        return binary_file.read(len(MAGIC)) == MAGIC
+
+
+def read_row_count(binary_file, file_size):
+    """
+    Reads the header of a binary solution file and checks the size of the file
+    :param binary_file: Binary file object at its beginning
+    :param file_size: Size of the file in bytes
+    :return: Number of rows
+    """
+    header = binary_file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError("Unvollständiger Header der Binärdatei.")
+    magic, count = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Fehlerhafter Header: %s" % magic)
+    if file_size != HEADER.size + count * ROW.size:
+        raise ValueError("Die Größe der Binärdatei passt nicht zur Anzahl der Zeilen %s." % count)
+    return count
+
+
+def load_binary_solution(file):
+    """
+    Loads a binary solution file through a memory map; the rows are not parsed or copied
+    :param file: Path of the file
+    :return: Structured numpy array (memory map) with the fields of COLUMNS
+    """
+    if np is None:
+        raise ImportError("Für das Einlesen über eine Memory Map wird numpy benötigt.")
+    with open(file, 'rb') as binary_file:
+        binary_file.seek(0, 2)
+        file_size = binary_file.tell()
+        binary_file.seek(0)
+        count = read_row_count(binary_file, file_size)
+    if count == 0:  # A memory map must not be empty
+        return np.zeros(0, dtype=DTYPE)
+    return np.memmap(file, dtype=DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+
+
+def read_binary_chunks(file, chunk_size=10000):
+    """
+    Reads a binary solution file in chunks like the csv reader of the checker
+    :param file: Path of the file
+    :param chunk_size: Maximal number of rows per chunk
+    :return: Generator of chunks; every chunk is a tuple of the columns (order, x, y, z, turned) as lists of integers
+    """
+    if np is not None:
+        rows = load_binary_solution(file)
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            yield tuple(chunk[i].tolist() for i in COLUMNS)
+        return
+    with open(file, 'rb') as binary_file:
+        binary_file.seek(0, 2)
+        file_size = binary_file.tell()
+        binary_file.seek(0)
+        count = read_row_count(binary_file, file_size)
+        for start in range(0, count, chunk_size):
+            content = binary_file.read(min(chunk_size, count - start) * ROW.size)
+            yield tuple(list(i) for i in zip(*ROW.iter_unpack(content)))
+
+
+def check_chunk_range(chunk, offset):
+    """
+    Checks, if all values of a chunk fit into the signed 32 bit integers of a row; older numpy versions would wrap the
+    values silently
+    :param chunk: Tuple of the columns (order, x, y, z, turned)
+    :param offset: Number of rows before the chunk
+    """
+    low, high = INT32_RANGE
+    if all(low <= min(column) and max(column) <= high for column in chunk if len(column)):
+        return
+    for index, row in enumerate(zip(*chunk)):
+        if not all(low <= i <= high for i in row):
+            raise ValueError("Der Wert in Zeile %s (%s) liegt außerhalb des Wertebereichs von 32-Bit-Ganzzahlen." %
+                             (offset + index + 1, ",".join(map(str, row))))
+
+
+def write_binary_solution(file, chunks):
+    """
+    Writes a binary solution file
+    :param file: Path of the file
+    :param chunks: Iterable of chunks; every chunk is a tuple of the columns (order, x, y, z, turned)
+    :return: Number of written rows
+    """
+    count = 0
+    with open(file, 'wb') as binary_file:
+        binary_file.write(HEADER.pack(MAGIC, 0))
+        for chunk in chunks:
+            check_chunk_range(chunk, count)
+            if np is not None:
+                rows = np.empty(len(chunk[0]), dtype=DTYPE)
+                for name, column in zip(COLUMNS, chunk):
+                    rows[name] = column
+                binary_file.write(rows.tobytes())
+                count += len(rows)
+            else:
+                for row in zip(*chunk):
+                    binary_file.write(ROW.pack(*row))
+                    count += 1
+        binary_file.seek(0)
+        binary_file.write(HEADER.pack(MAGIC, count))
+    return count
@@ -0,0 +1,33 @@
+import argparse
+import os
+from FeasibilityCheck import read_solution_chunks, DataException
+from binary_solution import write_binary_solution
+
+
+def convert_solution_file(csv_file, binary_file):
+    """
+    Converts a solution csv file into the binary solution format (see binary_solution)
+    :param csv_file: Path of the csv file
+    :param binary_file: Path of the binary file
+    :return: Number of converted rows
+    """
+    try:
+        return write_binary_solution(binary_file, read_solution_chunks(csv_file))
+    except (ValueError, DataException) as e:
+        os.remove(binary_file)  # An incomplete binary file is not left behind
+        raise DataException(str(e))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Umwandlung einer Lösung vom csv-Format in das Binärformat.')
+    parser.add_argument('csv', type=str, help='Lösungsdaten als csv-Datei')
+    parser.add_argument('binary', type=str, help='Ausgabedatei im Binärformat')
+    args = parser.parse_args()
+    try:
+        print("%s Zeilen umgewandelt." % convert_solution_file(args.csv, args.binary))
+    except DataException as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import random
+from collections import Counter
+
+
+HEADER_CONTAINER = "ContainerWidth,ContainerHeight"
+HEADER_TASKS = "Order,Description,Quantity,Length,Width,Height,TurningAllowed,StackingAllowed,Group"
+HEADER_SOLUTIONS = "Order,xPos,yPos,zPos,HTurned"
+DEFECTS = ["count", "rotation", "container", "overlap", "stacking", "lifo"]
+
+
+def generate_instance(pallet_count, groups=3, types_per_group=2, stacking_depth=2, turning=True, rows=2,
+                      cell_size=1200, defect=None, seed=0):
+    """
+    Generates a synthetic load plan. The pallets are placed in stacks on a grid of cells. The stacks of the group with
+    the highest number are placed at the back of the container (x = 0) and the stacks of group 1 at the front, so that
+    the load plan is feasible (unless a defect is inserted).
+    :param pallet_count: Number of pallets
+    :param groups: Number of groups
+    :param types_per_group: Number of pallet types per group
+    :param stacking_depth: Maximal number of pallets per stack
+    :param turning: True, if pallet types may be turned
+    :param rows: Number of cells in y direction
+    :param cell_size: Length and width of a cell; all pallets fit into one cell
+    :param defect: None for a feasible load plan or one of DEFECTS for an infeasible one
+    :param seed: Seed of the random number generator
+    :return: Tuple of container width, container height, task rows and solution rows
+    """
+    rng = random.Random(seed)
+    task_rows = []
+    for group in range(1, groups + 1):
+        for _ in range(types_per_group):
+            length = rng.randrange(cell_size // 2, cell_size + 1, 10)
+            # Pallet types must not be square, otherwise they always count as turned
+            width = rng.choice([i for i in range(cell_size // 2, cell_size + 1, 10) if i != length])
+            turning_allowed = int(turning and rng.random() < 0.5)
+            stacking_allowed = int(stacking_depth > 1 and rng.random() < 0.7)
+            task_rows.append([len(task_rows) + 1, "Palette%s" % (len(task_rows) + 1), 0, length, width,
+                              rng.randrange(cell_size // 10, cell_size // 2 + 1, 10), turning_allowed,
+                              stacking_allowed, group])
+    container_width = rows * cell_size
+    container_height = stacking_depth * max(i[5] for i in task_rows)
+    # Number of pallets per group; the stacks of the highest group are placed first
+    group_counts = [pallet_count // groups + (1 if i < pallet_count % groups else 0) for i in range(groups)]
+    solution_rows = []
+    stack = 0
+    for group in range(groups, 0, -1):
+        remaining = group_counts[group - 1]
+        group_types = [i for i in task_rows if i[8] == group]
+        while remaining > 0:
+            task = rng.choice(group_types)
+            height = min(remaining, stacking_depth if task[7] else 1)
+            turned = int(task[6] and rng.random() < 0.5)
+            x_pos, y_pos = (stack // rows) * cell_size, (stack % rows) * cell_size
+            for level in range(height):
+                solution_rows.append([task[0], x_pos, y_pos, level * task[5], turned])
+            remaining -= height
+            stack += 1
+    if defect is not None:
+        insert_defect(defect, task_rows, solution_rows, container_width, rng)
+    counts = Counter(i[0] for i in solution_rows)
+    for task in task_rows:
+        task[2] = counts[task[0]]
+    if defect == "count":
+        rng.choice(task_rows)[2] += 1
+    return container_width, container_height, task_rows, solution_rows
+
+
+def insert_defect(defect, task_rows, solution_rows, container_width, rng):
+    """
+    Changes a feasible load plan, so that it violates one condition
+    :param defect: One of DEFECTS
+    :param task_rows: Task rows of the load plan
+    :param solution_rows: Solution rows of the load plan
+    :param container_width: Width of the container
+    :param rng: Random number generator
+    """
+    tasks = {i[0]: i for i in task_rows}
+    row = rng.choice(solution_rows)
+    task = tasks[row[0]]
+    if defect == "rotation":
+        task[6] = 0
+        row[4] = 1
+    elif defect == "container":
+        row[2] = container_width - (task[3] if row[4] else task[4]) + 1
+    elif defect == "overlap":
+        other_row = rng.choice(solution_rows)
+        solution_rows.append([other_row[0], other_row[1] + 1, other_row[2] + 1, other_row[3], other_row[4]])
+    elif defect == "stacking":
+        stacked_rows = [i for i in solution_rows if i[3] > 0]
+        if stacked_rows:
+            # A stacked pallet gets a new pallet type, which must not be stacked
+            row = rng.choice(stacked_rows)
+            new_order = len(task_rows) + 1
+            task_rows.append([new_order, "Palette%s" % new_order, 0] + tasks[row[0]][3:7] + [0, tasks[row[0]][8]])
+            row[0] = new_order
+        else:
+            row[3] += 1
+    elif defect == "lifo":
+        # A stack at the front of the container gets a new group, which is unloaded last
+        front_x = max(i[1] for i in solution_rows)
+        row = rng.choice([i for i in solution_rows if i[1] == front_x])
+        task = tasks[row[0]]
+        new_order = len(task_rows) + 1
+        task_rows.append([new_order, "Palette%s" % new_order, 0] + task[3:8] + [max(i[8] for i in task_rows) + 1])
+        for i in solution_rows:
+            if i[1] == row[1] and i[2] == row[2]:
+                i[0] = new_order
+    elif defect != "count":
+        raise ValueError("Unbekannter Fehler: %s" % defect)
+
+
+def write_task_file(file, container_width, container_height, task_rows):
+    """
+    Writes the task data in the csv format of the checker
+    :param file: Path of the csv file
+    :param container_width: Width of the container
+    :param container_height: Height of the container
+    :param task_rows: Task rows
+    """
+    with open(file, 'w', newline='') as csvfile:
+        csvfile.write("%s\n%s,%s\n%s\n" % (HEADER_CONTAINER, container_width, container_height, HEADER_TASKS))
+        csvfile.writelines(",".join(map(str, i)) + "\n" for i in task_rows)
+
+
+def write_solution_file(file, solution_rows):
+    """
+    Writes the solution in the csv format of the checker
+    :param file: Path of the csv file
+    :param solution_rows: Solution rows
+    """
+    with open(file, 'w', newline='') as csvfile:
+        csvfile.write(HEADER_SOLUTIONS + "\n")
+        csvfile.writelines(",".join(map(str, i)) + "\n" for i in solution_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Erzeugung von synthetischen Aufgaben und Lösungen.')
+    parser.add_argument('--pallets', '-n', type=int, required=True, help='Anzahl der Paletten')
+    parser.add_argument('--task', '-t', type=str, required=True, help='Ausgabedatei der Aufgabedaten')
+    parser.add_argument('--solution', '-s', type=str, required=True, help='Ausgabedatei der Lösung')
+    parser.add_argument('--groups', '-g', type=int, default=3, help='Anzahl der Gruppen')
+    parser.add_argument('--types', type=int, default=2, help='Anzahl der Palettentypen je Gruppe')
+    parser.add_argument('--depth', type=int, default=2, help='Maximale Anzahl gestapelter Paletten')
+    parser.add_argument('--no-turning', action='store_true', help='Keine drehbaren Palettentypen erzeugen')
+    parser.add_argument('--rows', type=int, default=2, help='Anzahl der Paletten nebeneinander (y-Richtung)')
+    parser.add_argument('--defect', type=str, choices=DEFECTS, default=None,
+                        help='Art des Fehlers für eine unzulässige Lösung')
+    parser.add_argument('--seed', type=int, default=0, help='Startwert des Zufallszahlengenerators')
+    args = parser.parse_args()
+    container_width, container_height, task_rows, solution_rows = generate_instance(
+        args.pallets, args.groups, args.types, args.depth, not args.no_turning, args.rows, defect=args.defect,
+        seed=args.seed)
+    write_task_file(args.task, container_width, container_height, task_rows)
+    write_solution_file(args.solution, solution_rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+def covers_rectangle(rectangles, target):
+    """
+    Checks exactly, if the union of axis-aligned rectangles covers the target rectangle completely. The check works with
+    a sweep over the compressed x coordinates and needs no polygon operations (and no Shapely).
+    :param rectangles: Iterable of rectangles as tuples (minx, miny, maxx, maxy)
+    :param target: Target rectangle as tuple (minx, miny, maxx, maxy); it must have a positive area
+    :return: True, if every point of the target rectangle is covered by at least one rectangle
+    """
+    target_min_x, target_min_y, target_max_x, target_max_y = target
+    if target_min_x >= target_max_x or target_min_y >= target_max_y:
+        return False
+    # Only the parts of the rectangles inside of the target are relevant:
+    clipped = []
+    for min_x, min_y, max_x, max_y in rectangles:
+        min_x, min_y = max(min_x, target_min_x), max(min_y, target_min_y)
+        max_x, max_y = min(max_x, target_max_x), min(max_y, target_max_y)
+        if min_x < max_x and min_y < max_y:
+            clipped.append((min_x, min_y, max_x, max_y))
+    xs = sorted({target_min_x, target_max_x}.union(*((i[0], i[2]) for i in clipped)))
+    # Every slab between two neighbouring x coordinates must be covered completely in y direction:
+    for slab_min_x, slab_max_x in zip(xs, xs[1:]):
+        intervals = sorted((i[1], i[3]) for i in clipped if i[0] <= slab_min_x and slab_max_x <= i[2])
+        covered_y = target_min_y
+        for min_y, max_y in intervals:
+            if min_y > covered_y:
+                return False
+            covered_y = max(covered_y, max_y)
+        if covered_y < target_max_y:
+            return False
+    return True
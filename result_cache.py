@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+
+def hash_file(file):
+    """
+    Calculates the hash of the content of a file
+    :param file: Path of the file
+    :return: SHA-256 hash as hex string
+    """
+    digest = hashlib.sha256()
+    with open(file, 'rb') as binary_file:
+        for block in iter(lambda: binary_file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_content(content):
+    """
+    Calculates the hash of the content of a file, which was already read; it is the same as the one of hash_file
+    :param content: Content as bytes
+    :return: SHA-256 hash as hex string
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def make_key(*parts):
+    """
+    Creates a cache key from several parts (e.g. hashes of files and parameters)
+    :param parts: JSON serializable parts of the key
+    :return: SHA-256 hash as hex string
+    """
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed cache on disk. Every entry is stored in its own file, which is named by its key. Entries are
+    evicted in the order of their last use (LRU), as soon as the cache exceeds its maximal size.
+    """
+    def __init__(self, directory, max_size=100 * 1024 * 1024):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key, extension):
+        """
+        Get the path of the file of an entry
+        :param key: Key of the entry
+        :param extension: File extension depending on the serialization
+        :return: Path of the file
+        """
+        return os.path.join(self.directory, key + extension)
+
+    def get(self, key):
+        """
+        Get a JSON entry of the cache
+        :param key: Key of the entry
+        :return: The entry or None, if the key is not in the cache
+        """
+        try:
+            with open(self.get_path(key, '.json'), encoding='utf-8') as file:
+                value = json.load(file)
+        except (OSError, ValueError):
+            return None
+        self.touch(self.get_path(key, '.json'))
+        return value
+
+    def put(self, key, value):
+        """
+        Stores a JSON entry in the cache
+        :param key: Key of the entry
+        :param value: JSON serializable value
+        """
+        self.write(self.get_path(key, '.json'), json.dumps(value).encode('utf-8'))
+
+    def get_object(self, key):
+        """
+        Get a pickled entry of the cache (e.g. parsed task data)
+        :param key: Key of the entry
+        :return: The entry or None, if the key is not in the cache
+        """
+        try:
+            with open(self.get_path(key, '.pickle'), 'rb') as file:
+                value = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        self.touch(self.get_path(key, '.pickle'))
+        return value
+
+    def put_object(self, key, value):
+        """
+        Stores a pickled entry in the cache
+        :param key: Key of the entry
+        :param value: Picklable value
+        """
+        self.write(self.get_path(key, '.pickle'), pickle.dumps(value))
+
+    def write(self, path, content):
+        """
+        Writes an entry. It is written to a temporary file first, so that concurrent processes never read half an entry.
+        :param path: Path of the file of the entry
+        :param content: Serialized entry as bytes
+        """
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(content)
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def touch(path):
+        """
+        Marks an entry as used; the modification time of the file is the time of the last use
+        :param path: Path of the file of the entry
+        """
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self):
+        """
+        Removes the least recently used entries, until the cache does not exceed its maximal size
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(i[1] for i in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
@@ -1,6 +1,28 @@
-from FeasibilityCheck import import_tasks, import_solution, validate_solution, FeasibilityException
+import csv
+import io
+import json
+import os
+import random
+import socket
+import stat
+from rectangles import covers_rectangle
+from result_cache import ResultCache, hash_file
+import binary_solution
+from binary_solution import is_binary_solution, load_binary_solution
+from convert_solution import convert_solution_file
+import FeasibilityCheck
+from generate_instances import generate_instance, write_task_file, write_solution_file, DEFECTS
+from benchmark import run_benchmark, STAGES
+from FeasibilityCheck import import_tasks, import_solution, validate_solution, FeasibilityException, DataException, \
+    get_unload_batches, import_solution_table, calculate_minimal_container_length, import_container_data_by_file, \
+    validate_solution_file, init_worker, validate_solution_file_in_worker, read_solution_chunks, \
+    import_solution_by_file, import_solution_table_by_file, IncrementalValidator, SolutionPallet, MetricsRecorder, \
+    ValidationServer, check_solution_file, watch_solution_files, ENGINES, EngineMismatchException, get_file_stamps, \
+    prefetch_solution_files, read_solution_content, validate_batch, run_manifest, collect_violations, \
+    TimeBudgetException, check_solution_out_of_core
 import pytest
 
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
 HEADER_TASKS = "Order,Description,Quantity,Length,Width,Height,TurningAllowed,StackingAllowed,Group"
 HEADER_SOLUTIONS = "Order,xPos,yPos,zPos,HTurned"
 
@@ -17,6 +39,12 @@ def import_solution_default(solution, tasks):
     return import_solution(solution_list, tasks)
 
 
+def import_solution_table_default(solution, tasks):
+    solution_list = [HEADER_SOLUTIONS]
+    solution_list.extend(solution)
+    return import_solution_table(solution_list, tasks)
+
+
 def validate_solution_default(solution, tasks):
     validate_solution(solution, tasks, 100, 100)
 
@@ -194,3 +222,742 @@ def test22_right_lifo_two_layers2():
     solution = import_solution_default(["1,0,0,10,0", "2,0,0,0,0"], tasks)
     validate_solution(solution, tasks, 100, 100, 10)
     assert len(solution) == 2
+
+
+def test23_overlap_large_and_small_pallets():  # Large pallet covers many grid cells of the small pallets
+    with pytest.raises(FeasibilityException, match=r'.* überschneiden .*'):
+        tasks = import_tasks_default(["1,EuroPallet1,3,2,2,10,1,1,1", "2,EuroPallet2,1,60,60,10,1,1,1"])
+        solution = import_solution_default(["1,0,0,0,0", "1,2,0,0,0", "2,20,20,0,0", "1,50,50,5,0"], tasks)
+        validate_solution_default(solution, tasks)
+
+
+def test24_unload_batches():  # Sorted by group (ASC), maximal x (DESC) and maximal z (DESC)
+    tasks = import_tasks_default(["1,EuroPallet1,3,10,10,10,1,1,2", "2,EuroPallet2,2,10,10,10,1,1,1"])
+    solution = import_solution_default(["1,0,0,0,0", "2,0,10,0,0", "1,10,0,0,0", "1,10,0,10,0", "2,10,10,0,0"],
+                                       tasks)
+    assert list(get_unload_batches(solution)) == [[4], [1], [3], [2], [0]]
+
+
+def test25_wrong_lifo_far_in_front():  # Pallet of group 2 at the front blocks a pallet of group 1 further back
+    with pytest.raises(FeasibilityException, match=r'.* LIFO .'):
+        tasks = import_tasks_default(["1,EuroPallet1,2,10,10,10,1,1,1", "2,EuroPallet2,2,10,10,10,1,1,2"])
+        solution = import_solution_default(["1,0,0,0,0", "1,0,10,0,0", "2,50,5,0,0", "2,50,20,0,0"], tasks)
+        validate_solution_default(solution, tasks)
+
+
+def test26_table_basic():
+    pytest.importorskip("numpy")
+    tasks = import_tasks_default(["1,EuroPallet1,2,10,20,30,1,1,1", "2,EuroPallet2,1,10,20,30,1,1,1"])
+    solution = import_solution_table_default(["1,0,0,0,0", "2,0,20,0,1", "1,20,20,0,0"], tasks)
+    validate_solution_default(solution, tasks)
+    assert len(solution) == 3
+    assert calculate_minimal_container_length(solution) == 30.0
+
+
+@pytest.mark.parametrize("solution, message", [
+    (["1,0,0,0,0", "2,0,20,0,0"], r'.* Anzahl .*'),
+    (["1,0,0,0,0", "1,0,20,0,1", "2,0,60,0,1"],
+     r'Die Palette im Startpunkt \[\(0.0, 60.0, 0.0\)\] von Order 2 wurde unzulässigerweise gedreht.'),
+    (["1,0,0,0,0", "1,0,20,80,0", "2,0,40,0,0"],
+     r'Die Palette im Startpunkt \[\(0.0, 20.0, 80.0\)\] von Order 1 überschreitet die Container Dimensionen.')])
+def test27_table_first_error(solution, message):
+    pytest.importorskip("numpy")
+    tasks = import_tasks_default(["1,EuroPallet1,2,10,20,30,1,1,1", "2,EuroPallet2,1,10,20,30,0,1,1"])
+    with pytest.raises(FeasibilityException, match=message):
+        validate_solution_default(import_solution_table_default(solution, tasks), tasks)
+
+
+@pytest.mark.parametrize("rectangles, covered", [
+    ([], False),
+    ([(0, 0, 10, 10)], True),
+    ([(-5, -5, 15, 15)], True),
+    ([(0, 0, 5, 10), (5, 0, 10, 10)], True),  # touching rectangles
+    ([(0, 0, 6, 10), (4, 0, 10, 6), (4, 5, 10, 10)], True),  # overlapping rectangles
+    ([(0, 0, 5, 10), (6, 0, 10, 10)], False),  # gap in x direction
+    ([(0, 0, 10, 4), (0, 5, 10, 10)], False),  # gap in y direction
+    ([(0, 0, 5, 5), (5, 5, 10, 10), (0, 5, 5, 10)], False)])  # one quarter is missing
+def test28_covers_rectangle(rectangles, covered):
+    assert covers_rectangle(rectangles, (0, 0, 10, 10)) == covered
+
+
+def test29_validate_solution_file_in_worker(capsys):  # The output of a worker is the same as the printed output
+    container_data = import_container_data_by_file(os.path.join(DATA_DIR, "EingabeBsp.csv"))
+    init_worker(container_data, 0)
+    for solution in ["LoesungBsp1.csv", "LoesungBsp2.csv", "falscheDatei.txt", "BinaryFile.xlsx"]:
+        path = os.path.join(DATA_DIR, "solutionDir", solution)
+        validate_solution_file(path, container_data)
+        printed = capsys.readouterr().out
+        output = validate_solution_file_in_worker(path)
+        assert [i for i in output.splitlines() if "Sekunden" not in i] == \
+            [i for i in printed.splitlines() if "Sekunden" not in i]
+
+
+def test30_read_solution_chunks(tmp_path):  # Empty lines are skipped and the rows are split into chunks
+    file = tmp_path / "solution.csv"
+    file.write_text("\n".join([HEADER_SOLUTIONS, "1,0,0,0,0", "", "1,0,20,0,0", "1,10,0,0,0", "1,10,20,0,1", ""]))
+    assert list(read_solution_chunks(str(file), chunk_size=2)) == [([1], [0], [0], [0], [0]),
+                                                                   ([1, 1], [0, 10], [20, 0], [0, 0], [0, 0]),
+                                                                   ([1], [10], [20], [0], [1])]
+    tasks = import_tasks_default(["1,EuroPallet1,4,10,20,30,1,1,1"])
+    assert [i.origin_point.coords[:] for i in import_solution_by_file(str(file), tasks)] == \
+        [[(0.0, 0.0, 0.0)], [(0.0, 20.0, 0.0)], [(10.0, 0.0, 0.0)], [(10.0, 20.0, 0.0)]]
+    pytest.importorskip("numpy")
+    assert import_solution_table_by_file(str(file), tasks).turned.tolist() == [False, False, False, True]
+
+
+def test31_read_solution_incomplete_row(tmp_path):
+    file = tmp_path / "solution.csv"
+    file.write_text("\n".join([HEADER_SOLUTIONS, "1,0,0,0,0", "1,0,20"]))
+    with pytest.raises(DataException, match=r'Unvollständige Zeile: 1,0,20'):
+        list(read_solution_chunks(str(file)))
+
+
+def test32_incremental_validator():
+    tasks = import_tasks_default(["1,EuroPallet1,2,10,20,10,1,1,2", "2,EuroPallet2,1,20,10,10,1,1,1"])
+    validator = IncrementalValidator(tasks, 100, 100)
+    solution = import_solution_default(["1,0,0,0,0", "1,10,0,0,0", "2,0,0,10,0"], tasks)
+    for pallet in solution[:2]:
+        validator.add(pallet)
+    assert not validator.is_feasible()  # count
+    validator.add(solution[2])
+    assert validator.is_feasible()
+    validator.move(solution[2], 5, 0, 10, 0)  # overhang
+    assert not validator.is_feasible()
+    validator.move(solution[2], 0, 0, 0, 0)  # overlap
+    assert validator.count_violations() == 2
+    validator.move(solution[2], 20, 0, 0, 0)  # in front of the pallets of group 2
+    assert validator.is_feasible()
+    validator.move(solution[1], 30, 0, 0, 0)  # in front of the pallet of group 1
+    assert not validator.is_feasible()
+    validator.remove(solution[1])
+    validator.add(SolutionPallet(tasks[1], 0, 20, 0, 0))
+    assert validator.is_feasible()
+    # A pallet, which is not part of the solution, is rejected without changing the state
+    counts = dict(validator.counts)
+    for change in [lambda: validator.remove(solution[1]), lambda: validator.move(solution[1], 0, 0, 0, 0),
+                   lambda: validator.add(solution[0])]:
+        with pytest.raises(ValueError, match=r'Die Palette ist (nicht|bereits) Teil der Lösung.'):
+            change()
+        assert validator.is_feasible() and validator.counts == counts and len(validator) == 3
+    assert (solution[1].x, solution[1].y) == (30, 0)
+
+
+@pytest.mark.parametrize("par_stacking", [0, 2.5, -5])
+def test33_incremental_validator_random_moves(par_stacking):  # Same result as validate_solution after every move
+    tasks = import_tasks_default(["1,EuroPallet1,4,10,10,10,1,1,1", "2,EuroPallet2,2,10,20,10,1,1,2",
+                                  "3,EuroPallet3,1,4,10,10,1,1,1"])
+    solution = import_solution_default(["1,20,0,0,0", "1,20,10,0,0", "1,20,0,10,0", "1,20,10,10,0", "2,0,0,0,0",
+                                        "2,10,0,0,0", "3,15,0,0,0"], tasks)
+    validator = IncrementalValidator(tasks, 20, 20, par_stacking)
+    for pallet in solution:
+        validator.add(pallet)
+    rng = random.Random(0)
+    for _ in range(200):
+        validator.move(rng.choice(solution), rng.choice([0, 2, 5, 10, 13, 15, 20]), rng.choice([0, 5, 10]),
+                       rng.choice([0, 10]), rng.choice([0, 1]))
+        try:
+            validate_solution(solution, tasks, 20, 20, par_stacking)
+            feasible = True
+        except FeasibilityException:
+            feasible = False
+        assert validator.is_feasible() == feasible
+        # The sorted buckets find the same LIFO relations as the test of all pairs
+        assert validator.blocking_count == sum(validator.is_blocked(i, j) for i in solution for j in solution if i != j)
+
+
+def test34_result_cache(tmp_path, capsys, monkeypatch):  # The second run takes the result from the cache
+    cache = ResultCache(str(tmp_path / "cache"))
+    task = os.path.join(DATA_DIR, "EingabeBsp.csv")
+    container_data = import_container_data_by_file(task, cache)
+    assert import_container_data_by_file(task, cache)[2][1].quantity == container_data[2][1].quantity
+    for solution in ["LoesungBsp1.csv", "LoesungBsp2.csv"]:
+        path = os.path.join(DATA_DIR, "solutionDir", solution)
+        validate_solution_file(path, container_data, 0, cache, hash_file(task))
+        printed = capsys.readouterr().out
+        monkeypatch.setattr(FeasibilityCheck, "check_solution_file", None)
+        validate_solution_file(path, container_data, 0, cache, hash_file(task))
+        assert capsys.readouterr().out.splitlines() == [i for i in printed.splitlines() if "Sekunden" not in i]
+        monkeypatch.undo()
+
+
+def test35_result_cache_eviction(tmp_path):  # The least recently used entries are evicted
+    cache = ResultCache(str(tmp_path), max_size=250)
+    for key in range(5):
+        cache.put(str(key), {"message": "x" * 90})
+        os.utime(str(tmp_path / ("%s.json" % key)), (key, key))
+    assert cache.get("0") is not None  # 0 is used again
+    cache.evict()
+    assert sorted(os.listdir(str(tmp_path))) == ["0.json", "4.json"]
+
+
+@pytest.mark.parametrize("defect, message", [(None, None)] + list(zip(DEFECTS, [
+    r'.* Anzahl .*', r'.* unzulässigerweise gedreht.', r'.* überschreitet die Container Dimensionen.',
+    r'.* überschneiden .*', r'.* unzulässigerweise gestapelt.', r'.* LIFO .*'])))
+def test36_generate_instance(defect, message):
+    width, height, task_rows, solution_rows = generate_instance(200, groups=3, stacking_depth=3, defect=defect)
+    tasks = import_tasks_default([",".join(map(str, i)) for i in task_rows])
+    solution = import_solution_default([",".join(map(str, i)) for i in solution_rows], tasks)
+    if message is None:
+        validate_solution(solution, tasks, width, height)
+    else:
+        with pytest.raises(FeasibilityException, match=message):
+            validate_solution(solution, tasks, width, height)
+
+
+def test37_benchmark():
+    records = list(run_benchmark([20, 50]))
+    assert [i["pallets"] for i in records] == [20, 50]
+    assert all(list(i["stages"]) == STAGES and i["message"] is None for i in records)
+
+
+def test38_metrics(capsys):  # Without metrics recorder nothing is printed
+    tasks = import_tasks_default(["1,EuroPallet1,2,10,10,10,1,1,1"])
+    solution = import_solution_default(["1,0,0,0,0", "1,0,0,10,0"], tasks)
+    validate_solution_default(solution, tasks)
+    assert capsys.readouterr().out == ""
+    metrics = MetricsRecorder()
+    validate_solution(solution, tasks, 100, 100, 0, metrics)
+    assert list(metrics.times) == ["check_count", "check_dimensions", "check_container_dimensions", "check_stacking",
+                                   "check_lifo"]
+    assert metrics.counters == {"stacking_pair_tests": 4, "stacking_coverage_tests": 1, "lifo_unload_batches": 2,
+                                "lifo_blocking_tests": 3}
+
+
+def test39_lazy_geometry():  # The Shapely geometry is created on demand and is updated after a relocation
+    tasks = import_tasks_default(["1,EuroPallet1,1,10,20,30,1,1,1"])
+    pallet = import_solution_default(["1,1,2,3,1"], tasks)[0]
+    assert not hasattr(pallet, "__dict__") and pallet._base_area is None
+    assert (pallet.x, pallet.y, pallet.z, pallet.length, pallet.width, pallet.height) == (1, 2, 3, 20, 10, 30)
+    assert pallet.base_area.bounds == (1.0, 2.0, 21.0, 12.0)
+    assert pallet.front_face.bounds == (2.0, 3.0, 12.0, 33.0)
+    assert pallet.get_maxx() == 21.0 and pallet.get_maxz() == 33.0
+    pallet.relocate(5, 0, 0, 0)
+    assert pallet.origin_point.coords[:] == [(5.0, 0.0, 0.0)] and pallet.base_area.bounds == (5.0, 0.0, 15.0, 20.0)
+
+
+@pytest.mark.parametrize("defect", [None] + DEFECTS)
+def test40_prevalidation(tmp_path, defect):  # The pre-validation during the import finds the same violations
+    width, height, task_rows, solution_rows = generate_instance(200, groups=3, stacking_depth=3, defect=defect)
+    tasks = import_tasks_default([",".join(map(str, i)) for i in task_rows])
+    solution_file = str(tmp_path / "solution.csv")
+    with open(solution_file, 'w') as file:
+        file.write("\n".join([HEADER_SOLUTIONS] + [",".join(map(str, i)) for i in solution_rows]) + "\n")
+    try:
+        validate_solution(import_solution_by_file(solution_file, tasks), tasks, width, height)
+        expected = None
+    except FeasibilityException as e:
+        expected = str(e)
+    try:
+        solution = import_solution_by_file(solution_file, tasks, width, height)
+        validate_solution(solution, tasks, width, height, prevalidated=True)
+        message = None
+    except FeasibilityException as e:
+        message = str(e)
+    assert message == expected
+
+
+def test41_prevalidation_rows(tmp_path):  # Rows are checked one after another; invalid rows are data errors
+    tasks = import_tasks_default(["1,EuroPallet1,2,10,8,10,0,1,1"])
+    solution_file = str(tmp_path / "solution.csv")
+    for rows, exception, message in [
+            (["1,0,0,0,0", "1,0,95,0,0", "1,0,0,10,1"], FeasibilityException, r'.*\(0.0, 95.0, 0.0\).*Dimensionen.'),
+            (["1,0,0,0,0", "1,0,0,10,1"], FeasibilityException, r'.*\(0.0, 0.0, 10.0\).* gedreht.'),
+            (["1,0,0,0,0", "1,0,0,10,0", "1,0,0,20,0"], FeasibilityException, r'.* überschreitet die geforderte .*'),
+            (["1,0,0,0,0"], FeasibilityException, r'.* beträgt 1. .*'),
+            (["1,0,0,0,0", "2,0,0,10,0"], DataException, r'Unbekannte Order: 2'),
+            (["1,0,0,0,0", "1,0,x,10,0"], DataException, r'Fehlerhafte Zeile: 1,0,x,10,0'),
+            (["1,0,0,0,0", "1,--1,0,0,0"], DataException, r'Fehlerhafte Zeile: 1,--1,0,0,0'),
+            (["1,0,0,0,0", "1,²,0,0,0"], DataException, r'Fehlerhafte Zeile: 1,²,0,0,0')]:
+        with open(solution_file, 'w') as file:
+            file.write("\n".join([HEADER_SOLUTIONS] + rows) + "\n")
+        with pytest.raises(exception, match=message):
+            import_solution_by_file(solution_file, tasks, 100, 100)
+
+
+def test42_validation_server(tmp_path, monkeypatch):  # The server answers requests with files and rows line by line
+    task = os.path.join(DATA_DIR, "EingabeBsp.csv")
+    server = ValidationServer(task)
+    requests = [{"id": 1, "solution": os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv")},
+                {"id": 2, "task": task, "rows": [[1, 0, 0, 0, 0]]},
+                {"id": 3, "rows": [[1, 0, 0]]},
+                {"id": 4},
+                [1]]
+    output = io.StringIO()
+    server.serve(io.StringIO("\n".join(json.dumps(i) for i in requests) + "\n\nx\n"), output)
+    responses = [json.loads(i) for i in output.getvalue().splitlines()]
+    assert [i["id"] for i in responses] == [1, 2, 3, 4, None, None]
+    assert responses[0]["feasible"] and responses[0]["minimal_length"] == 20.0 and "check_lifo" in responses[0]["times"]
+    assert not responses[1]["feasible"] and "Anzahl" in responses[1]["message"]
+    assert not responses[2]["feasible"] and responses[2]["message"] == "Unvollständige Zeile: [1, 0, 0]"
+    assert all("error" in i for i in responses[3:])
+    assert list(server.container_data) == [task]  # The task file is imported only once
+    path = str(tmp_path / "server.sock")
+    with open(path, "w") as file:
+        file.write("data")
+    with pytest.raises(FileExistsError, match="kein Socket"):  # Only a stale socket is replaced
+        server.serve_socket(path)
+    assert open(path).read() == "data"
+    os.remove(path)
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(path)
+    stale.close()
+    bound = []
+    monkeypatch.setattr(FeasibilityCheck.socketserver.ThreadingUnixStreamServer, "serve_forever",
+                        lambda self: bound.append(stat.S_ISSOCK(os.lstat(path).st_mode)))
+    server.serve_socket(path)
+    assert bound == [True] and not os.path.exists(path)
+
+
+@pytest.mark.parametrize("defect", [None] + DEFECTS)
+def test43_binary_solution(tmp_path, defect):  # A converted binary solution gives the same result as the csv file
+    width, height, task_rows, solution_rows = generate_instance(200, groups=3, stacking_depth=3, defect=defect)
+    tasks = import_tasks_default([",".join(map(str, i)) for i in task_rows])
+    csv_file, binary_file = str(tmp_path / "solution.csv"), str(tmp_path / "solution.bin")
+    with open(csv_file, 'w') as file:
+        file.write("\n".join([HEADER_SOLUTIONS] + [",".join(map(str, i)) for i in solution_rows]) + "\n")
+    assert convert_solution_file(csv_file, binary_file) == len(solution_rows)
+    assert is_binary_solution(binary_file) and not is_binary_solution(csv_file)
+    assert load_binary_solution(binary_file).tolist() == [tuple(i) for i in solution_rows]
+    assert [tuple(i) for i in zip(*next(read_solution_chunks(binary_file)))] == [tuple(i) for i in solution_rows]
+    assert check_solution_file(binary_file, [width, height, tasks]) == check_solution_file(csv_file,
+                                                                                           [width, height, tasks])
+
+
+def test44_binary_solution_errors(tmp_path, monkeypatch):  # Truncated binary files and unknown orders are data errors
+    tasks = import_tasks_default(["1,EuroPallet1,2,10,8,10,0,1,1"])
+    csv_file, binary_file = str(tmp_path / "solution.csv"), str(tmp_path / "solution.bin")
+    for rows, message in [(["1,0,0,0,0", "2,0,0,10,0"], "Unbekannte Order: 2"), ([], "Die Anzahl .*")]:
+        with open(csv_file, 'w') as file:
+            file.write("\n".join([HEADER_SOLUTIONS] + rows) + "\n")
+        convert_solution_file(csv_file, binary_file)
+        with pytest.raises((DataException, FeasibilityException), match=message):
+            import_solution_table_by_file(binary_file, tasks, 100, 100)
+    with open(binary_file, 'ab') as file:
+        file.write(b"\x00")
+    assert check_solution_file(binary_file, [100, 100, tasks])["message"] == \
+        "Die Größe der Binärdatei passt nicht zur Anzahl der Zeilen 0."
+    with pytest.raises(DataException):
+        import_solution_by_file(binary_file, tasks)
+    # Values beyond 32 bit are rejected instead of being wrapped; no incomplete binary file is left behind
+    with open(csv_file, 'w') as file:
+        file.write("\n".join([HEADER_SOLUTIONS, "1,0,0,0,0", "1,3000000000,0,0,0"]) + "\n")
+    with pytest.raises(DataException, match=r"Zeile 2 \(1,3000000000,0,0,0\) liegt außerhalb"):
+        convert_solution_file(csv_file, binary_file)
+    assert not os.path.exists(binary_file)
+    monkeypatch.setattr(binary_solution, "np", None)  # The struct fallback checks the range as well
+    with pytest.raises(ValueError, match=r"Zeile 1 \(1,0,-2147483649,0,0\)"):
+        binary_solution.write_binary_solution(binary_file, [([1], [0], [-2 ** 31 - 1], [0], [0])])
+
+
+def test45_watch_solution_files(tmp_path, capsys, monkeypatch):  # Only new or changed files are validated again
+    task = os.path.join(DATA_DIR, "EingabeBsp.csv")
+    with open(os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv")) as file:
+        content = file.read()
+    (tmp_path / "a.csv").write_text(content)
+    (tmp_path / "b.csv").write_text(content)
+    changes = [lambda: None,  # Nothing changed in the second round
+               lambda: (tmp_path / "c.csv").write_text(content),
+               lambda: (tmp_path / "a.csv").write_text(content + "\n")]
+    monkeypatch.setattr(FeasibilityCheck.time, "sleep", lambda seconds: changes.pop(0)())
+    watch_solution_files(str(tmp_path), task, metrics_format='none', interval=0, rounds=4)
+    validated = [os.path.basename(i) for i in capsys.readouterr().out.splitlines() if i.endswith(".csv")]
+    assert sorted(validated[:2]) == ["a.csv", "b.csv"] and validated[2:] == ["c.csv", "a.csv"]
+    # A file, which is removed between the sweep and its validation, does not stop the other files
+    FeasibilityCheck.validate_solution_files([str(tmp_path / "removed.csv"), str(tmp_path / "b.csv")],
+                                             import_container_data_by_file(task), cache=ResultCache(str(tmp_path)),
+                                             task_hash="task", metrics_format='none')
+    output = capsys.readouterr().out
+    assert "Die Lösung konnte nicht gelesen werden." in output and "Die Lösung ist zulässig." in output
+
+
+@pytest.mark.parametrize("defect", [None, "overlap", "stacking", "lifo"])
+def test46_blocked_pair_kernel(monkeypatch, defect):  # The blocked kernels find the same first violation
+    monkeypatch.setattr(FeasibilityCheck, "BLOCK_PAIRS", 5000)  # Several blocks
+    for seed in range(3):
+        width, height, task_rows, solution_rows = generate_instance(300, groups=3, stacking_depth=3, defect=defect,
+                                                                    seed=seed)
+        tasks = import_tasks_default([",".join(map(str, i)) for i in task_rows])
+        solution = import_solution_default([",".join(map(str, i)) for i in solution_rows], tasks)
+        messages = []
+        for kernel_pallets in [range(0), range(1, 1000)]:  # Indexed path, blocked kernels
+            monkeypatch.setattr(FeasibilityCheck, "BLOCKED_KERNEL_PALLETS", kernel_pallets)
+            try:
+                validate_solution(solution, tasks, width, height)
+                messages.append(None)
+            except FeasibilityException as e:
+                messages.append(str(e))
+        assert messages[0] == messages[1] and (messages[0] is None) == (defect is None)
+
+
+def generate_dense_instance(rng):
+    """
+    Generates a small random solution on a coarse grid, so that many pallets touch or overlap each other, some pallets
+    are turned and stacked and the maximal x coordinates differ by small integers (thresholds of par_stacking). Stacked
+    and overlapping pallets are inserted before or after the lower pallet in the list, and some z coordinates are
+    negative, as the overlap in the height is only tested upwards.
+    """
+    types = [[order, rng.choice([2, 3, 4, 5]), rng.choice([2, 3, 4, 5]), rng.choice([2, 3, 4]),
+              rng.choice([0, 1, 1, 1]), rng.choice([0, 1, 1, 1]), rng.randint(1, 3)] for order in range(1, 4)]
+    rows = []
+    for _ in range(rng.randint(1, 16)):
+        pallet_type = rng.choice(types)
+        turned = int(pallet_type[4] and rng.random() < 0.3)
+        if rows and rng.random() < 0.3:  # On top of a pallet or overlapping it from above
+            lower = rng.choice(rows)
+            height = types[lower[0] - 1][3]
+            rows.insert(rng.randint(0, len(rows)), [pallet_type[0], lower[1], lower[2],
+                                                    lower[3] + rng.choice([height, height, height - 1, 1]), turned])
+            continue
+        rows.append([pallet_type[0], rng.choice([0, 2, 3, 4, 5, 6, 8]), rng.choice([0, 2, 4, 5, 6, 8]),
+                     rng.choice([-5, -2, 0, 0, 0, 2, 3, 4, 5, 6]), turned])
+    tasks = ["%s,P%s,%s,%s,%s,%s,%s,%s,%s" % (i[0], i[0], sum(1 for j in rows if j[0] == i[0]), *i[1:]) for i in types]
+    return tasks, [",".join(map(str, i)) for i in rows], rng.choice([0, 0, 1, 2, 2.5, -1])
+
+
+def generate_stacked_instance(rng):
+    """
+    Generates a small random solution of stacks on a grid, which is mostly feasible. Some pallets are moved down into
+    the pallet below or below the ground and some stacks get a second pallet on the ground, which overlaps the stack;
+    the rows are shuffled, so that upper pallets often come before the lower ones in the list
+    """
+    types = [[order, rng.choice([3, 4, 5]), rng.choice([3, 4, 5]), rng.choice([2, 3, 5]), 1, rng.choice([0, 1, 1, 1]),
+              rng.randint(1, 3)] for order in range(1, 4)]
+    rows = []
+    for cell_x in range(0, 15, 5):
+        for cell_y in range(0, 10, 5):
+            if rng.random() < 0.3:
+                continue
+            pallet_type = rng.choice(types)
+            z = rng.choice([0, 0, 0, -2])
+            if rng.random() < 0.15:  # Overlapping pallet on the ground
+                rows.append([rng.choice(types)[0], cell_x, cell_y, 0, 0])
+            for _ in range(rng.randint(1, 3)):
+                if rng.random() < 0.1:
+                    pallet_type = rng.choice(types)
+                if z + pallet_type[3] > 12:
+                    break
+                rows.append([pallet_type[0], cell_x, cell_y, z - (rng.choice([1, 2]) if rng.random() < 0.1 else 0), 0])
+                z += pallet_type[3]
+    if rng.random() < 0.7:
+        rng.shuffle(rows)
+    tasks = ["%s,P%s,%s,%s,%s,%s,%s,%s,%s" % (i[0], i[0], sum(1 for j in rows if j[0] == i[0]), *i[1:]) for i in types]
+    return tasks, [",".join(map(str, i)) for i in rows], rng.choice([0, 0, 1, 2.5, 5, -1])
+
+
+def get_first_violation(solution, tasks, width, height, par_stacking, engine):
+    try:
+        validate_solution(solution, tasks, width, height, par_stacking, engine=engine)
+    except FeasibilityException as e:
+        return str(e)
+    return None
+
+
+def test47_engines_dense_instances():  # All engines find the same first violation as the reference
+    rng = random.Random(47)
+    messages = set()
+    for generate in [generate_dense_instance, generate_stacked_instance] * 400:
+        task_lines, solution_lines, par_stacking = generate(rng)
+        tasks = import_tasks_default(task_lines)
+        solution = import_solution_default(solution_lines, tasks)
+        expected = get_first_violation(solution, tasks, 12, 12, par_stacking, "reference")
+        for engine in ENGINES[1:]:
+            assert get_first_violation(solution, tasks, 12, 12, par_stacking, engine) == expected, \
+                (engine, task_lines, solution_lines, par_stacking)
+        messages.add(expected.split(" ")[-1] if expected else None)
+    # The instances cover feasible solutions and all kinds of violations of stacking and LIFO
+    assert {None, "sich.", "gestapelt.", "verdeckt."} <= messages
+    # Overlaps, which are only visible from the lower pallet later in the list or from a pallet below the ground
+    for task_lines, solution_lines in [
+            (["1,A,2,10,10,10,1,1,1", "2,B,1,10,10,5,1,1,1"], ["1,0,0,5,0", "1,0,0,0,0", "2,0,0,0,0"]),
+            (["1,A,2,10,10,10,1,1,1"], ["1,0,0,0,0", "1,0,0,-5,0"])]:
+        tasks = import_tasks_default(task_lines)
+        solution = import_solution_default(solution_lines, tasks)
+        expected = get_first_violation(solution, tasks, 30, 30, 0, "reference")
+        assert expected.endswith("überschneiden sich.")
+        for engine in ENGINES[1:]:
+            assert get_first_violation(solution, tasks, 30, 30, 0, engine) == expected, engine
+
+
+@pytest.mark.parametrize("defect", [None, "overlap", "stacking", "lifo"])
+def test48_engines_generated_instances(defect):  # All engines agree on larger generated instances
+    for seed in range(2):
+        width, height, task_rows, solution_rows = generate_instance(120, groups=3, stacking_depth=3, defect=defect,
+                                                                    seed=seed)
+        tasks = import_tasks_default([",".join(map(str, i)) for i in task_rows])
+        solution = import_solution_default([",".join(map(str, i)) for i in solution_rows], tasks)
+        for par_stacking in [0, 1200]:
+            messages = [get_first_violation(solution, tasks, width, height, par_stacking, i) for i in ENGINES]
+            assert len(set(messages)) == 1
+
+
+def test49_crosscheck_mismatch(monkeypatch):  # A disagreement of the engines is never reported as feasible
+    container_data = import_container_data_by_file(os.path.join(DATA_DIR, "EingabeBsp.csv"))
+    solution = os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv")
+    assert check_solution_file(solution, container_data, engine="crosscheck")["feasible"]
+    monkeypatch.setattr(FeasibilityCheck, "check_lifo_blocked", lambda *args: None)
+    monkeypatch.setattr(FeasibilityCheck, "BLOCKED_KERNEL_PALLETS", range(1000))
+    tasks = import_tasks_default(["1,EuroPallet1,1,10,10,10,1,1,1", "2,EuroPallet2,1,10,10,10,1,1,2"])
+    solution_pallets = import_solution_default(["1,0,0,0,0", "2,10,0,0,0"], tasks)
+    with pytest.raises(EngineMismatchException, match=r".* Referenz: Palette im Punkt .* Optimiert: zulässig"):
+        validate_solution(solution_pallets, tasks, 100, 100, engine="crosscheck")
+
+
+def test50_prefetch_solution_files():  # Prefetched files give the same results; rejected files are read only partly
+    container_data = import_container_data_by_file(os.path.join(DATA_DIR, "EingabeBsp.csv"))
+    solutions = sorted(get_file_stamps(os.path.join(DATA_DIR, "solutionDir")))
+    prefetched = list(prefetch_solution_files(solutions, depth=2))
+    assert [i[0] for i in prefetched] == solutions
+    for solution, content in prefetched:
+        assert check_solution_file(solution, container_data, content=content) == \
+            check_solution_file(solution, container_data)
+        with open(solution, 'rb') as file:
+            complete_content = file.read()
+        if solution.endswith(".csv"):
+            assert content == complete_content
+        else:  # Binary file and wrong header
+            assert content == complete_content[:len(content)] and len(content) <= 8192
+    assert len(read_solution_content(os.path.join(DATA_DIR, "solutionDir", "falscheDatei.txt"), head_size=16)) == 16
+    # Files above the size limit are streamed from disk; rejected files are still recognized by their head
+    assert read_solution_content(os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv"), max_size=1) is None
+    assert read_solution_content(os.path.join(DATA_DIR, "solutionDir", "falscheDatei.txt"), max_size=1) is not None
+
+
+def test51_include_exclude():  # Files of the solution directory are filtered by glob patterns
+    directory = os.path.join(DATA_DIR, "solutionDir")
+    assert sorted(os.path.relpath(i, directory) for i in get_file_stamps(directory, include=["*.csv"])) == \
+        ["LoesungBsp1.csv", "LoesungBsp2.csv", os.path.join("sub", "LoesungBsp3.csv"),
+         os.path.join("sub", "LoesungBsp4.csv")]
+    assert sorted(os.path.relpath(i, directory) for i in get_file_stamps(directory, ["*.csv"], ["sub/*", "*2*"])) == \
+        ["LoesungBsp1.csv"]
+    assert len(get_file_stamps(directory, exclude=["*.xlsx"])) == 5
+
+
+def test52_validate_batch(capsys):  # The batch returns structured results and prints nothing
+    container_data = import_container_data_by_file(os.path.join(DATA_DIR, "EingabeBsp.csv"))
+    solutions = [os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv"),
+                 os.path.join(DATA_DIR, "solutionDir", "falscheDatei.txt"),
+                 [[1, 0, 0, 0, 0], [1, 0, 20, 0, 0], [1, 10, 0, 0, 0], [1, 10, 20, 0, 0]],
+                 FeasibilityCheck.np.array([[1, 0, 0, 0, 0], [1, 5, 0, 0, 0], [1, 10, 0, 0, 0], [1, 10, 20, 0, 0]]),
+                 [[1, 0, 0, 0]],
+                 [[7, 0, 0, 0, 0]],
+                 os.path.join(DATA_DIR, "solutionDir", "missing.csv"),
+                 [[1, 0, 0, 0, 0], [1, 0, 0]]]
+    records = list(validate_batch(container_data, solutions))
+    assert capsys.readouterr().out == ""
+    assert [i["feasible"] for i in records] == [True, False, True, False, False, False, False, False]
+    assert records[0]["minimal_length"] == 20.0 and "check_lifo" in records[0]["times"]
+    assert records[1]["error"] == "DataException" and records[1]["message"] == "Fehlerhafter Header: blablabla"
+    assert records[3]["error"] == "FeasibilityException" and records[3]["violation"] == "overlap"
+    assert records[3]["pallets"] == [(1, 0, 0, 0), (1, 5, 0, 0)]
+    assert records[3]["message"] == "Die Paletten in Startpunkt [(0.0, 0.0, 0.0)] Order: 1 und [(5.0, 0.0, 0.0)]  " \
+                                    "Order: 1 überschneiden sich."
+    assert [i["error"] for i in records[4:]] == ["DataException", "DataException", "FileNotFoundError",
+                                                 "DataException"]
+    assert records[7]["message"] == "Unvollständige Zeile: [1, 0, 0]"
+
+
+def test53_parallel_stacking(monkeypatch):  # The slabs in worker processes give the same first violation
+    monkeypatch.setattr(FeasibilityCheck, "PARALLEL_STACKING_PALLETS", 0)
+    rng = random.Random(53)
+    instances = [generate_dense_instance(rng)[:2] for _ in range(40)]
+    for defect in [None, "overlap", "stacking"]:
+        width, height, task_rows, solution_rows = generate_instance(200, groups=3, stacking_depth=3, defect=defect)
+        instances.append(([",".join(map(str, i)) for i in task_rows], [",".join(map(str, i)) for i in solution_rows]))
+    for task_lines, solution_lines in instances:
+        tasks = import_tasks_default(task_lines)
+        solution = import_solution_default(solution_lines, tasks)
+        messages = []
+        for jobs in [1, 2]:
+            try:
+                FeasibilityCheck.check_stacking(solution, jobs=jobs)
+                messages.append(None)
+            except FeasibilityException as e:
+                messages.append((str(e), e.violation, e.pallets))
+        assert messages[0] == messages[1], (task_lines, solution_lines)
+    slabs = list(FeasibilityCheck.get_stacking_slabs(solution, 8))
+    assert sorted(j for members, owned in slabs for j in members[owned]) == list(range(len(solution)))
+
+
+def test54_run_manifest(tmp_path):  # The report is streamed, continued after an interruption and equal in both formats
+    width, height, task_rows, solution_rows = generate_instance(50, defect="lifo")
+    write_task_file(str(tmp_path / "task.csv"), width, height, task_rows)
+    write_solution_file(str(tmp_path / "solution.csv"), solution_rows)
+    example_task = os.path.join(DATA_DIR, "EingabeBsp.csv")
+    entries = [(example_task, os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv"), ""),
+               ("task.csv", "solution.csv", ""),
+               (example_task, os.path.join(DATA_DIR, "solutionDir", "sub", "LoesungBsp4.csv"), "2"),
+               ("task.csv", "missing.csv", ""),
+               ("task.csv", "", ""),
+               ("task.csv", "solution.csv", "x")]
+    (tmp_path / "manifest.csv").write_text("Task,Solution,Diff\n" + "".join("%s,%s,%s\n" % i for i in entries))
+    manifest, report = str(tmp_path / "manifest.csv"), str(tmp_path / "report.jsonl")
+    assert run_manifest(manifest, report, task_cache_size=1) == (6, 0)
+    records = [json.loads(i) for i in open(report, encoding='utf-8')]
+    assert [i["entry"] for i in records] == list(range(1, 7))
+    assert [i["feasible"] for i in records] == [True, False, False, False, False, False]
+    assert records[0]["minimal_length"] == 20.0 and "check_lifo" in records[0]["times"]
+    assert records[1]["violation"] == "lifo" and records[2]["violation"] == "overlap" and records[2]["diff"] == 2.0
+    assert [i["error"] for i in records[3:]] == ["FileNotFoundError", "DataException", "DataException"]
+    # An interrupted run is continued after the last complete record
+    lines = open(report, encoding='utf-8').readlines()
+    with open(report, 'w', encoding='utf-8') as report_file:
+        report_file.write("".join(lines[:2]) + lines[2][:10])
+    assert run_manifest(manifest, report, resume=True) == (4, 2)
+    resumed = [json.loads(i) for i in open(report, encoding='utf-8')]
+    assert [dict(i, times=None, counters=None) for i in resumed] == \
+        [dict(i, times=None, counters=None) for i in records]
+    assert run_manifest(manifest, str(tmp_path / "report.csv")) == (6, 0)
+    with open(str(tmp_path / "report.csv"), newline='', encoding='utf-8') as report_file:
+        rows = list(csv.DictReader(report_file))
+    assert [i["message"] for i in rows] == [i["message"] or "" for i in records]
+    assert rows[0]["feasible"] == "True" and float(rows[0]["time"]) > 0 and rows[0]["time_check_lifo"]
+
+
+def test55_collect_violations():  # All violations are collected; the first one is the violation of validate_solution
+    rng = random.Random(55)
+    for _ in range(200):
+        task_lines, solution_lines, par_stacking = generate_dense_instance(rng)
+        tasks = import_tasks_default(task_lines)
+        solution = import_solution_default(solution_lines, tasks)
+        violations = collect_violations(solution, tasks, 12, 12, par_stacking, limit=1000)
+        expected = get_first_violation(solution, tasks, 12, 12, par_stacking, "indexed")
+        assert (violations[0]["message"] if violations else None) == expected
+        assert collect_violations(solution, tasks, 12, 12, par_stacking, limit=2) == violations[:2]
+    tasks = import_tasks_default(["1,EuroPallet1,3,10,8,10,0,0,1", "2,EuroPallet2,1,10,8,10,1,1,2"])
+    solution = import_solution_default(["1,0,0,0,1", "1,5,0,0,0", "1,0,0,10,0", "1,0,50,0,0", "2,20,0,0,0"], tasks)
+    violations = collect_violations(solution, tasks, 30, 30, limit=10)
+    assert [i["violation"] for i in violations] == ["count", "rotation", "container", "overlap", "stacking"] + \
+        ["lifo"] * 3  # Pallet of group 2 in front of all pallets of group 1 and a pallet on top of another one
+    assert collect_violations(solution, tasks, 30, 30, limit=4) == violations[:4]
+    assert violations[3]["pallets"] == [(1, 0, 0, 0), (1, 5, 0, 0)]  # Every overlapping pair is reported once
+    assert violations[4]["message"] == "Die Palette in Startpunkt [(0.0, 0.0, 10.0)] von Order 1 wurde " \
+                                       "unzulässigerweise gestapelt."
+    tasks = import_tasks_default(["1,A,2,10,10,10,1,1,1", "2,B,1,10,10,5,1,1,1"])
+    solution = import_solution_default(["1,0,0,5,0", "1,0,0,0,0", "2,0,0,0,0"], tasks)
+    violations = collect_violations(solution, tasks, 30, 30)  # The overlaps are only visible from the lower pallets
+    assert [i["pallets"] for i in violations] == [[(1, 0, 0, 0), (1, 0, 0, 5)], [(1, 0, 0, 0), (2, 0, 0, 0)]]
+    container_data = import_container_data_by_file(os.path.join(DATA_DIR, "EingabeBsp.csv"))
+    result = check_solution_file(os.path.join(DATA_DIR, "solutionDir", "LoesungBsp2.csv"), container_data, collect=10)
+    assert not result["feasible"] and [i["violation"] for i in result["violations"]] == ["rotation", "overlap"]
+    assert result["message"] == check_solution_file(os.path.join(DATA_DIR, "solutionDir", "LoesungBsp2.csv"),
+                                                    container_data)["message"]
+
+
+@pytest.mark.parametrize("engine", ["reference", "indexed", "vectorized"])
+def test56_time_budget(monkeypatch, engine):  # The hot loops stop cooperatively; a stopped check is neither verdict
+    width, height, task_rows, solution_rows = generate_instance(60, groups=3, stacking_depth=3)
+    tasks = import_tasks_default([",".join(map(str, i)) for i in task_rows])
+    solution = import_solution_default([",".join(map(str, i)) for i in solution_rows], tasks)
+    monkeypatch.setattr(FeasibilityCheck, "BLOCK_PAIRS", 200)  # Several blocks
+    clock = iter(range(10 ** 6))
+    monkeypatch.setattr(FeasibilityCheck.time, "perf_counter", lambda: next(clock))  # Every call takes a second
+    with pytest.raises(TimeBudgetException, match=r"nach 30 Sekunden abgebrochen \(check_(stacking|lifo)\)"):
+        validate_solution(solution, tasks, width, height, metrics=MetricsRecorder(30), engine=engine)
+    validate_solution(solution, tasks, width, height, metrics=MetricsRecorder(10 ** 5), engine=engine)
+    owned = list(range(len(solution)))  # A worker of the parallel check gets the remaining time budget
+    with pytest.raises(TimeBudgetException, match=r"\(check_stacking\)"):
+        FeasibilityCheck.find_stacking_violation(solution, owned, engine, time_budget=0)
+    assert FeasibilityCheck.find_stacking_violation(solution, owned, engine, time_budget=10 ** 5) is None
+
+
+def test56_time_budget_out_of_core(tmp_path, monkeypatch):  # The scan, the external sort and the merge stop, too
+    width, height, task_rows, solution_rows = generate_instance(60, groups=3, stacking_depth=3)
+    task_file, solution_file = str(tmp_path / "task.csv"), str(tmp_path / "solution.csv")
+    write_task_file(task_file, width, height, task_rows)
+    write_solution_file(solution_file, solution_rows)
+    container_data = import_container_data_by_file(task_file)
+    clock = iter(range(10 ** 6))
+    monkeypatch.setattr(FeasibilityCheck.time, "perf_counter", lambda: next(clock))
+    stages = set()
+    for time_budget in range(0, 200, 10):
+        result = check_solution_out_of_core(solution_file, container_data, metrics=MetricsRecorder(time_budget),
+                                            window=4, run_size=4)
+        if result["feasible"] is None:
+            stages.add(result["message"].rsplit("(", 1)[1])
+    assert stages == {"import_solution).", "check_stacking).", "check_lifo)."}
+    assert check_solution_out_of_core(solution_file, container_data, metrics=MetricsRecorder(10 ** 5))["feasible"]
+
+
+def test57_time_budget_results(tmp_path, capsys, monkeypatch):
+    container_data = import_container_data_by_file(os.path.join(DATA_DIR, "EingabeBsp.csv"))
+    solution = os.path.join(DATA_DIR, "solutionDir", "LoesungBsp1.csv")
+    # The estimated time exceeds the remaining time budget, so that the expensive checks are not started
+    monkeypatch.setattr(FeasibilityCheck, "INDEXED_PALLET_SECONDS", 10)
+    record = next(validate_batch(container_data, [solution], time_budget=1))
+    assert record["feasible"] is None and record["error"] == "TimeBudgetException"
+    assert "voraussichtlich" in record["message"] and "check_stacking" not in record["times"]
+    cache = ResultCache(str(tmp_path))
+    validate_solution_file(solution, container_data, cache=cache, task_hash="task", metrics_format='none',
+                           time_budget=1)
+    assert "Die Zulässigkeit der Lösung ist unbekannt." in capsys.readouterr().out
+    monkeypatch.setattr(FeasibilityCheck, "INDEXED_PALLET_SECONDS", 1e-4)
+    validate_solution_file(solution, container_data, cache=cache, task_hash="task", metrics_format='none',
+                           time_budget=1)  # A stopped check is not cached
+    assert "Die Lösung ist zulässig." in capsys.readouterr().out
+    assert ValidationServer().handle({"task": os.path.join(DATA_DIR, "EingabeBsp.csv"), "solution": solution,
+                                      "time_budget": 0})["timed_out"]
+
+
+def test58_out_of_core(tmp_path):  # Small windows and sorted runs give the same results as the validation in memory
+    rng = random.Random(58)
+    solution = str(tmp_path / "solution.csv")
+    for _ in range(200):
+        task_lines, solution_lines, par_stacking = generate_dense_instance(rng)
+        with open(solution, "w") as file:
+            file.write("\n".join([HEADER_SOLUTIONS] + solution_lines) + "\n")
+        container_data = (12, 12, import_tasks_default(task_lines))
+        assert check_solution_out_of_core(solution, container_data, par_stacking, window=2, run_size=3) == \
+            check_solution_file(solution, container_data, par_stacking)
+    for quantity in [0, 1]:  # Empty solutions
+        container_data = (100, 100, import_tasks_default(["1,A,%s,10,10,10,1,1,1" % quantity]))
+        with open(solution, "w") as file:
+            file.write(HEADER_SOLUTIONS + "\n")
+        result = check_solution_out_of_core(solution, container_data)
+        assert result == check_solution_file(solution, container_data)
+        assert result["feasible"] == (quantity == 0) and result["minimal_length"] == (0.0 if quantity == 0 else None)
+    container_data = (100, 100, import_tasks_default(["1,A,2,10,10,10,1,1,1"]))
+    for x_pos, feasible in [(3000000000, True), (10 ** 20, False)]:  # Beyond 32 bit and beyond 64 bit
+        with open(solution, "w") as file:
+            file.write("\n".join([HEADER_SOLUTIONS, "1,0,0,0,0", "1,%s,0,0,0" % x_pos]) + "\n")
+        result = check_solution_out_of_core(solution, container_data)
+        assert result["feasible"] == feasible
+        assert not feasible or result == check_solution_file(solution, container_data)
+    task_file, binary_file = str(tmp_path / "task.csv"), str(tmp_path / "solution.bin")
+    for defect in [None] + DEFECTS:
+        width, height, task_rows, solution_rows = generate_instance(300, defect=defect, seed=58)
+        write_task_file(task_file, width, height, task_rows)
+        write_solution_file(solution, solution_rows)
+        convert_solution_file(solution, binary_file)
+        container_data = import_container_data_by_file(task_file)
+        for par_stacking in [0, -1]:
+            metrics = MetricsRecorder()
+            result = check_solution_out_of_core(binary_file, container_data, par_stacking, metrics, 16, 50)
+            assert result == check_solution_file(solution, container_data, par_stacking)
+            assert result == check_solution_file(binary_file, container_data, par_stacking, out_of_core=True)
+            assert defect in ["count", "rotation", "container"] or metrics.counters["external_sort_runs"] >= 6
+
+
+def test59_csv_solution_table(tmp_path, monkeypatch):  # A csv solution is imported into the columnar representation
+    pytest.importorskip("numpy")
+    task_file, solution_file = str(tmp_path / "task.csv"), str(tmp_path / "solution.csv")
+    for defect in [None] + DEFECTS:
+        width, height, task_rows, solution_rows = generate_instance(100, defect=defect, seed=59)
+        write_task_file(task_file, width, height, task_rows)
+        write_solution_file(solution_file, solution_rows)
+        container_data = import_container_data_by_file(task_file)
+        solution_pallets = import_solution_by_file(solution_file, container_data[2])
+        try:
+            validate_solution(solution_pallets, container_data[2], width, height)
+            minimal_length = calculate_minimal_container_length(solution_pallets)
+        except (FeasibilityException, DataException):
+            minimal_length = None
+        with monkeypatch.context() as patch:
+            patch.setattr(FeasibilityCheck, "import_solution_chunks", None)  # No solution pallets during the import
+            result = check_solution_file(solution_file, container_data)
+            assert result["feasible"] == (minimal_length is not None) and result["minimal_length"] == minimal_length
+            assert bool(check_solution_file(solution_file, container_data, collect=5)["violations"]) == bool(defect)
+    with open(solution_file, "w") as file:
+        file.write("\n".join([HEADER_SOLUTIONS, "1,0,0,0,0", "9,0,0,0,0"]) + "\n")
+    container_data = (100, 100, import_tasks_default(["1,A,1,10,10,10,1,1,1"]))
+    for collect in [0, 5]:  # Also without the pre-validation
+        assert check_solution_file(solution_file, container_data, collect=collect)["message"] == "Unbekannte Order: 9"